@@ -0,0 +1 @@
+"""Offline benchmark harnesses and local provider stand-ins."""
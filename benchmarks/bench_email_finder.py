@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+EmailFinder Benchmark
+=====================
+Runs EmailFinder.find_email against local provider stand-ins (see
+fake_providers.py) and reports throughput, per-contact latency, requests per
+contact and peak memory for several list sizes.
+
+Usage:
+    python3 -m benchmarks.bench_email_finder
+    python3 -m benchmarks.bench_email_finder --sizes 100,1000 --verify
+    python3 -m benchmarks.bench_email_finder --latency-scale 0 --output bench.json
+    python3 -m benchmarks.bench_email_finder --baseline bench_baseline.json
+
+Results are written as JSON so a concurrency or caching change can be compared
+against a saved baseline run.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.fake_providers import TEAM_ROSTER, FakeProviderConfig, FakeProviders
+from email_finder import Contact, EmailFinder
+
+# Mix of companies; the tech names also exercise the GitHub source
+COMPANIES = [
+    'Google', 'Acme Robotics', 'OpenAI', 'Lazard', 'Tiny Startup Inc',
+    'Microsoft', 'Bustle', 'Fidelity', 'Northwind Traders', 'Apple',
+]
+FIRST_NAMES = [person.split()[0] for person in TEAM_ROSTER]
+LAST_NAMES = [person.split()[-1] for person in TEAM_ROSTER]
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+
+def make_contacts(count: int) -> List[Contact]:
+    """Deterministic synthetic contact list."""
+    contacts = []
+    for i in range(count):
+        first = FIRST_NAMES[i % len(FIRST_NAMES)]
+        last = LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        contacts.append(Contact(
+            name=f"{first} {last}{i}",
+            company=COMPANIES[i % len(COMPANIES)],
+            title='Founder',
+        ))
+    return contacts
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def build_finder(providers: FakeProviders) -> EmailFinder:
+    """EmailFinder wired to the stand-ins, with all keys set and sleeps disabled."""
+    finder = EmailFinder(**providers.finder_kwargs())
+    finder.hunter_key = finder.apollo_key = 'bench'
+    finder.rocketreach_key = finder.clearbit_key = 'bench'
+    finder.rate_limits = {source: 0 for source in finder.rate_limits}
+    return finder
+
+
+def run_size(providers: FakeProviders, size: int, verify: bool) -> Dict:
+    """Benchmark one list size and return its metrics."""
+    contacts = make_contacts(size)
+    finder = build_finder(providers)
+    before = providers.state.snapshot()
+    latencies = []
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for contact in contacts:
+            t0 = time.perf_counter()
+            finder.find_email(contact, verify=verify)
+            latencies.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    after = providers.state.snapshot()
+    by_provider = {k: after.get(k, 0) - before.get(k, 0) for k in after}
+    total_requests = sum(v for k, v in by_provider.items() if k not in ('smtp', 'dns'))
+    found = sum(1 for c in contacts if any(e['confidence'] in ('high', 'medium') for e in c.emails_found))
+
+    return {
+        'contacts': size,
+        'wall_seconds': round(wall, 3),
+        'contacts_per_second': round(size / wall, 2) if wall else None,
+        'latency_p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'latency_p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'requests_per_contact': round(total_requests / size, 2),
+        'requests_by_provider': by_provider,
+        'peak_memory_mb': round(peak / (1024 * 1024), 2),
+        'found_rate': round(found / size, 3),
+        'sources': finder.metrics.summary(),
+    }
+
+
+def compare(current: Dict, baseline: Dict) -> List[str]:
+    """Human-readable deltas for runs present in both result files."""
+    lines = []
+    base_runs = {r['contacts']: r for r in baseline.get('runs', [])}
+    for run in current['runs']:
+        base = base_runs.get(run['contacts'])
+        if not base:
+            continue
+        for key in ('contacts_per_second', 'latency_p50_ms', 'latency_p95_ms',
+                    'requests_per_contact', 'peak_memory_mb'):
+            old, new = base.get(key), run.get(key)
+            if old:
+                lines.append(f"  {run['contacts']:>6} {key:<22} {old:>10} -> {new:<10} ({(new - old) / old * 100:+.1f}%)")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Benchmark EmailFinder against local provider stand-ins')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Comma-separated contact counts (default: 100,1000,10000)')
+    parser.add_argument('--verify', action='store_true', help='Include SMTP verification')
+    parser.add_argument('--latency-scale', type=float, default=1.0,
+                        help='Multiply every provider median latency (0 = no latency)')
+    parser.add_argument('--rate-limit-rate', type=float, help='Override 429 injection rate for all providers')
+    parser.add_argument('--hit-rate', type=float, help='Override hit rate for all providers')
+    parser.add_argument('--page-size-kb', type=int, default=64, help='Size of fake search result pages')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--output', '-o', default='bench_email_finder.json', help='JSON results file')
+    parser.add_argument('--baseline', help='Previous results JSON to compare against')
+    args = parser.parse_args(argv)
+
+    config = FakeProviderConfig(page_size_kb=args.page_size_kb, seed=args.seed).scaled(args.latency_scale)
+    for profile in config.profiles.values():
+        if args.rate_limit_rate is not None:
+            profile.rate_limit_rate = args.rate_limit_rate
+        if args.hit_rate is not None:
+            profile.hit_rate = args.hit_rate
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    results = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'config': {
+            'verify': args.verify,
+            'latency_scale': args.latency_scale,
+            'page_size_kb': args.page_size_kb,
+            'seed': args.seed,
+            'profiles': {k: vars(v) for k, v in config.profiles.items()},
+        },
+        'runs': [],
+    }
+
+    with FakeProviders(config) as providers:
+        for size in sizes:
+            print(f"Running {size} contacts...", flush=True)
+            run = run_size(providers, size, args.verify)
+            results['runs'].append(run)
+            print(f"  {run['contacts_per_second']} contacts/s, "
+                  f"p50 {run['latency_p50_ms']}ms, p95 {run['latency_p95_ms']}ms, "
+                  f"{run['requests_per_contact']} req/contact, peak {run['peak_memory_mb']}MB")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\nCompared to {args.baseline}:")
+        for line in compare(results, baseline):
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
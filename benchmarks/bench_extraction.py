@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Email Extraction Micro-benchmark
+================================
+Compares the streaming extraction engine (email_extractor.py) with the old
+search_google approach (decode the whole page, compile the regex, findall,
+then filter with any() over a list) on large saved HTML pages.
+
+Usage:
+    python3 -m benchmarks.bench_extraction                      # synthetic pages
+    python3 -m benchmarks.bench_extraction --pages saved_pages/ # your own *.html
+    python3 -m benchmarks.bench_extraction --page-mb 8 --repeat 5 --output bench_extraction.json
+"""
+
+import argparse
+import json
+import random
+import re
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from email_extractor import NameMatcher, iter_emails
+
+LEGACY_JUNK = ['example.com', 'sentry.io', 'schema.org', 'w3.org']
+
+
+def legacy_extract(path: Path, name: str) -> set:
+    """The pre-engine approach: whole-body decode, findall, nested any()."""
+    text = path.read_bytes().decode('utf-8', errors='replace')
+    email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    found = set()
+    for email in email_pattern.findall(text):
+        if not any(x in email.lower() for x in LEGACY_JUNK):
+            found.add(email.lower())
+    name_parts = name.lower().split()
+    return {e for e in found if any(part in e for part in name_parts)}
+
+
+def engine_extract(path: Path, name: str, chunk_size: int = 16384) -> set:
+    """The streaming engine, reading the page in chunks as a response would arrive."""
+    matcher = NameMatcher(name)
+
+    def chunks():
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    return {e for e in iter_emails(chunks()) if matcher.matches(e)}
+
+
+def make_page(path: Path, size_mb: float, rng: random.Random):
+    """Write a large synthetic result page with a realistic email density."""
+    blocks = [
+        '<div class="g"><h3>Result {i}</h3><a href="https://site{i}.com/about">link</a>'
+        '<span>Contact press{i}@site{i}.com or webmaster@w3.org. Lorem ipsum dolor sit amet, '
+        'consectetur adipiscing elit.</span><img src="/img/logo@2x.png"></div>\n',
+        '<script>var cfg={{"dsn":"https://abc{i}@o{i}.ingest.sentry.io/1","x":"{pad}"}};</script>\n',
+        '<p>Team: ada.lovelace{i}@acme.com, grace{i}@navy.mil, info@example.com</p>\n',
+    ]
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    with open(path, 'w') as f:
+        f.write('<html><body>\n')
+        i = 0
+        while written < target:
+            block = rng.choice(blocks).format(i=i, pad='x' * rng.randint(10, 400))
+            f.write(block)
+            written += len(block)
+            i += 1
+        f.write('</body></html>\n')
+
+
+def measure(fn, pages: List[Path], name: str, repeat: int) -> Dict:
+    """Best-of-N wall time plus peak traced memory for one pass over all pages."""
+    total_bytes = sum(p.stat().st_size for p in pages)
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for page in pages:
+            fn(page, name)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    found = sum(len(fn(page, name)) for page in pages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'seconds': round(best, 4),
+        'mb_per_second': round(total_bytes / (1024 * 1024) / best, 1) if best else None,
+        'peak_memory_mb': round(peak / (1024 * 1024), 2),
+        'matches': found,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Benchmark streaming email extraction')
+    parser.add_argument('--pages', help='Directory of saved *.html pages (default: generate synthetic pages)')
+    parser.add_argument('--count', type=int, default=4, help='Synthetic pages to generate')
+    parser.add_argument('--page-mb', type=float, default=4.0, help='Size of each synthetic page in MB')
+    parser.add_argument('--name', default='Ada Lovelace', help='Person name used for matching')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes (best is reported)')
+    parser.add_argument('--output', '-o', help='Write results JSON here')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.pages:
+            pages = sorted(Path(args.pages).glob('*.html'))
+        else:
+            rng = random.Random(42)
+            pages = []
+            for i in range(args.count):
+                page = Path(tmp) / f"page{i}.html"
+                make_page(page, args.page_mb, rng)
+                pages.append(page)
+        if not pages:
+            print("No pages to benchmark.")
+            return 1
+
+        total_mb = sum(p.stat().st_size for p in pages) / (1024 * 1024)
+        print(f"Benchmarking {len(pages)} pages ({total_mb:.1f} MB total)...")
+        results = {
+            'pages': len(pages),
+            'total_mb': round(total_mb, 2),
+            'legacy': measure(legacy_extract, pages, args.name, args.repeat),
+            'engine': measure(engine_extract, pages, args.name, args.repeat),
+        }
+
+    for label in ('legacy', 'engine'):
+        row = results[label]
+        print(f"  {label:<7} {row['seconds']:>8.3f}s  {row['mb_per_second']:>7} MB/s  "
+              f"peak {row['peak_memory_mb']:>7} MB  matches {row['matches']}")
+    speedup = results['legacy']['seconds'] / results['engine']['seconds']
+    print(f"  speedup: {speedup:.2f}x")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
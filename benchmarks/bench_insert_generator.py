@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Insert Generator Benchmark
+==========================
+Runs insert_generator.main() end to end against a local Messages API stand-in
+(see fake_messages.py) and an in-memory Google Sheet, and reports throughput,
+API retries, repairs and the time spent on Sheets uploads and CSV checkpoint
+writes for several list sizes. Nothing is billed and no real sheet is touched.
+
+Usage:
+    python3 -m benchmarks.bench_insert_generator
+    python3 -m benchmarks.bench_insert_generator --sizes 100,1000 --workers 16
+    python3 -m benchmarks.bench_insert_generator --rate-limit-rate 0.02 --malformed-rate 0.05
+    python3 -m benchmarks.bench_insert_generator --latency-scale 0 --args "--stream"
+    python3 -m benchmarks.bench_insert_generator --baseline bench_baseline.json
+
+Results are written as JSON so a concurrency or batching change can be compared
+against a saved baseline run.
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import shlex
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import insert_generator
+from benchmarks.fake_messages import FakeMessagesServer, MessagesProfile
+from checkpoint import CheckpointWriter
+from insert_telemetry import build_report, load_events
+from sheet_writer import BackgroundSheetWriter
+
+COMPANIES = [
+    'Google', 'Acme Robotics', 'OpenAI', 'Lazard', 'Tiny Startup Inc',
+    'Microsoft', 'Bustle', 'Fidelity', 'Northwind Traders', 'Apple',
+]
+DEFAULT_SIZES = [100, 1000, 10000]
+SHEET_HEADERS = [
+    'Campaign', 'Name', 'Email', 'Email Confidence', 'Company', 'Title',
+    'Personalized Insert', 'Word Count', 'Insert Confidence', 'Sources',
+    'Email Status', 'Draft Created', 'Sent Date',
+]
+
+
+class FakeWorksheet:
+    """In-memory worksheet; append_rows sleeps latency seconds like a Sheets call."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.rows = []
+        self.calls = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def row_values(self, row: int) -> List[str]:
+        return list(SHEET_HEADERS)
+
+    def update_cell(self, row: int, col: int, value):
+        pass
+
+    def append_rows(self, rows, **kwargs):
+        started = time.perf_counter()
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.rows.extend(rows)
+            self.calls += 1
+            self.seconds += time.perf_counter() - started
+
+
+def timed(func, totals: Dict[str, float], key: str):
+    """Wrap func so the seconds spent in it accumulate in totals[key]."""
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            totals[key] += time.perf_counter() - started
+    return wrapper
+
+
+def write_contacts(path: str, count: int):
+    """Deterministic synthetic contact CSV; companies repeat so research is shared."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('Name,Company,Email,Title\n')
+        for i in range(count):
+            company = COMPANIES[i % len(COMPANIES)]
+            domain = company.lower().replace(' ', '')
+            f.write(f"Person {i},{company},person{i}@{domain}.com,Founder\n")
+
+
+def run_size(server: FakeMessagesServer, size: int, main_args: List[str], sheet_latency: float) -> Dict:
+    """Benchmark one list size and return its metrics."""
+    before = server.state.snapshot()
+    worksheet = FakeWorksheet(sheet_latency)
+    totals = defaultdict(float)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        contacts_csv = os.path.join(workdir, 'contacts.csv')
+        output_csv = os.path.join(workdir, 'inserts.csv')
+        telemetry = os.path.join(workdir, 'telemetry.jsonl')
+        write_contacts(contacts_csv, size)
+        argv = [
+            'insert_generator.py', '-i', contacts_csv, '-o', output_csv,
+            '--research-cache', os.path.join(workdir, 'research_cache.db'),
+            '--response-cache', os.path.join(workdir, 'response_cache.db'),
+            '--telemetry', telemetry,
+        ] + main_args
+
+        env = {'ANTHROPIC_API_KEY': 'bench', 'ANTHROPIC_BASE_URL': server.base_url}
+        with patch.dict(os.environ, env), \
+                patch.object(sys, 'argv', argv), \
+                patch.object(insert_generator, 'load_config', return_value={}), \
+                patch.object(insert_generator, 'get_google_sheet', return_value=worksheet), \
+                patch.object(insert_generator, 'get_current_branch', return_value='bench'), \
+                patch.object(CheckpointWriter, 'write', timed(CheckpointWriter.write, totals, 'csv')), \
+                patch.object(CheckpointWriter, 'close', timed(CheckpointWriter.close, totals, 'csv')), \
+                patch.object(BackgroundSheetWriter, 'put', timed(BackgroundSheetWriter.put, totals, 'queue')), \
+                patch.object(BackgroundSheetWriter, 'close', timed(BackgroundSheetWriter.close, totals, 'drain')), \
+                open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            started = time.perf_counter()
+            exit_code = insert_generator.main()
+            wall = time.perf_counter() - started
+
+        report = build_report(load_events(telemetry)) if os.path.exists(telemetry) else {}
+        csv_bytes = os.path.getsize(output_csv) if os.path.exists(output_csv) else 0
+
+    after = server.state.snapshot()
+
+    def delta(key):
+        return {k: v - before[key].get(k, 0) for k, v in after[key].items() if v - before[key].get(k, 0)}
+
+    statuses = delta('statuses')
+    requests = delta('requests')
+    return {
+        'contacts': size,
+        'exit_code': exit_code,
+        'wall_seconds': round(wall, 3),
+        'contacts_per_second': round(size / wall, 2) if wall else None,
+        'valid_inserts': report.get('valid', 0),
+        'latency_p50_s': report.get('p50_latency_s'),
+        'latency_p95_s': report.get('p95_latency_s'),
+        'api_requests': sum(statuses.values()),
+        'api_requests_by_kind': requests,
+        'rate_limited_responses': statuses.get('429', 0),
+        'injected_answers': delta('injected'),
+        'repair_attempts': report.get('repair_attempts', 0),
+        'telemetry_events': report.get('calls', 0),
+        'web_searches': report.get('web_searches', 0),
+        'failures': report.get('failures', {}),
+        'sheet_rows': len(worksheet.rows),
+        'sheet_append_calls': worksheet.calls,
+        'sheet_upload_seconds': round(worksheet.seconds, 3),
+        'sheet_blocked_seconds': round(totals['queue'] + totals['drain'], 3),
+        'csv_seconds': round(totals['csv'], 3),
+        'csv_bytes': csv_bytes,
+    }
+
+
+def compare(current: Dict, baseline: Dict) -> List[str]:
+    """Human-readable deltas for runs present in both result files."""
+    lines = []
+    base_runs = {r['contacts']: r for r in baseline.get('runs', [])}
+    for run in current['runs']:
+        base = base_runs.get(run['contacts'])
+        if not base:
+            continue
+        for key in ('contacts_per_second', 'latency_p50_s', 'api_requests', 'rate_limited_responses',
+                    'sheet_blocked_seconds', 'csv_seconds'):
+            old, new = base.get(key), run.get(key)
+            if old and new is not None:
+                lines.append(f"  {run['contacts']:>6} {key:<22} {old:>10} -> {new:<10} ({(new - old) / old * 100:+.1f}%)")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Benchmark insert_generator against a local Messages API stand-in')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Comma-separated contact counts (default: 100,1000,10000)')
+    parser.add_argument('--workers', type=int, default=8, help='insert_generator --workers (default: 8)')
+    parser.add_argument('--rpm', type=int, default=0, help='insert_generator --rpm (default: 0 = off)')
+    parser.add_argument('--args', default='', help='Extra insert_generator arguments, e.g. "--stream"')
+    parser.add_argument('--latency-scale', type=float, default=1.0,
+                        help='Multiply the stand-in median latencies (0 = no latency)')
+    parser.add_argument('--server-rpm', type=int, default=0,
+                        help='Requests per minute the stand-in allows before answering 429 (default: 0 = unlimited)')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of random 429 responses')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Seconds sent in retry-after on a 429')
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help='Fraction of unparseable answers')
+    parser.add_argument('--invalid-rate', type=float, default=0.0, help='Fraction of inserts that break the rules')
+    parser.add_argument('--sheet-latency-ms', type=float, default=300.0,
+                        help='Simulated latency of each Sheets append call')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--output', '-o', default='bench_insert_generator.json', help='JSON results file')
+    parser.add_argument('--baseline', help='Previous results JSON to compare against')
+    args = parser.parse_args(argv)
+
+    profile = MessagesProfile(
+        rpm_limit=args.server_rpm,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        malformed_rate=args.malformed_rate,
+        invalid_rate=args.invalid_rate,
+        seed=args.seed,
+    ).scaled(args.latency_scale)
+    main_args = ['--workers', str(args.workers), '--rpm', str(args.rpm), '--delay', '0'] + shlex.split(args.args)
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    results = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'config': {
+            'insert_generator_args': main_args,
+            'latency_scale': args.latency_scale,
+            'sheet_latency_ms': args.sheet_latency_ms,
+            'profile': vars(profile),
+        },
+        'runs': [],
+    }
+
+    # Per-contact INFO lines would dominate the console at 10k contacts
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.WARNING)
+    try:
+        with FakeMessagesServer(profile) as server:
+            for size in sizes:
+                print(f"Running {size} contacts...", flush=True)
+                run = run_size(server, size, main_args, args.sheet_latency_ms / 1000)
+                results['runs'].append(run)
+                print(f"  {run['contacts_per_second']} contacts/s, {run['valid_inserts']} valid, "
+                      f"{run['api_requests']} API requests ({run['rate_limited_responses']} rate-limited), "
+                      f"{run['repair_attempts']} repairs, sheet {run['sheet_append_calls']} appends "
+                      f"({run['sheet_blocked_seconds']}s blocking), CSV {run['csv_seconds']}s")
+    finally:
+        root.setLevel(level)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\nCompared to {args.baseline}:")
+        for line in compare(results, baseline):
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Local Messages API Stand-in
+===========================
+A fake Anthropic Messages endpoint for load-testing insert_generator.py
+without API spend. Point the SDK at it with base_url (or ANTHROPIC_BASE_URL).
+
+Routes:
+    POST /v1/messages   (JSON, or server-sent events when "stream": true)
+
+Answers come back the way the real API shapes them: a record_insert (or
+record_company) tool call with a canned 15-25 word insert, usage with token
+and web-search counts, and anthropic-ratelimit-* headers. Behaviour is set by
+MessagesProfile:
+    - latency: log-normal around a median, longer for web-search calls
+    - rate limits: an RPM window enforced like the real API, plus random 429s
+      with retry-after
+    - malformed output: unparseable text instead of a tool call
+    - invalid inserts: answers that break the insert rules (too short)
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+# Valid inserts (15-25 words, no banned phrases); {company} is filled in
+CANNED_INSERTS = [
+    "I've been following how {company} approaches hiring and would love to hear what shaped your thinking on building teams.",
+    "Your work growing {company} caught my eye, and I'd love to learn how you decided which markets to enter first.",
+    "I read about the recent launch at {company} and am curious how your team balanced speed against getting the details right.",
+    "The way {company} talks about its customers stood out to me, and I'd love to hear how that culture started.",
+]
+
+# Breaks the 15-word minimum, so insert_generator repairs it
+INVALID_INSERT = "Great company, {company}."
+
+# Neither a tool call nor parseable JSON
+MALFORMED_TEXT = 'Here is the insert: {"insert": "I have been thinking about {company} and'
+
+
+@dataclass
+class MessagesProfile:
+    """Behaviour of the fake Messages endpoint."""
+    latency_median_ms: float = 400.0   # calls without web search
+    search_latency_ms: float = 1500.0  # extra median latency for calls that offer web search
+    latency_sigma: float = 0.4         # log-normal shape; 0 = constant latency
+    rpm_limit: int = 0                 # requests per window before real 429s (0 = unlimited)
+    window_seconds: float = 60.0       # length of the rpm_limit window
+    rate_limit_rate: float = 0.0       # fraction of requests answered with a random 429
+    retry_after: float = 1.0           # seconds sent in retry-after
+    malformed_rate: float = 0.0        # fraction of inserts returned as unparseable text
+    invalid_rate: float = 0.0          # fraction of inserts that break the insert rules
+    web_searches: int = 2              # searches reported per web-search call
+    output_tokens: int = 120
+    stream_chunk_chars: int = 24       # partial_json size per streamed delta
+    seed: int = 1234
+
+    def scaled(self, latency_scale: float) -> 'MessagesProfile':
+        """Return a copy with both latency medians multiplied by latency_scale."""
+        profile = MessagesProfile(**vars(self))
+        profile.latency_median_ms *= latency_scale
+        profile.search_latency_ms *= latency_scale
+        return profile
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _reset_timestamp(seconds: float) -> str:
+    reset = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return reset.isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+
+class _MessagesState:
+    """Shared, thread-safe state: RNG, rate-limit window and counters."""
+
+    def __init__(self, profile: MessagesProfile):
+        self.profile = profile
+        self._rng = random.Random(profile.seed)
+        self._lock = threading.Lock()
+        self._window = deque()
+        self._seen_systems = set()
+        self._message_ids = 0
+        self.requests = Counter()   # by kind: research, generation, company
+        self.statuses = Counter()
+        self.injected = Counter()   # malformed / invalid answers sent
+
+    def admit(self):
+        """Apply the RPM window and random 429s. Returns (limited, retry_after, headers)."""
+        profile = self.profile
+        with self._lock:
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= profile.window_seconds:
+                self._window.popleft()
+            headers = {}
+            if profile.rpm_limit:
+                reset_in = profile.window_seconds - (now - self._window[0]) if self._window else 0.0
+                if len(self._window) >= profile.rpm_limit:
+                    headers = {
+                        'anthropic-ratelimit-requests-limit': str(profile.rpm_limit),
+                        'anthropic-ratelimit-requests-remaining': '0',
+                        'anthropic-ratelimit-requests-reset': _reset_timestamp(reset_in),
+                    }
+                    return True, max(reset_in, 0.001), headers
+                self._window.append(now)
+                remaining = profile.rpm_limit - len(self._window)
+                headers = {
+                    'anthropic-ratelimit-requests-limit': str(profile.rpm_limit),
+                    'anthropic-ratelimit-requests-remaining': str(remaining),
+                    'anthropic-ratelimit-requests-reset': _reset_timestamp(
+                        profile.window_seconds - (now - self._window[0])
+                    ),
+                }
+            if self._rng.random() < profile.rate_limit_rate:
+                return True, profile.retry_after, headers
+            return False, 0.0, headers
+
+    def roll(self, kind: str, searches: bool):
+        """Record a request and decide (latency, answer) for it."""
+        profile = self.profile
+        with self._lock:
+            self.requests[kind] += 1
+            latency = 0.0
+            median = profile.latency_median_ms + (profile.search_latency_ms if searches else 0.0)
+            if median > 0:
+                if profile.latency_sigma > 0:
+                    latency = self._rng.lognormvariate(math.log(median), profile.latency_sigma) / 1000
+                else:
+                    latency = median / 1000
+            answer = 'valid'
+            if kind != 'company':
+                draw = self._rng.random()
+                if draw < profile.malformed_rate:
+                    answer = 'malformed'
+                elif draw < profile.malformed_rate + profile.invalid_rate:
+                    answer = 'invalid'
+            if answer != 'valid':
+                self.injected[answer] += 1
+            canned = self._rng.choice(CANNED_INSERTS)
+        return latency, answer, canned
+
+    def cache_read(self, system: str) -> bool:
+        """True once a system prompt has been seen (mimics prompt-cache reads)."""
+        with self._lock:
+            seen = system in self._seen_systems
+            self._seen_systems.add(system)
+            return seen
+
+    def next_id(self) -> str:
+        with self._lock:
+            self._message_ids += 1
+            return f"msg_fake_{self._message_ids:08d}"
+
+    def record_status(self, status: int):
+        with self._lock:
+            self.statuses[status] += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'requests': dict(self.requests),
+                'statuses': {str(k): v for k, v in self.statuses.items()},
+                'injected': dict(self.injected),
+            }
+
+
+def _field(text: str, label: str) -> str:
+    """Value of a 'Label: value' line in the user message."""
+    for line in text.splitlines():
+        if line.strip().startswith(f"{label}:"):
+            return line.split(':', 1)[1].strip()
+    return ''
+
+
+class _FakeMessagesHandler(BaseHTTPRequestHandler):
+    server_version = "FakeMessages/1.0"
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> _MessagesState:
+        return self.server.state
+
+    def _send_json(self, status: int, body: dict, headers: Optional[Dict[str, str]] = None):
+        payload = json.dumps(body).encode()
+        self.state.record_status(status)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('request-id', f"req_fake_{id(self)}")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if self.path.split('?')[0] != '/v1/messages':
+            return self._send_json(404, {'type': 'error', 'error': {'type': 'not_found_error', 'message': self.path}})
+
+        limited, retry_after, headers = self.state.admit()
+        if limited:
+            headers = dict(headers, **{'retry-after': f"{retry_after:.3f}"})
+            return self._send_json(429, {
+                'type': 'error',
+                'error': {'type': 'rate_limit_error', 'message': 'Fake rate limit'},
+            }, headers)
+
+        message = self._answer(request)
+        if request.get('stream'):
+            return self._send_stream(message, headers)
+        self._send_json(200, message, headers)
+
+    def _answer(self, request: dict) -> dict:
+        tool_names = [tool.get('name') for tool in request.get('tools', [])]
+        searches = 'web_search' in tool_names
+        kind = 'company' if 'record_company' in tool_names else ('research' if searches else 'generation')
+        latency, answer, canned = self.state.roll(kind, searches)
+        if latency:
+            time.sleep(latency)
+
+        messages = request.get('messages', [])
+        first = messages[0].get('content', '') if messages else ''
+        first = first if isinstance(first, str) else json.dumps(first)
+        company = _field(first, 'Company') or _field(first, 'Research this company') or 'your company'
+        system = json.dumps(request.get('system', ''))
+
+        if kind == 'company':
+            content = [{
+                'type': 'tool_use', 'id': f"toolu_{self.state.next_id()}", 'name': 'record_company',
+                'input': {'facts': [f"{company} builds developer tools"], 'sources': [f"{company.lower()}.com"]},
+            }]
+        elif answer == 'malformed':
+            content = [{'type': 'text', 'text': MALFORMED_TEXT.replace('{company}', company)}]
+        else:
+            insert = (INVALID_INSERT if answer == 'invalid' else canned).format(company=company)
+            content = [{
+                'type': 'tool_use', 'id': f"toolu_{self.state.next_id()}", 'name': 'record_insert',
+                'input': {
+                    'facts': [f"Leads growth at {company}", f"{company} raised a Series B"],
+                    'sources': ['Company blog', 'TechCrunch'],
+                    'research_quality': 'detailed',
+                    'insert': insert,
+                    'word_count': len(insert.split()),
+                },
+            }]
+
+        cached = self.state.cache_read(system)
+        return {
+            'id': self.state.next_id(),
+            'type': 'message',
+            'role': 'assistant',
+            'model': request.get('model', 'fake-model'),
+            'content': content,
+            'stop_reason': 'tool_use' if content[0]['type'] == 'tool_use' else 'end_turn',
+            'stop_sequence': None,
+            'usage': {
+                'input_tokens': _tokens(json.dumps(messages)),
+                'output_tokens': self.state.profile.output_tokens,
+                'cache_creation_input_tokens': 0 if cached else _tokens(system),
+                'cache_read_input_tokens': _tokens(system) if cached else 0,
+                'server_tool_use': {'web_search_requests': self.state.profile.web_searches if searches else 0},
+            },
+        }
+
+    def _send_stream(self, message: dict, headers: Dict[str, str]):
+        """Send a message as server-sent events, tool input in partial_json chunks."""
+        self.state.record_status(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.close_connection = True
+
+        def event(name, data):
+            self.wfile.write(f"event: {name}\ndata: {json.dumps(data)}\n\n".encode())
+            self.wfile.flush()
+
+        usage = dict(message['usage'])
+        output_tokens = usage['output_tokens']
+        start = dict(message, content=[], stop_reason=None, usage=dict(usage, output_tokens=1))
+        chunk = max(1, self.state.profile.stream_chunk_chars)
+        try:
+            event('message_start', {'type': 'message_start', 'message': start})
+            for index, block in enumerate(message['content']):
+                if block['type'] == 'tool_use':
+                    event('content_block_start', {
+                        'type': 'content_block_start', 'index': index,
+                        'content_block': dict(block, input={}),
+                    })
+                    text, delta_type, key = json.dumps(block['input']), 'input_json_delta', 'partial_json'
+                else:
+                    event('content_block_start', {
+                        'type': 'content_block_start', 'index': index,
+                        'content_block': {'type': 'text', 'text': ''},
+                    })
+                    text, delta_type, key = block['text'], 'text_delta', 'text'
+                for i in range(0, len(text), chunk):
+                    event('content_block_delta', {
+                        'type': 'content_block_delta', 'index': index,
+                        'delta': {'type': delta_type, key: text[i:i + chunk]},
+                    })
+                event('content_block_stop', {'type': 'content_block_stop', 'index': index})
+            event('message_delta', {
+                'type': 'message_delta',
+                'delta': {'stop_reason': message['stop_reason'], 'stop_sequence': None},
+                'usage': {'output_tokens': output_tokens},
+            })
+            event('message_stop', {'type': 'message_stop'})
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client aborted the stream early
+
+
+class FakeMessagesServer(ThreadingHTTPServer):
+    """HTTP stand-in for the Messages API."""
+
+    daemon_threads = True
+
+    def __init__(self, profile: Optional[MessagesProfile] = None, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _FakeMessagesHandler)
+        self.profile = profile or MessagesProfile()
+        self.state = _MessagesState(self.profile)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeMessagesServer':
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> 'FakeMessagesServer':
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Local Provider Stand-ins
+========================
+Fake HTTP, SMTP and DNS servers that imitate the endpoints EmailFinder talks
+to, so lookups can be benchmarked without network access or API quota.
+
+HTTP routes (one prefix per provider):
+    GET  /hunter/v2/email-finder
+    POST /apollo/v1/people/match
+    GET  /rocketreach/api/v2/person/lookup
+    GET  /clearbit/v1/people/find
+    GET  /google/search
+    GET  /github/search/users, /github/users/<login>
+    GET  /website/<host>/<page>  (company sites, incl. robots.txt)
+
+Each provider has its own latency distribution (log-normal around a median),
+429 injection rate and hit rate. SMTP answers RCPT with 250 or 550, and DNS
+answers every MX query with localhost.
+"""
+
+import json
+import math
+import random
+import re
+import socketserver
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+import dns.message
+import dns.rdatatype
+import dns.resolver
+import dns.rrset
+
+
+@dataclass
+class ProviderProfile:
+    """Behaviour of one fake provider."""
+    latency_median_ms: float = 5.0
+    latency_sigma: float = 0.5      # log-normal shape; 0 = constant latency
+    rate_limit_rate: float = 0.0    # fraction of requests answered with 429
+    hit_rate: float = 0.5           # fraction of lookups that return an email
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Sample one response latency in seconds."""
+        if self.latency_median_ms <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency_median_ms / 1000
+        return rng.lognormvariate(math.log(self.latency_median_ms), self.latency_sigma) / 1000
+
+
+DEFAULT_PROFILES = {
+    'hunter': ProviderProfile(latency_median_ms=8, rate_limit_rate=0.02, hit_rate=0.6),
+    'apollo': ProviderProfile(latency_median_ms=10, rate_limit_rate=0.02, hit_rate=0.5),
+    'rocketreach': ProviderProfile(latency_median_ms=12, rate_limit_rate=0.01, hit_rate=0.4),
+    'clearbit': ProviderProfile(latency_median_ms=8, rate_limit_rate=0.01, hit_rate=0.3),
+    'google': ProviderProfile(latency_median_ms=15, rate_limit_rate=0.05, hit_rate=0.2),
+    'github': ProviderProfile(latency_median_ms=6, rate_limit_rate=0.0, hit_rate=0.3),
+    'website': ProviderProfile(latency_median_ms=20, rate_limit_rate=0.0, hit_rate=0.3),
+    'smtp': ProviderProfile(latency_median_ms=3, hit_rate=0.7),
+}
+
+
+# People listed on fake company team pages; benchmark names are drawn from these
+TEAM_ROSTER = [
+    'Ada Lovelace', 'Grace Hopper', 'Alan Turing', 'Barbara Liskov',
+    'Ken Thompson', 'Radia Perlman', 'Linus Torvalds', 'Margaret Hamilton',
+]
+
+# Site pages that exist on every fake company website
+WEBSITE_PAGES = {'', 'contact', 'about', 'team'}
+
+
+@dataclass
+class FakeProviderConfig:
+    """Profiles for all providers plus page shape for scraped results."""
+    profiles: Dict[str, ProviderProfile] = field(
+        default_factory=lambda: {k: ProviderProfile(**vars(v)) for k, v in DEFAULT_PROFILES.items()}
+    )
+    page_size_kb: int = 64          # size of each fake search result page
+    seed: int = 1234
+
+    def scaled(self, latency_scale: float) -> 'FakeProviderConfig':
+        """Return a copy with every median latency multiplied by latency_scale."""
+        profiles = {}
+        for name, profile in self.profiles.items():
+            profiles[name] = ProviderProfile(**vars(profile))
+            profiles[name].latency_median_ms *= latency_scale
+        return FakeProviderConfig(profiles=profiles, page_size_kb=self.page_size_kb, seed=self.seed)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]', '', text.lower())
+
+
+def _email_for(name: str, domain: str) -> str:
+    parts = [_slug(p) for p in name.split() if _slug(p)]
+    if not parts:
+        return f"info@{domain}"
+    return f"{parts[0]}.{parts[-1]}@{domain}" if len(parts) > 1 else f"{parts[0]}@{domain}"
+
+
+def _domain_for(company: str) -> str:
+    return f"{_slug(company) or 'example'}.com"
+
+
+class _ProviderState:
+    """Shared, thread-safe state behind all fake servers."""
+
+    def __init__(self, config: FakeProviderConfig):
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self.requests = Counter()
+        self.statuses = Counter()
+
+    def roll(self, provider: str):
+        """Record a request and decide (latency, rate_limited, hit) for it."""
+        profile = self.config.profiles.get(provider, ProviderProfile())
+        with self._lock:
+            self.requests[provider] += 1
+            latency = profile.sample_latency(self._rng)
+            limited = self._rng.random() < profile.rate_limit_rate
+            hit = self._rng.random() < profile.hit_rate
+        return latency, limited, hit
+
+    def count(self, provider: str):
+        with self._lock:
+            self.requests[provider] += 1
+
+    def record_status(self, provider: str, status: int):
+        with self._lock:
+            self.statuses[f"{provider}:{status}"] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.requests)
+
+
+class _FakeProviderHandler(BaseHTTPRequestHandler):
+    server_version = "FakeProvider/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> _ProviderState:
+        return self.server.state
+
+    def _send(self, provider: str, status: int, body, content_type: str = 'application/json'):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.state.record_status(provider, status)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        if status == 429:
+            self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _dispatch(self, method: str):
+        parsed = urlparse(self.path)
+        provider = parsed.path.strip('/').split('/')[0]
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        body = {}
+        if method == 'POST':
+            length = int(self.headers.get('Content-Length') or 0)
+            if length:
+                body = json.loads(self.rfile.read(length) or b'{}')
+
+        latency, limited, hit = self.state.roll(provider)
+        if latency:
+            time.sleep(latency)
+        if limited:
+            return self._send(provider, 429, {'error': 'rate limited'})
+
+        handler = getattr(self, f'_route_{provider}', None)
+        if handler is None:
+            return self._send(provider, 404, {'error': 'unknown route'})
+        return handler(parsed.path, params, body, hit)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    # ---------- provider routes ----------
+    def _route_hunter(self, path, params, body, hit):
+        name = f"{params.get('first_name', '')} {params.get('last_name', '')}"
+        email = _email_for(name, params.get('domain', 'example.com')) if hit else None
+        self._send('hunter', 200, {'data': {'email': email, 'score': 91 if email else 0}})
+
+    def _route_apollo(self, path, params, body, hit):
+        email = _email_for(body.get('name', ''), _domain_for(body.get('organization_name', ''))) if hit else None
+        self._send('apollo', 200, {'person': {'email': email}})
+
+    def _route_rocketreach(self, path, params, body, hit):
+        if not hit:
+            return self._send('rocketreach', 404, {'detail': 'not found'})
+        email = _email_for(params.get('name', ''), _domain_for(params.get('current_employer', '')))
+        self._send('rocketreach', 200, {'emails': [{'email': email}]})
+
+    def _route_clearbit(self, path, params, body, hit):
+        if not hit:
+            return self._send('clearbit', 404, {'error': 'not found'})
+        self._send('clearbit', 200, {'email': _email_for(params.get('name', ''), params.get('domain', 'example.com'))})
+
+    def _route_google(self, path, params, body, hit):
+        query = params.get('q', '')
+        match = re.search(r'"([^"]+)"', query)
+        name = match.group(1) if match else query
+        self._send('google', 200, self.server.search_page(name, hit), content_type='text/html')
+
+    def _route_github(self, path, params, body, hit):
+        if path.startswith('/github/search/users'):
+            login = _slug(params.get('q', ''))
+            items = [{'login': f"{login}{i}"} for i in range(3)] if login else []
+            return self._send('github', 200, {'items': items})
+        login = path.rsplit('/', 1)[-1]
+        self._send('github', 200, {'login': login, 'email': f"{login}@users.example.dev" if hit else None})
+
+    def _route_website(self, path, params, body, hit):
+        parts = path.strip('/').split('/')
+        host = parts[1] if len(parts) > 1 else 'example.com'
+        page = '/'.join(parts[2:])
+        if page == 'robots.txt':
+            robots = f"User-agent: *\nDisallow: /website/{host}/people\n"
+            return self._send('website', 200, robots.encode(), content_type='text/plain')
+        if page not in WEBSITE_PAGES:
+            return self._send('website', 404, b'<html>Not found</html>', content_type='text/html')
+        emails = [f"info@{host}"]
+        if hit and page in ('contact', 'team'):
+            emails += [_email_for(person, host) for person in TEAM_ROSTER]
+        links = ''.join(f'<li><a href="mailto:{e}">{e}</a></li>' for e in emails)
+        html = f"<html><body><h1>{page or 'home'}</h1><ul>{links}</ul>".encode()
+        self._send('website', 200, html + self.server.filler + b'</body></html>', content_type='text/html')
+
+
+class FakeProviderServer(ThreadingHTTPServer):
+    """HTTP stand-in for every API and scraping endpoint EmailFinder uses."""
+
+    daemon_threads = True
+
+    def __init__(self, config: Optional[FakeProviderConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _FakeProviderHandler)
+        self.config = config or FakeProviderConfig()
+        self.state = _ProviderState(self.config)
+        self.filler = self._build_filler(self.config.page_size_kb)
+        self._thread = None
+
+    @staticmethod
+    def _build_filler(size_kb: int) -> bytes:
+        block = (
+            '<div class="g"><a href="https://www.example.com/about">Result</a>'
+            '<span>Lorem ipsum dolor sit amet, contact support@example.com or '
+            'webmaster@w3.org for details.</span></div>\n'
+        )
+        repeat = max(1, (size_kb * 1024) // len(block))
+        return (block * repeat).encode()
+
+    def search_page(self, name: str, hit: bool) -> bytes:
+        """Render a result page of the configured size, optionally containing the person's email."""
+        found = f'<p>Reach {name} at {_email_for(name, "gmail.com")}</p>' if hit else ''
+        half = len(self.filler) // 2
+        return b''.join([
+            b'<html><body>', self.filler[:half], found.encode(), self.filler[half:], b'</body></html>'
+        ])
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def endpoints(self) -> Dict[str, str]:
+        """Endpoint overrides to pass to EmailFinder(endpoints=...)."""
+        base = self.base_url
+        return {
+            'hunter': f"{base}/hunter/v2/email-finder",
+            'apollo': f"{base}/apollo/v1/people/match",
+            'rocketreach': f"{base}/rocketreach/api/v2/person/lookup",
+            'clearbit': f"{base}/clearbit/v1/people/find",
+            'google': f"{base}/google/search",
+            'github': f"{base}/github",
+            'website': f"{base}/website/{{host}}",
+        }
+
+    def start(self) -> 'FakeProviderServer':
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for EmailFinder.verify_email_smtp."""
+
+    def _reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        state = self.server.state
+        self._reply("220 fake-mx ESMTP ready")
+        for raw in self.rfile:
+            command = raw.decode(errors='replace').strip().upper()
+            if command.startswith(('HELO', 'EHLO')):
+                self._reply("250 fake-mx")
+            elif command.startswith('MAIL'):
+                self._reply("250 OK")
+            elif command.startswith('RCPT'):
+                latency, _, hit = state.roll('smtp')
+                if latency:
+                    time.sleep(latency)
+                self._reply("250 OK" if hit else "550 No such user")
+            elif command.startswith('QUIT'):
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+class FakeSmtpServer(socketserver.ThreadingTCPServer):
+    """SMTP stand-in that accepts or rejects RCPT TO according to the smtp profile."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, state: _ProviderState, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _SmtpHandler)
+        self.state = state
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> 'FakeSmtpServer':
+        threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _DnsHandler(socketserver.BaseRequestHandler):
+    """Answer every MX query with 'localhost.' so SMTP checks hit FakeSmtpServer."""
+
+    def handle(self):
+        data, sock = self.request
+        try:
+            query = dns.message.from_wire(data)
+        except Exception:
+            return
+        response = dns.message.make_response(query)
+        for question in query.question:
+            if question.rdtype == dns.rdatatype.MX:
+                response.answer.append(
+                    dns.rrset.from_text(question.name, 300, 'IN', 'MX', '10 localhost.')
+                )
+        self.server.state.count('dns')
+        sock.sendto(response.to_wire(), self.client_address)
+
+
+class FakeDnsServer(socketserver.ThreadingUDPServer):
+    """UDP DNS stand-in for MX lookups."""
+
+    daemon_threads = True
+
+    def __init__(self, state: _ProviderState, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _DnsHandler)
+        self.state = state
+
+    def resolver(self) -> dns.resolver.Resolver:
+        """A resolver pointed only at this server, for EmailFinder(resolver=...)."""
+        host, port = self.server_address[:2]
+        resolver = dns.resolver.Resolver(configure=False)
+        resolver.nameservers = [host]
+        resolver.port = port
+        return resolver
+
+    def start(self) -> 'FakeDnsServer':
+        threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class FakeProviders:
+    """Context manager that runs the HTTP, SMTP and DNS stand-ins together."""
+
+    def __init__(self, config: Optional[FakeProviderConfig] = None):
+        self.http = FakeProviderServer(config)
+        self.smtp = FakeSmtpServer(self.http.state)
+        self.dns = FakeDnsServer(self.http.state)
+
+    @property
+    def state(self) -> _ProviderState:
+        return self.http.state
+
+    def finder_kwargs(self) -> dict:
+        """Keyword arguments that point an EmailFinder at these servers."""
+        return {
+            'endpoints': self.http.endpoints(),
+            'resolver': self.dns.resolver(),
+            'smtp_port': self.smtp.port,
+        }
+
+    def __enter__(self) -> 'FakeProviders':
+        self.http.start()
+        self.smtp.start()
+        self.dns.start()
+        return self
+
+    def __exit__(self, *args):
+        self.http.stop()
+        self.smtp.stop()
+        self.dns.stop()
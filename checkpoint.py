@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Checkpoint - Durable, append-only output CSV for insert_generator.py.
+
+The output CSV doubles as the resume checkpoint. CheckpointWriter keeps it
+open for the whole run and appends each batch of rows with a single
+O_APPEND write, so a crash can at worst leave one torn line at the end,
+which is cut off the next time the file is opened. Rows are buffered for
+flush_every rows and fsync'd at most every fsync_interval seconds.
+
+Next to the CSV, a binary sidecar index (<output>.idx) stores one fixed-size
+record per row: an 8-byte hash of the row's checkpoint key and the CSV size
+after that row. Resuming reads the index instead of re-parsing the CSV; only
+rows written after the last index record (a crash between the two writes)
+are parsed. A missing or inconsistent index is rebuilt from the CSV.
+
+Usage:
+    with CheckpointWriter("inserts.csv", OUTPUT_FIELDS) as checkpoint:
+        if not checkpoint.is_processed(contact):
+            checkpoint.write(row)
+"""
+
+import csv
+import hashlib
+import io
+import os
+import struct
+import time
+from typing import Callable, Iterable, List, Optional
+
+# Index record: key hash, CSV size after the row (both unsigned 64-bit)
+INDEX_RECORD = struct.Struct("<QQ")
+
+DEFAULT_FLUSH_EVERY = 1
+DEFAULT_FSYNC_INTERVAL = 5.0
+
+
+def row_key(row: dict) -> str:
+    """Checkpoint key for an output row: Email if present, else Name+Company."""
+    email = (row.get("Email") or "").strip().lower()
+    if email:
+        return f"email:{email}"
+    name = (row.get("Name") or "").strip().lower()
+    company = (row.get("Company") or "").strip().lower()
+    return f"name_company:{name}|{company}"
+
+
+def contact_keys(contact: dict) -> List[str]:
+    """Keys under which a contact may already have been written."""
+    keys = []
+    email = (contact.get("Email") or "").strip().lower()
+    if email:
+        keys.append(f"email:{email}")
+    name = (contact.get("Name") or "").strip().lower()
+    company = (contact.get("Company") or "").strip().lower()
+    keys.append(f"name_company:{name}|{company}")
+    return keys
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def index_path(csv_path: str) -> str:
+    return csv_path + ".idx"
+
+
+def _repair_torn_tail(fd: int) -> int:
+    """Cut a partial last line left by a crash. Returns the resulting file size."""
+    size = os.fstat(fd).st_size
+    if size == 0:
+        return 0
+    pos = size
+    while pos > 0:
+        step = min(4096, pos)
+        chunk = os.pread(fd, step, pos - step)
+        newline = chunk.rfind(b"\n")
+        if newline != -1:
+            end = pos - step + newline + 1
+            break
+        pos -= step
+    else:
+        end = 0
+    if end != size:
+        os.ftruncate(fd, end)
+    return end
+
+
+class CheckpointWriter:
+    """Long-lived, crash-safe appender for the output CSV plus its key index."""
+
+    def __init__(
+        self,
+        path: str,
+        fieldnames: List[str],
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = path
+        self.fieldnames = fieldnames
+        self.flush_every = max(1, flush_every)
+        self.fsync_interval = fsync_interval
+        self.clock = clock
+        self.written = 0
+        self.row_count = 0          # data rows on disk (one index record each)
+        self._pending = []          # (csv bytes, key hash) not yet written
+        self._last_fsync = clock()
+        self._dirty = False
+        self._line = io.StringIO()
+        self._csv = csv.writer(self._line, lineterminator="\n")
+
+        flags = os.O_RDWR | os.O_CREAT | os.O_APPEND
+        self._fd = os.open(path, flags, 0o644)
+        self._index_fd = os.open(index_path(path), flags, 0o644)
+        self._size = _repair_torn_tail(self._fd)
+        self._header_columns = self._read_header()
+        if self._size == 0:
+            self._write_header()
+        self.processed = self._load_index()
+
+    # Reading state ---------------------------------------------------------
+
+    def _read_header(self) -> Optional[List[str]]:
+        if self._size == 0:
+            return None
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            return next(csv.reader(f), None)
+
+    def _write_header(self):
+        os.write(self._fd, self._format(self.fieldnames))
+        self._size = os.fstat(self._fd).st_size
+        self._header_columns = list(self.fieldnames)
+        os.ftruncate(self._index_fd, 0)
+
+    def _iter_rows(self, start: int) -> Iterable[tuple]:
+        """(row dict, CSV size after the row) for every data row at or after start."""
+        with open(self.path, "rb") as f:
+            header = f.readline()
+            offset = max(start, len(header))
+            f.seek(offset)
+            columns = self._header_columns or []
+            for line in f:
+                offset += len(line)
+                values = next(csv.reader([line.decode("utf-8")]), [])
+                if values:
+                    yield dict(zip(columns, values)), offset
+
+    def _load_index(self) -> set:
+        """Hashes of every key in the CSV, from the index plus any unindexed tail."""
+        index_size = os.fstat(self._index_fd).st_size
+        whole = index_size - index_size % INDEX_RECORD.size
+        if whole != index_size:
+            os.ftruncate(self._index_fd, whole)
+        data = os.pread(self._index_fd, whole, 0) if whole else b""
+
+        processed = set()
+        indexed_to = 0
+        self.row_count = 0
+        for key, offset in INDEX_RECORD.iter_unpack(data):
+            processed.add(key)
+            indexed_to = offset
+            self.row_count += 1
+
+        if indexed_to > self._size or (
+            indexed_to and os.pread(self._fd, 1, indexed_to - 1) != b"\n"
+        ):
+            # The CSV was replaced or truncated behind the index's back: rebuild
+            os.ftruncate(self._index_fd, 0)
+            processed = set()
+            indexed_to = 0
+            self.row_count = 0
+
+        if indexed_to < self._size:
+            records = []
+            for row, offset in self._iter_rows(indexed_to):
+                key = key_hash(row_key(row))
+                processed.add(key)
+                records.append(INDEX_RECORD.pack(key, offset))
+            if records:
+                os.write(self._index_fd, b"".join(records))
+                self.row_count += len(records)
+        return processed
+
+    def iter_rows_from(self, row_number: int) -> Iterable[dict]:
+        """Rows already on disk, starting at the given 0-based data row."""
+        self.flush()
+        if row_number >= self.row_count:
+            return
+        start = 0
+        if row_number > 0:
+            record = os.pread(
+                self._index_fd, INDEX_RECORD.size, (row_number - 1) * INDEX_RECORD.size
+            )
+            start = INDEX_RECORD.unpack(record)[1]
+        for row, _ in self._iter_rows(start):
+            yield row
+
+    def is_processed(self, contact: dict) -> bool:
+        """True if the contact is already in the checkpoint (or buffered to be)."""
+        return any(key_hash(key) in self.processed for key in contact_keys(contact))
+
+    def __len__(self) -> int:
+        return len(self.processed)
+
+    # Writing ---------------------------------------------------------------
+
+    def _format(self, values: List) -> bytes:
+        self._line.seek(0)
+        self._line.truncate()
+        # One row per line, so a torn tail is always a partial last line
+        self._csv.writerow(
+            ["" if v is None else str(v).replace("\r", " ").replace("\n", " ") for v in values]
+        )
+        return self._line.getvalue().encode("utf-8")
+
+    def write(self, row: dict):
+        """Buffer a row; it is appended once flush_every rows are pending."""
+        columns = self._header_columns or self.fieldnames
+        key = key_hash(row_key(row))
+        self._pending.append((self._format([row.get(column, "") for column in columns]), key))
+        self.processed.add(key)
+        self.written += 1
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self, fsync: bool = False):
+        """Append pending rows with one write, then their index records."""
+        if self._pending:
+            data = b"".join(line for line, _ in self._pending)
+            os.write(self._fd, data)
+            records = []
+            offset = self._size
+            for line, key in self._pending:
+                offset += len(line)
+                records.append(INDEX_RECORD.pack(key, offset))
+            self._size = offset
+            os.write(self._index_fd, b"".join(records))
+            self.row_count += len(records)
+            self._pending = []
+            self._dirty = True
+
+        now = self.clock()
+        if self._dirty and (fsync or now - self._last_fsync >= self.fsync_interval):
+            os.fsync(self._fd)
+            os.fsync(self._index_fd)
+            self._last_fsync = now
+            self._dirty = False
+
+    def close(self):
+        if self._fd is None:
+            return
+        self.flush(fsync=True)
+        os.close(self._fd)
+        os.close(self._index_fd)
+        self._fd = self._index_fd = None
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Email Extraction Engine
+=======================
+Shared address extraction for every scraping source in email_finder.py.
+
+Pages are scanned as raw bytes, chunk by chunk, so a response never has to be
+decoded or held in memory as a whole. Scanning jumps between '@' signs
+instead of trying a regex at every byte, and addresses that straddle two
+chunks are carried over to the next scan. Junk domains are rejected with set lookups on
+the domain and its parents, and name matching uses a token set built once
+per contact.
+
+Usage:
+    matcher = NameMatcher("Ada Lovelace")
+    emails = extract_from_response(resp, max_bytes=512 * 1024)
+    hits = [e for e in emails if matcher.matches(e)]
+"""
+
+import re
+import time
+from typing import Iterable, Iterator, Optional, Set, Union
+
+# Precompiled once; a bytes pattern so pages are never decoded
+_DOMAIN_PATTERN = re.compile(rb'[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Bytes that can appear in the local part, and anywhere in an address
+_LOCAL_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-')
+_EMAIL_BYTES = _LOCAL_BYTES | {ord('@')}
+
+# Longest local part taken before an '@' (RFC 5321 limit)
+MAX_LOCAL_LENGTH = 64
+
+# Longest address worth carrying across a chunk boundary (RFC 5321 limit)
+MAX_EMAIL_LENGTH = 254
+
+# Domains (and their subdomains) that only ever yield false positives
+JUNK_EMAIL_DOMAINS = frozenset({
+    'example.com', 'example.org', 'example.net',
+    'sentry.io', 'wixpress.com', 'schema.org', 'w3.org',
+    'domain.com', 'email.com', 'yourdomain.com',
+})
+
+# "TLDs" that are really asset file extensions (e.g. logo@2x.png)
+JUNK_EMAIL_SUFFIXES = frozenset({'png', 'jpg', 'jpeg', 'gif', 'svg', 'webp', 'css', 'js'})
+
+_NAME_SPLIT = re.compile(r'[^a-z0-9]+')
+
+
+def is_junk(email: str) -> bool:
+    """True if the address is on a blocklisted domain or is an asset filename."""
+    domain = email.rpartition('@')[2]
+    if domain.rpartition('.')[2] in JUNK_EMAIL_SUFFIXES:
+        return True
+    while True:
+        if domain in JUNK_EMAIL_DOMAINS:
+            return True
+        _, dot, domain = domain.partition('.')
+        if not dot:
+            return False
+
+
+def _scan(buf: bytes, end: int) -> Iterator[bytes]:
+    """
+    Yield the raw addresses (local@domain.tld) in buf[:end].
+
+    Rather than trying the pattern at every byte, jump between '@' signs
+    (a C-level find) and grow each one outwards: back over local-part bytes,
+    forward with the domain pattern. Pages have few '@'s, so most bytes are
+    never looked at by Python code.
+    """
+    pos = 0
+    while True:
+        at = buf.find(b'@', pos, end)
+        if at == -1:
+            return
+        start = at
+        floor = max(pos, at - MAX_LOCAL_LENGTH)
+        while start > floor and buf[start - 1] in _LOCAL_BYTES:
+            start -= 1
+        domain = _DOMAIN_PATTERN.match(buf, at + 1, end) if start < at else None
+        if domain:
+            yield buf[start:domain.end()]
+            pos = domain.end()
+        else:
+            pos = at + 1
+
+
+def _scan_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Raw addresses across a chunked stream, including ones split between chunks."""
+    carry = b''
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buf = carry + chunk if carry else chunk
+        # Hold back a trailing run of address bytes; it may continue in the next chunk
+        cut = len(buf)
+        floor = max(0, cut - MAX_EMAIL_LENGTH)
+        while cut > floor and buf[cut - 1] in _EMAIL_BYTES:
+            cut -= 1
+        carry = buf[cut:]
+        yield from _scan(buf, cut)
+    yield from _scan(carry, len(carry))
+
+
+def iter_emails(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Yield each distinct, non-junk, lower-cased address found in a byte stream."""
+    seen = set()
+    for raw in _scan_chunks(chunks):
+        email = raw.decode('ascii').lower()
+        if email not in seen:
+            seen.add(email)
+            if not is_junk(email):
+                yield email
+
+
+def extract_emails(content: Union[str, bytes]) -> Set[str]:
+    """Distinct, non-junk, lower-cased addresses in an in-memory page."""
+    if isinstance(content, str):
+        content = content.encode('utf-8', errors='ignore')
+    return set(iter_emails([content]))
+
+
+def _capped_chunks(resp, max_bytes: Optional[int], deadline: Optional[float],
+                   chunk_size: int) -> Iterator[bytes]:
+    size = 0
+    for chunk in resp.iter_content(chunk_size=chunk_size):
+        yield chunk
+        size += len(chunk)
+        if max_bytes is not None and size >= max_bytes:
+            return
+        if deadline is not None and time.monotonic() > deadline:
+            return
+
+
+def extract_from_response(resp, max_bytes: Optional[int] = None,
+                          deadline: Optional[float] = None,
+                          chunk_size: int = 16384) -> Set[str]:
+    """
+    Scan a streamed requests response (stream=True) for addresses.
+    Stops after max_bytes or once time.monotonic() passes deadline.
+    """
+    return set(iter_emails(_capped_chunks(resp, max_bytes, deadline, chunk_size)))
+
+
+class NameMatcher:
+    """Match addresses against a person's name using a precomputed token set."""
+
+    def __init__(self, name: str):
+        self.tokens = frozenset(t for t in _NAME_SPLIT.split(name.lower()) if len(t) > 1)
+
+    def matches(self, email: str) -> bool:
+        """True if any name token appears in the address (ada.l@, adalovelace@, ...)."""
+        return any(token in email for token in self.tokens)
+
+
+def matches_name(email: str, name: str) -> bool:
+    """One-off name check; build a NameMatcher when checking many addresses."""
+    return NameMatcher(name).matches(email)
@@ -11,7 +11,7 @@ Sources:
 4. Clearbit API - Company/person enrichment
 5. Google Search scraping - Public email mentions
 6. GitHub profile scraping - Developer emails
-7. Personal website scraping - Contact pages
+7. Personal/company website crawling - Contact, about and team pages
 8. Common email pattern generation + SMTP verification
 
 Usage:
@@ -30,14 +30,50 @@ import os
 import re
 import time
 import argparse
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
 import smtplib
 import dns.resolver
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
-from urllib.parse import quote_plus, urljoin
+from typing import Optional, List, Dict, Set
+from urllib.parse import quote_plus, urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 import requests
 from bs4 import BeautifulSoup
 
+from email_extractor import NameMatcher, extract_from_response
+from finder_results import PYARROW_AVAILABLE, JsonlResultWriter, export_parquet, jsonl_sidecar_path
+
+
+# Provider endpoints (overridable, e.g. to point at a local benchmark server)
+API_ENDPOINTS = {
+    'hunter': 'https://api.hunter.io/v2/email-finder',
+    'apollo': 'https://api.apollo.io/v1/people/match',
+    'rocketreach': 'https://api.rocketreach.co/api/v2/person/lookup',
+    'clearbit': 'https://prospector.clearbit.com/v1/people/find',
+    'google': 'https://www.google.com/search',
+    'github': 'https://api.github.com',
+    'website': 'https://{host}',    # site root template for company websites
+}
+
+# Sources whose successful calls spend paid/free-tier credits
+QUOTA_SOURCES = {'hunter', 'apollo', 'rocketreach', 'clearbit'}
+
+# Upper bounds (ms) of the per-source latency histogram buckets
+LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Website crawl: only likely contact pages, bounded per host and per contact
+CONTACT_PAGE_PATHS = ['', '/contact', '/contact-us', '/about', '/about-us', '/team', '/people']
+CRAWL_MAX_WORKERS = 4           # pages fetched in parallel per finder
+CRAWL_PER_HOST = 2              # concurrent requests to any one site
+CRAWL_MAX_BYTES = 512 * 1024    # stop downloading a page after this much
+CRAWL_BUDGET_SECONDS = 8.0      # wall-clock cap for one contact's crawl
+
+# Search result pages are scanned as a stream and abandoned past this size
+SEARCH_MAX_BYTES = 2 * 1024 * 1024
+
 
 @dataclass
 class Contact:
@@ -47,9 +83,11 @@ class Contact:
     industry: str = ""
     linkedin_url: str = ""
     location: str = ""
+    website: str = ""
     # Results
     emails_found: List[Dict] = field(default_factory=list)
     sources_checked: List[str] = field(default_factory=list)
+    lookup_ms: float = 0.0
 
 
 @dataclass  
@@ -58,12 +96,143 @@ class EmailResult:
     source: str
     confidence: str  # high, medium, low
     verified: bool = False
+    latency_ms: float = 0.0  # duration of the source call that found it
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+class SourceMetrics:
+    """
+    Per-source lookup metrics: call count, latency histogram, HTTP statuses,
+    hit rate, unique-find rate and quota spent.
+    
+    Each source call is appended to a JSONL file (if given) as soon as its
+    contact finishes; summary() aggregates the whole run.
+    """
+    
+    def __init__(self, jsonl_path: Optional[str] = None):
+        self.jsonl_path = jsonl_path
+        self._file = open(jsonl_path, 'a', encoding='utf-8') if jsonl_path else None
+        self.calls = Counter()
+        self.hits = Counter()
+        self.unique_hits = Counter()
+        self.requests = Counter()
+        self.quota = Counter()
+        self.statuses = defaultdict(Counter)
+        self.latencies = defaultdict(list)
+        self.throttle_ms = Counter()
+        
+    def record_contact(self, contact: 'Contact', calls: List[Dict]):
+        """Record every source call made for one contact."""
+        for call in calls:
+            source = call['source']
+            found = set(call['emails'])
+            others = set()
+            for other in calls:
+                if other is not call:
+                    others.update(other['emails'])
+            unique = found - others
+            statuses = Counter(str(code) for code in call['statuses'])
+            
+            self.calls[source] += 1
+            self.hits[source] += 1 if found else 0
+            self.unique_hits[source] += 1 if unique else 0
+            self.requests[source] += len(call['statuses'])
+            self.statuses[source].update(statuses)
+            self.latencies[source].append(call['latency_ms'])
+            self.throttle_ms[source] += call['throttle_ms']
+            if source in QUOTA_SOURCES:
+                self.quota[source] += sum(1 for code in call['statuses'] if 200 <= code < 300)
+            
+            if self._file:
+                self._file.write(json.dumps({
+                    'type': 'call',
+                    'ts': datetime.now().isoformat(timespec='seconds'),
+                    'contact': contact.name,
+                    'company': contact.company,
+                    'source': source,
+                    'latency_ms': round(call['latency_ms'], 1),
+                    'throttle_ms': round(call['throttle_ms'], 1),
+                    'requests': len(call['statuses']),
+                    'statuses': dict(statuses),
+                    'found': len(found),
+                    'unique': len(unique),
+                }) + '\n')
+        if self._file:
+            self._file.flush()
+            
+    def _histogram(self, latencies: List[float]) -> Dict[str, int]:
+        labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        histogram = dict.fromkeys(labels, 0)
+        for ms in latencies:
+            for bound, label in zip(LATENCY_BUCKETS_MS, labels):
+                if ms <= bound:
+                    histogram[label] += 1
+                    break
+            else:
+                histogram[labels[-1]] += 1
+        return histogram
+    
+    def summary(self) -> Dict[str, Dict]:
+        """Aggregate metrics per source."""
+        summary = {}
+        for source, calls in self.calls.items():
+            latencies = self.latencies[source]
+            summary[source] = {
+                'calls': calls,
+                'requests': self.requests[source],
+                'hit_rate': round(self.hits[source] / calls, 3),
+                'unique_find_rate': round(self.unique_hits[source] / calls, 3),
+                'latency_p50_ms': round(_percentile(latencies, 50), 1),
+                'latency_p95_ms': round(_percentile(latencies, 95), 1),
+                'total_seconds': round(sum(latencies) / 1000, 2),
+                'throttle_seconds': round(self.throttle_ms[source] / 1000, 2),
+                'latency_histogram': self._histogram(latencies),
+                'statuses': dict(self.statuses[source]),
+                'quota_spent': self.quota[source],
+            }
+        return summary
+    
+    def format_summary(self) -> str:
+        """Plain-text ROI table, slowest sources first."""
+        summary = self.summary()
+        lines = [
+            f"   {'Source':<12} {'Calls':>6} {'Hit%':>6} {'Uniq%':>6} {'p50ms':>8} {'p95ms':>8} {'Total s':>8} {'Quota':>6}"
+        ]
+        for source, row in sorted(summary.items(), key=lambda kv: -kv[1]['total_seconds']):
+            lines.append(
+                f"   {source:<12} {row['calls']:>6} {row['hit_rate'] * 100:>5.1f}% "
+                f"{row['unique_find_rate'] * 100:>5.1f}% {row['latency_p50_ms']:>8.0f} "
+                f"{row['latency_p95_ms']:>8.0f} {row['total_seconds']:>8.1f} {row['quota_spent']:>6}"
+            )
+        return '\n'.join(lines)
+    
+    def close(self):
+        """Append the run summary and close the JSONL file."""
+        if self._file:
+            self._file.write(json.dumps({
+                'type': 'summary',
+                'ts': datetime.now().isoformat(timespec='seconds'),
+                'sources': self.summary(),
+            }) + '\n')
+            self._file.close()
+            self._file = None
 
 
 class EmailFinder:
     """Multi-source email finder with rate limiting and caching."""
     
-    def __init__(self):
+    def __init__(self, endpoints: Optional[Dict[str, str]] = None,
+                 resolver: Optional[dns.resolver.Resolver] = None,
+                 smtp_port: int = 25,
+                 metrics: Optional[SourceMetrics] = None):
         self.hunter_key = os.getenv('HUNTER_API_KEY')
         self.apollo_key = os.getenv('APOLLO_API_KEY')
         self.rocketreach_key = os.getenv('ROCKETREACH_API_KEY')
@@ -85,6 +254,23 @@ class EmailFinder:
             'generic': 0.5
         }
         
+        # Endpoints and verification transport
+        self.endpoints = {**API_ENDPOINTS, **(endpoints or {})}
+        self.resolver = resolver
+        self.smtp_port = smtp_port
+        
+        # Instrumentation: HTTP statuses are attributed to the source call running
+        # on the requesting thread (crawl workers carry the website call with them)
+        self.metrics = metrics or SourceMetrics()
+        self._call_context = threading.local()
+        self.session.hooks['response'].append(self._record_response)
+        
+        # Website crawl state (shared across contacts)
+        self._crawl_pool = ThreadPoolExecutor(max_workers=CRAWL_MAX_WORKERS)
+        self._crawl_lock = threading.Lock()
+        self._host_slots = {}
+        self._robots_cache = {}
+        
         # Cache
         self.cache = {}
         
@@ -95,8 +281,40 @@ class EmailFinder:
         elapsed = time.time() - last_time
         if elapsed < limit:
             time.sleep(limit - elapsed)
+            call = self._active_call()
+            if call is not None:
+                call['throttle_ms'] += (limit - elapsed) * 1000
         self.last_request_time[source] = time.time()
 
+    def _active_call(self) -> Optional[Dict]:
+        """The source call being made on this thread, if any."""
+        return getattr(self._call_context, 'call', None)
+
+    def _record_response(self, response, *args, **kwargs):
+        """Session response hook: attribute the status code to the running source."""
+        call = self._active_call()
+        if call is not None:
+            call['statuses'].append(response.status_code)
+
+    def _run_source(self, source: str, search, contact: Contact, calls: List[Dict]) -> List['EmailResult']:
+        """Run one source search, timing it and collecting its outcome into calls."""
+        call = {'source': source, 'statuses': [], 'throttle_ms': 0.0, 'emails': []}
+        self._call_context.call = call
+        started = time.perf_counter()
+        try:
+            results = search(contact)
+        finally:
+            call['latency_ms'] = (time.perf_counter() - started) * 1000
+            self._call_context.call = None
+        call['emails'] = [r.email.lower() for r in results]
+        for result in results:
+            result.latency_ms = call['latency_ms']
+        contact.sources_checked.append(source)
+        # Sources that were skipped outright (no key, not applicable) cost nothing
+        if call['statuses'] or results:
+            calls.append(call)
+        return results
+
     def _get_company_domain(self, company: str) -> Optional[str]:
         """Try to find the company's domain."""
         # Common patterns
@@ -153,7 +371,7 @@ class EmailFinder:
         
         # Try email finder endpoint
         try:
-            url = "https://api.hunter.io/v2/email-finder"
+            url = self.endpoints['hunter']
             params = {
                 'domain': domain,
                 'first_name': first_name,
@@ -197,7 +415,7 @@ class EmailFinder:
         self._rate_limit('apollo')
         
         try:
-            url = "https://api.apollo.io/v1/people/match"
+            url = self.endpoints['apollo']
             headers = {
                 'Content-Type': 'application/json',
                 'Cache-Control': 'no-cache'
@@ -241,7 +459,7 @@ class EmailFinder:
         self._rate_limit('rocketreach')
         
         try:
-            url = "https://api.rocketreach.co/api/v2/person/lookup"
+            url = self.endpoints['rocketreach']
             headers = {
                 'Api-Key': self.rocketreach_key,
                 'Content-Type': 'application/json'
@@ -292,7 +510,7 @@ class EmailFinder:
         domain = self._get_company_domain(contact.company)
         
         try:
-            url = f"https://prospector.clearbit.com/v1/people/find"
+            url = self.endpoints['clearbit']
             params = {
                 'domain': domain,
                 'name': contact.name
@@ -333,33 +551,27 @@ class EmailFinder:
             f'"{contact.name}" contact',
         ]
         
-        email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
         found_emails = set()
+        matcher = NameMatcher(contact.name)
         
         for query in queries[:2]:  # Limit to 2 queries to avoid rate limits
             try:
                 self._rate_limit('google')
-                url = f"https://www.google.com/search?q={quote_plus(query)}"
-                resp = self.session.get(url, timeout=10)
-                
-                if resp.status_code == 200:
-                    # Extract emails from search results
-                    emails = email_pattern.findall(resp.text)
-                    for email in emails:
-                        # Filter out common false positives
-                        if not any(x in email.lower() for x in ['example.com', 'sentry.io', 'schema.org', 'w3.org']):
-                            found_emails.add(email.lower())
-                elif resp.status_code == 429:
-                    print("  [Google] Rate limited, skipping")
-                    break
+                url = f"{self.endpoints['google']}?q={quote_plus(query)}"
+                with self.session.get(url, timeout=10, stream=True) as resp:
+                    if resp.status_code == 200:
+                        # Scan the result page as a stream (junk domains filtered)
+                        found_emails.update(extract_from_response(resp, max_bytes=SEARCH_MAX_BYTES))
+                    elif resp.status_code == 429:
+                        print("  [Google] Rate limited, skipping")
+                        break
                     
             except Exception as e:
                 print(f"  [Google] Error: {e}")
                 
         for email in found_emails:
             # Try to match with person's name
-            name_parts = contact.name.lower().split()
-            if any(part in email for part in name_parts):
+            if matcher.matches(email):
                 results.append(EmailResult(
                     email=email,
                     source='google_search',
@@ -384,7 +596,7 @@ class EmailFinder:
         try:
             # Search GitHub users
             name_query = contact.name.replace(' ', '+')
-            url = f"https://api.github.com/search/users?q={name_query}"
+            url = f"{self.endpoints['github']}/search/users?q={name_query}"
             resp = self.session.get(url, timeout=10)
             
             if resp.status_code == 200:
@@ -393,7 +605,7 @@ class EmailFinder:
                     username = user.get('login')
                     if username:
                         self._rate_limit('github')
-                        user_url = f"https://api.github.com/users/{username}"
+                        user_url = f"{self.endpoints['github']}/users/{username}"
                         user_resp = self.session.get(user_url, timeout=10)
                         if user_resp.status_code == 200:
                             user_data = user_resp.json()
@@ -411,6 +623,132 @@ class EmailFinder:
             
         return results
 
+    # ========== WEBSITE CONTACT PAGES ==========
+    def _site_roots(self, contact: Contact) -> List[str]:
+        """Personal website first, then the company's site."""
+        roots = []
+        if contact.website:
+            url = contact.website if '://' in contact.website else f"https://{contact.website}"
+            parsed = urlparse(url)
+            if parsed.netloc:
+                roots.append(f"{parsed.scheme}://{parsed.netloc}")
+        domain = self._get_company_domain(contact.company) if contact.company else None
+        if domain:
+            root = self.endpoints['website'].format(host=domain)
+            if root not in roots:
+                roots.append(root)
+        return roots
+
+    def _host_slot(self, root: str) -> threading.BoundedSemaphore:
+        """Per-site semaphore limiting concurrent requests to CRAWL_PER_HOST."""
+        with self._crawl_lock:
+            if root not in self._host_slots:
+                self._host_slots[root] = threading.BoundedSemaphore(CRAWL_PER_HOST)
+            return self._host_slots[root]
+
+    def _open_page(self, url: str) -> Optional[requests.Response]:
+        """Start a streamed GET; returns the response only for 200 text/HTML pages."""
+        resp = self.session.get(url, stream=True, timeout=(3, 5), allow_redirects=True)
+        content_type = resp.headers.get('Content-Type', '')
+        if resp.status_code != 200 or (content_type and not any(t in content_type for t in ('html', 'text'))):
+            resp.close()
+            return None
+        return resp
+
+    def _robots_allows(self, root: str, url: str) -> bool:
+        """Check robots.txt for the site, fetching it once per site."""
+        with self._crawl_lock:
+            parser = self._robots_cache.get(root)
+        if parser is None:
+            parser = RobotFileParser()
+            lines = []
+            try:
+                resp = self._open_page(f"{root}/robots.txt")
+                if resp is not None:
+                    with resp:
+                        body = next(resp.iter_content(chunk_size=65536), b'')
+                    lines = body.decode('utf-8', errors='replace').splitlines()
+            except requests.RequestException:
+                pass
+            parser.parse(lines)
+            with self._crawl_lock:
+                self._robots_cache[root] = parser
+        return parser.can_fetch(self.session.headers.get('User-Agent', '*'), url)
+
+    def _crawl_page(
+        self, root: str, url: str, stop: threading.Event, deadline: float, call: Optional[Dict] = None
+    ) -> Set[str]:
+        """
+        Fetch one candidate page (if allowed) and return the addresses on it.
+        Responses are attributed to call, the website search that queued the
+        page, even if they arrive after it has returned.
+        """
+        if stop.is_set() or time.monotonic() > deadline:
+            return set()
+        self._call_context.call = call
+        try:
+            with self._host_slot(root):
+                if stop.is_set() or not self._robots_allows(root, url):
+                    return set()
+                # Fetching robots.txt can take a while; the search may be over
+                if stop.is_set():
+                    return set()
+                try:
+                    resp = self._open_page(url)
+                    if resp is None:
+                        return set()
+                    with resp:
+                        return extract_from_response(resp, max_bytes=CRAWL_MAX_BYTES, deadline=deadline)
+                except requests.RequestException:
+                    return set()
+        finally:
+            self._call_context.call = None
+
+    def search_website(self, contact: Contact) -> List[EmailResult]:
+        """Crawl likely contact/about/team pages on personal and company sites."""
+        results = []
+        roots = self._site_roots(contact)
+        if not roots:
+            return results
+            
+        stop = threading.Event()
+        deadline = time.monotonic() + CRAWL_BUDGET_SECONDS
+        call = self._active_call()
+        pending = {
+            self._crawl_pool.submit(self._crawl_page, root, f"{root}{path}", stop, deadline, call)
+            for root in roots for path in CONTACT_PAGE_PATHS
+        }
+        
+        matcher = NameMatcher(contact.name)
+        matched = set()
+        while pending and not matched:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    emails = future.result()
+                except Exception as e:
+                    print(f"  [Website] Error: {e}")
+                    continue
+                matched.update(e for e in emails if matcher.matches(e))
+        
+        # Early exit: stop queued pages once a name match is in hand
+        stop.set()
+        for future in pending:
+            future.cancel()
+            
+        for email in sorted(matched):
+            results.append(EmailResult(
+                email=email,
+                source='website',
+                confidence='medium'
+            ))
+            print(f"  [Website] Found: {email}")
+            
+        return results
+
     # ========== EMAIL PATTERN GENERATION ==========
     def generate_email_patterns(self, contact: Contact) -> List[EmailResult]:
         """Generate likely email patterns based on common corporate formats."""
@@ -461,12 +799,13 @@ class EmailFinder:
             domain = email.split('@')[1]
             
             # Get MX record
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            mx_host = str(mx_records[0].exchange)
+            resolver = self.resolver or dns.resolver
+            mx_records = resolver.resolve(domain, 'MX')
+            mx_host = str(mx_records[0].exchange).rstrip('.')
             
             # Connect to SMTP server
             server = smtplib.SMTP(timeout=10)
-            server.connect(mx_host)
+            server.connect(mx_host, self.smtp_port)
             server.helo('verify.com')
             server.mail('verify@verify.com')
             code, _ = server.rcpt(email)
@@ -484,19 +823,27 @@ class EmailFinder:
         print(f"Searching: {contact.name} @ {contact.company}")
         print('='*60)
         
+        started = time.perf_counter()
         all_results = []
+        calls = []
         
         # Run all searches
-        all_results.extend(self.search_hunter(contact))
-        all_results.extend(self.search_apollo(contact))
-        all_results.extend(self.search_rocketreach(contact))
-        all_results.extend(self.search_clearbit(contact))
-        all_results.extend(self.search_google(contact))
-        all_results.extend(self.search_github(contact))
+        all_results.extend(self._run_source('hunter', self.search_hunter, contact, calls))
+        all_results.extend(self._run_source('apollo', self.search_apollo, contact, calls))
+        all_results.extend(self._run_source('rocketreach', self.search_rocketreach, contact, calls))
+        all_results.extend(self._run_source('clearbit', self.search_clearbit, contact, calls))
+        all_results.extend(self._run_source('google', self.search_google, contact, calls))
+        all_results.extend(self._run_source('github', self.search_github, contact, calls))
+        
+        # Crawl websites only while nothing high-confidence has turned up
+        if not any(r.confidence == 'high' for r in all_results):
+            all_results.extend(self._run_source('website', self.search_website, contact, calls))
         
         # If no results from APIs, generate patterns
         if not any(r.confidence in ['high', 'medium'] for r in all_results):
-            all_results.extend(self.generate_email_patterns(contact))
+            all_results.extend(self._run_source('patterns', self.generate_email_patterns, contact, calls))
+        
+        self.metrics.record_contact(contact, calls)
         
         # Optional SMTP verification for top candidates
         if verify:
@@ -516,9 +863,11 @@ class EmailFinder:
                     'email': result.email,
                     'source': result.source,
                     'confidence': result.confidence,
-                    'verified': result.verified
+                    'verified': result.verified,
+                    'latency_ms': result.latency_ms
                 })
         
+        contact.lookup_ms = (time.perf_counter() - started) * 1000
         return contact
 
 
@@ -536,7 +885,8 @@ def load_contacts_csv(filepath: str) -> List[Contact]:
                     title=row.get('Title / Role', ''),
                     industry=row.get('Industry', ''),
                     linkedin_url=row.get('LinkedIn URL', ''),
-                    location=row.get('Location', '')
+                    location=row.get('Location', ''),
+                    website=row.get('Website', '') or row.get('LI_Website', '')
                 ))
     
     return contacts
@@ -582,9 +932,11 @@ def save_results_csv(contacts: List[Contact], filepath: str):
 def main():
     parser = argparse.ArgumentParser(description='Multi-source email finder')
     parser.add_argument('--input', '-i', required=True, help='Input CSV file with contacts')
-    parser.add_argument('--output', '-o', default='email_results.csv', help='Output CSV file')
+    parser.add_argument('--output', '-o', default='email_results.csv',
+                        help='Output file: .csv (top 3 emails), .jsonl (append-only, all candidates) or .parquet')
     parser.add_argument('--verify', '-v', action='store_true', help='Verify emails via SMTP')
     parser.add_argument('--limit', '-l', type=int, help='Limit number of contacts to process')
+    parser.add_argument('--metrics', '-m', help='Append per-source call metrics to this JSONL file')
     args = parser.parse_args()
     
     # Check for API keys
@@ -604,16 +956,42 @@ def main():
         contacts = contacts[:args.limit]
         print(f"   Processing first {args.limit} contacts")
     
+    # JSONL/Parquet outputs are appended per contact as lookups finish
+    output_ext = os.path.splitext(args.output)[1].lower()
+    if output_ext == '.parquet' and not PYARROW_AVAILABLE:
+        print("❌ Parquet output requires pyarrow. Install with: pip install pyarrow")
+        return
+    # A .jsonl output accumulates across runs; the Parquet sidecar is this run only
+    # (it is exported whole at the end, then removed)
+    jsonl_path = None
+    if output_ext == '.jsonl':
+        jsonl_path = args.output
+    elif output_ext == '.parquet':
+        jsonl_path = jsonl_sidecar_path(args.output)
+    writer = JsonlResultWriter(jsonl_path, truncate=output_ext == '.parquet') if jsonl_path else None
+    
     # Search for emails
-    finder = EmailFinder()
+    metrics = SourceMetrics(args.metrics)
+    finder = EmailFinder(metrics=metrics)
     
-    for i, contact in enumerate(contacts, 1):
-        print(f"\n[{i}/{len(contacts)}]", end="")
-        contact = finder.find_email(contact, verify=args.verify)
+    try:
+        for i, contact in enumerate(contacts, 1):
+            print(f"\n[{i}/{len(contacts)}]", end="")
+            contact = finder.find_email(contact, verify=args.verify)
+            if writer:
+                writer.write(contact)
+    finally:
+        if writer:
+            writer.close()
     
     # Save results
     print(f"\n\n💾 Saving results to: {args.output}")
-    save_results_csv(contacts, args.output)
+    if output_ext == '.parquet':
+        count = export_parquet(jsonl_path, args.output)
+        os.remove(jsonl_path)
+        print(f"   Exported {count} records")
+    elif not writer:
+        save_results_csv(contacts, args.output)
     
     # Summary
     found_count = sum(1 for c in contacts if any(e['confidence'] in ['high', 'medium'] for e in c.emails_found))
@@ -621,6 +999,13 @@ def main():
     print(f"   Total contacts: {len(contacts)}")
     print(f"   Emails found (high/medium confidence): {found_count}")
     print(f"   Success rate: {found_count/len(contacts)*100:.1f}%")
+    
+    # Per-source ROI
+    print(f"\n⏱  Source ROI (slowest first):")
+    print(metrics.format_summary())
+    metrics.close()
+    if args.metrics:
+        print(f"   Metrics written to: {args.metrics}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Email Finder Results I/O
+========================
+Append-only JSONL records for email_finder.py results, an optional Parquet
+export, and streaming readers for downstream stages (insert_generator.py).
+
+Unlike the "Email 1..3" CSV, every record keeps all candidates with their
+source, confidence, verification state and source latency.
+
+Record layout (one JSON object per line):
+    {"name": ..., "company": ..., "title": ..., "industry": ...,
+     "linkedin_url": ..., "location": ..., "website": ...,
+     "lookup_ms": 812.4, "found_at": "2026-01-01T12:00:00",
+     "sources_checked": ["hunter", "apollo", ...],
+     "candidates": [{"email": ..., "source": ..., "confidence": "high",
+                     "verified": false, "latency_ms": 120.5}, ...]}
+
+Parquet export needs pyarrow (pip install pyarrow).
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Lower sorts first when picking the best candidate
+CONFIDENCE_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+# Records per Parquet row group / read batch
+PARQUET_BATCH_SIZE = 10000
+
+
+def contact_record(contact) -> Dict:
+    """Build the JSONL record for an email_finder Contact."""
+    return {
+        'name': contact.name,
+        'company': contact.company,
+        'title': contact.title,
+        'industry': contact.industry,
+        'linkedin_url': contact.linkedin_url,
+        'location': contact.location,
+        'website': contact.website,
+        'lookup_ms': round(contact.lookup_ms, 1),
+        'found_at': datetime.now().isoformat(timespec='seconds'),
+        'sources_checked': list(contact.sources_checked),
+        'candidates': [
+            {
+                'email': e['email'],
+                'source': e['source'],
+                'confidence': e['confidence'],
+                'verified': bool(e.get('verified')),
+                'latency_ms': round(e.get('latency_ms', 0.0), 1),
+            }
+            for e in contact.emails_found
+        ],
+    }
+
+
+class JsonlResultWriter:
+    """
+    Append one record per contact as soon as its lookup finishes. An existing
+    file is kept (reruns add to it) unless truncate is set.
+    """
+
+    def __init__(self, path: str, truncate: bool = False):
+        self.path = path
+        self._file = open(path, 'w' if truncate else 'a', encoding='utf-8')
+        self.written = 0
+
+    def write(self, contact):
+        self._file.write(json.dumps(contact_record(contact)) + '\n')
+        self._file.flush()
+        self.written += 1
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'JsonlResultWriter':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def iter_results_jsonl(path: str) -> Iterator[Dict]:
+    """Stream records from a results JSONL file, skipping a torn last line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def _parquet_schema():
+    candidate = pa.struct([
+        ('email', pa.string()),
+        ('source', pa.string()),
+        ('confidence', pa.string()),
+        ('verified', pa.bool_()),
+        ('latency_ms', pa.float64()),
+    ])
+    return pa.schema([
+        ('name', pa.string()),
+        ('company', pa.string()),
+        ('title', pa.string()),
+        ('industry', pa.string()),
+        ('linkedin_url', pa.string()),
+        ('location', pa.string()),
+        ('website', pa.string()),
+        ('lookup_ms', pa.float64()),
+        ('found_at', pa.string()),
+        ('sources_checked', pa.list_(pa.string())),
+        ('candidates', pa.list_(candidate)),
+    ])
+
+
+def export_parquet(jsonl_path: str, parquet_path: str) -> int:
+    """Convert a results JSONL file to Parquet in bounded batches. Returns record count."""
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow not available. Install with: pip install pyarrow")
+
+    schema = _parquet_schema()
+    count = 0
+    batch = []
+    with pq.ParquetWriter(parquet_path, schema) as writer:
+        for record in iter_results_jsonl(jsonl_path):
+            batch.append({name: record.get(name) for name in schema.names})
+            if len(batch) >= PARQUET_BATCH_SIZE:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def iter_results_parquet(path: str) -> Iterator[Dict]:
+    """Stream records from a results Parquet file one batch at a time."""
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow not available. Install with: pip install pyarrow")
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=PARQUET_BATCH_SIZE):
+        yield from batch.to_pylist()
+
+
+def iter_results(path: str) -> Iterator[Dict]:
+    """Stream records from a .jsonl or .parquet results file."""
+    if path.endswith('.parquet'):
+        return iter_results_parquet(path)
+    return iter_results_jsonl(path)
+
+
+def best_candidate(record: Dict) -> Optional[Dict]:
+    """Verified first, then by confidence; None if there are no candidates."""
+    candidates = record.get('candidates') or []
+    if not candidates:
+        return None
+    return min(
+        candidates,
+        key=lambda c: (not c.get('verified'), CONFIDENCE_RANK.get(c.get('confidence'), 3)),
+    )
+
+
+def record_to_contact_row(record: Dict) -> Dict[str, str]:
+    """Map a results record to the input columns insert_generator.py expects."""
+    best = best_candidate(record) or {}
+    return {
+        'Name': record.get('name') or '',
+        'Company': record.get('company') or '',
+        'Title': record.get('title') or '',
+        'Email': best.get('email', ''),
+        'Email Confidence': (best.get('confidence') or '').upper(),
+        'Industry': record.get('industry') or '',
+        'LinkedIn URL': record.get('linkedin_url') or '',
+        'Location': record.get('location') or '',
+        'Website': record.get('website') or '',
+    }
+
+
+def jsonl_sidecar_path(parquet_path: str) -> str:
+    """
+    JSONL file streamed during a run whose final output is Parquet. Named
+    after the Parquet file so it never clashes with a .jsonl results file.
+    """
+    return parquet_path + '.partial.jsonl'
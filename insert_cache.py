@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Insert Cache - Persistent research cache for insert_generator.py.
+
+The research phase (web searches -> facts + sources) is the slow, expensive
+part of generating an insert. Its output is stored in a local SQLite file
+keyed by normalized name and company, so regenerating an insert (after a
+failed validation, a LOW result or a tone tweak) can reuse the facts with a
+generation-only call instead of searching again.
+
+Company-level research (what the company builds, recent news) is cached
+separately, keyed by normalized company, so people at the same employer share
+it.
+
+ResponseCache is content-addressed instead: full model responses keyed by a
+hash of the request (model, system prompt, messages, tools), so re-running an
+unchanged contact - after deleting the output CSV, or on another campaign
+branch - replays the stored response without an API call. It is bounded by
+size and evicts the least recently used responses first.
+
+Usage:
+    cache = ResearchCache("research_cache.db", ttl_days=30)
+    research = cache.get("Ada Lovelace", "Analytical Engines")
+    cache.put("Ada Lovelace", "Analytical Engines", facts, sources, "detailed")
+    company = cache.get_company("Analytical Engines")
+
+    responses = ResponseCache("response_cache.db", max_mb=200)
+    body = responses.get(params)
+    responses.put(params, response.model_dump(mode="json"))
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from typing import Callable, List, Optional
+
+DEFAULT_CACHE_FILE = "research_cache.db"
+DEFAULT_TTL_DAYS = 30
+
+DEFAULT_RESPONSE_CACHE_FILE = "response_cache.db"
+DEFAULT_RESPONSE_CACHE_MB = 200
+
+# Request fields that determine the response; anything else (metadata,
+# timeouts) doesn't change what the model is asked
+PROMPT_FIELDS = ("model", "system", "messages", "tools", "tool_choice", "max_tokens")
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# Legal suffixes ignored when matching companies ("Acme, Inc." == "Acme")
+COMPANY_SUFFIXES = frozenset({"inc", "llc", "ltd", "corp", "corporation", "co", "plc", "gmbh"})
+
+
+def normalize(value: str) -> str:
+    """Lower-case, punctuation and extra spacing removed."""
+    return _NON_WORD.sub(" ", (value or "").lower()).strip()
+
+
+def research_key(name: str, company: str) -> str:
+    """Normalized cache key: case, punctuation and spacing don't matter."""
+    return f"{normalize(name)}|{normalize(company)}"
+
+
+def company_key(company: str) -> str:
+    """Normalized company key; common suffixes (Inc, LLC, ...) are dropped."""
+    words = normalize(company).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def prompt_key(params: dict) -> str:
+    """SHA-256 of the fields of a Messages request that determine its response."""
+    request = {field: params.get(field) for field in PROMPT_FIELDS}
+    encoded = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResearchCache:
+    """SQLite-backed research cache with a TTL, safe to share between threads."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_FILE,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS research ("
+            " key TEXT PRIMARY KEY,"
+            " facts TEXT NOT NULL,"
+            " sources TEXT NOT NULL,"
+            " research_quality TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS company_research ("
+            " key TEXT PRIMARY KEY,"
+            " facts TEXT NOT NULL,"
+            " sources TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, name: str, company: str) -> Optional[dict]:
+        """Cached research (facts, sources, research_quality) or None if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT facts, sources, research_quality, created_at FROM research WHERE key = ?",
+                (research_key(name, company),),
+            ).fetchone()
+            if row is None or self.clock() - row[3] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return {
+            "facts": json.loads(row[0]),
+            "sources": json.loads(row[1]),
+            "research_quality": row[2],
+        }
+
+    def put(
+        self,
+        name: str,
+        company: str,
+        facts: List[str],
+        sources: List[str],
+        research_quality: str,
+    ):
+        """Store (or replace) the research for a contact."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO research VALUES (?, ?, ?, ?, ?)",
+                (
+                    research_key(name, company),
+                    json.dumps(facts),
+                    json.dumps(sources),
+                    research_quality,
+                    self.clock(),
+                ),
+            )
+            self._conn.commit()
+
+    def get_company(self, company: str) -> Optional[dict]:
+        """Cached company research (facts, sources) or None if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT facts, sources, created_at FROM company_research WHERE key = ?",
+                (company_key(company),),
+            ).fetchone()
+        if row is None or self.clock() - row[2] > self.ttl_seconds:
+            return None
+        return {"facts": json.loads(row[0]), "sources": json.loads(row[1])}
+
+    def put_company(self, company: str, facts: List[str], sources: List[str]):
+        """Store (or replace) the research for a company."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO company_research VALUES (?, ?, ?, ?)",
+                (company_key(company), json.dumps(facts), json.dumps(sources), self.clock()),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns the number removed."""
+        with self._lock:
+            cutoff = self.clock() - self.ttl_seconds
+            removed = 0
+            for table in ("research", "company_research"):
+                cursor = self._conn.execute(
+                    f"DELETE FROM {table} WHERE created_at < ?", (cutoff,)
+                )
+                removed += cursor.rowcount
+            self._conn.commit()
+            return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """SQLite-backed, size-bounded LRU cache of full responses, keyed by prompt_key."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_RESPONSE_CACHE_FILE,
+        max_mb: float = DEFAULT_RESPONSE_CACHE_MB,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " body TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._conn.commit()
+
+    def get(self, params: dict) -> Optional[dict]:
+        """The stored response body for this request, or None."""
+        key = prompt_key(params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (self.clock(), key)
+            )
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def contains(self, params: dict) -> bool:
+        """True if a response is stored for this request (not counted as a hit)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM responses WHERE key = ?", (prompt_key(params),)
+            ).fetchone()
+        return row is not None
+
+    def put(self, params: dict, body: dict):
+        """Store a response body, then evict least recently used ones over max_mb."""
+        encoded = json.dumps(body, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (prompt_key(params), encoded, len(encoded), self.clock()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def discard(self, params: dict):
+        """Forget a stored response (e.g. one that turned out to be unusable)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (prompt_key(params),))
+            self._conn.commit()
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used, rowid"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -9,6 +9,7 @@ Usage:
     python3 insert_generator.py -i contacts.csv -o output.csv
     python3 insert_generator.py -i contacts.csv -o output.csv --model haiku
     python3 insert_generator.py -i contacts.csv -o output.csv --delay 2.0
+    python3 insert_generator.py -i contacts.csv -o output.csv --workers 4 --rpm 50 --tpm 80000
 """
 
 import argparse
@@ -18,15 +19,54 @@ import logging
 import os
 import re
 import subprocess
+import threading
 import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Callable, Iterator, Optional
 
 import anthropic
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 
+from checkpoint import DEFAULT_FLUSH_EVERY, DEFAULT_FSYNC_INTERVAL, CheckpointWriter
+from contact_scheduler import DEFAULT_PRIORITY, RunBudget, order_contacts, parse_priority
+from insert_cache import (
+    DEFAULT_CACHE_FILE,
+    DEFAULT_RESPONSE_CACHE_FILE,
+    DEFAULT_RESPONSE_CACHE_MB,
+    DEFAULT_TTL_DAYS,
+    ResearchCache,
+    ResponseCache,
+    company_key,
+)
+from insert_telemetry import (
+    DEFAULT_TELEMETRY_FILE,
+    TelemetryWriter,
+    build_report,
+    call_cost,
+    company_event,
+    format_report,
+    generation_event,
+    load_events,
+)
+from insert_validator import BANNED_PHRASES, check_partial, validate_insert
+from rate_governor import RequestGovernor, retry_after_seconds
+from sheet_writer import (
+    DEFAULT_BATCH_ROWS,
+    DEFAULT_FLUSH_SECONDS,
+    DEFAULT_QUEUE_ROWS,
+    BackgroundSheetWriter,
+    SheetAppender,
+    load_synced,
+    sheet_row_values,
+    synced_path,
+)
+
 # Configuration
 CONFIG_FILE = "outlook_config.json"
 CREDENTIALS_FILE = "credentials/google_sheets_key.json"
@@ -40,27 +80,124 @@ MODELS = {
     "opus": "claude-opus-4-20250514",
 }
 
-# Required input columns
-REQUIRED_COLUMNS = ["Name", "Company", "Email", "Title"]
+# --model cascade: try tiers in order, escalating only on a failed or minimal result
+DEFAULT_CASCADE_TIERS = ["haiku", "sonnet"]
+
+# Retries after a rate-limit (or transient server/connection) error; each waits
+# out the retry-after through the shared governor rather than sleeping per
+# worker. The SDK's own retries are off (max_retries=0) so none bypass it.
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Client tool the model calls with its final answer, so the response is
+# structured instead of JSON embedded in prose
+RECORD_INSERT_TOOL = {
+    "name": "record_insert",
+    "description": "Record the personalized insert and the research behind it.",
+    "input_schema": {
+        "type": "object",
+        # Research first, insert after it: a streamed insert is checked as it is
+        # written and cut off at the first broken rule, and the research is
+        # already complete for repairing it. Only word_count trails the insert
+        "properties": {
+            "facts": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Specific, verifiable facts the research found.",
+            },
+            "sources": {"type": "array", "items": {"type": "string"}},
+            "research_quality": {
+                "type": "string",
+                "enum": ["detailed", "basic", "minimal"],
+            },
+            "insert": {
+                "type": "string",
+                "description": "The 15-25 word personalized sentence.",
+            },
+            "word_count": {"type": "integer"},
+        },
+        "required": ["insert", "sources", "research_quality"],
+    },
+}
+
+# Company research shared by every contact at the same employer
+RECORD_COMPANY_TOOL = {
+    "name": "record_company",
+    "description": "Record what was learned about the company.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "facts": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "What the company builds, recent news, notable milestones.",
+            },
+            "sources": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["facts", "sources"],
+    },
+}
 
-# Banned phrases for insert validation
-BANNED_PHRASES = [
-    "i came across",
-    "i noticed",
-    "your remarkable",
-    "your impressive",
-    "your incredible",
-    "i would be honored",
-    "i am deeply interested",
-    "your journey",
-    "your path inspires",
-    "as someone who",
-    "i believe that",
-    "resonates with me",
-    "i am passionate about",
-    "aligns with my interests",
+# Web searches per call: a full person + company search, the company-only pass,
+# and the person-only pass layered on shared company research
+MAX_SEARCHES = 5
+COMPANY_MAX_SEARCHES = 3
+PERSON_MAX_SEARCHES = 2
+
+# linkedin_scraper.py columns passed to the model as pre-gathered context
+LINKEDIN_COLUMNS = {
+    "LI_Headline": "Headline",
+    "LI_Location": "Location",
+    "LI_Website": "Website",
+    "LI_About": "About",
+}
+
+# A headline plus an About section at least this long is enough to write an
+# insert without searching
+ABOUT_ENOUGH_CHARS = 200
+
+# How each response was parsed: the record_insert tool call, JSON recovered
+# from text, or not at all (generic fallback insert)
+PARSE_METHODS = ["tool", "text", "failed"]
+
+# Token counts tracked per call; cache_* show how much of the prompt prefix was
+# written to / read from the prompt cache
+USAGE_FIELDS = [
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+    "web_search_requests",  # from usage.server_tool_use
 ]
 
+# Follow-up turns allowed to fix an insert that fails validate_insert
+DEFAULT_MAX_REPAIRS = 2
+
+# Message Batches mode (--batch)
+BATCH_POLL_SECONDS = 30
+MAX_BATCH_REQUESTS = 10000  # contacts per batch; the rest go in the next run
+
+# A complete "insert" string value in partially streamed JSON
+INSERT_VALUE = re.compile(r'"insert"\s*:\s*"((?:[^"\\]|\\.)*)"')
+# The start of an "insert" value
+INSERT_KEY = re.compile(r'"insert"\s*:\s*"')
+
+# Output CSV columns (the checkpoint)
+OUTPUT_FIELDS = [
+    "Campaign",
+    "Name",
+    "Email",
+    "Email Confidence",
+    "Company",
+    "Title",
+    "Personalized Insert",
+    "Word Count",
+    "Insert Confidence",
+    "Sources",
+]
+
+# Required input columns
+REQUIRED_COLUMNS = ["Name", "Company", "Email", "Title"]
+
 
 def setup_logging():
     """Configure logging to file and console."""
@@ -132,6 +269,15 @@ def load_input_csv(filepath: str) -> list[dict]:
     return contacts
 
 
+def load_input_contacts(filepath: str) -> list[dict]:
+    """Load contacts from CSV, or stream them from email_finder .jsonl/.parquet results."""
+    if filepath.endswith((".jsonl", ".parquet")):
+        from finder_results import iter_results, record_to_contact_row
+
+        return [record_to_contact_row(record) for record in iter_results(filepath)]
+    return load_input_csv(filepath)
+
+
 def validate_required_columns(contact: dict) -> tuple[bool, str]:
     """Check if contact has all required columns with values."""
     for col in REQUIRED_COLUMNS:
@@ -174,35 +320,6 @@ def is_already_processed(contact: dict, processed: set[str]) -> bool:
     return False
 
 
-def validate_insert(insert: str) -> tuple[bool, list[str]]:
-    """Validate insert against rules. Returns (is_valid, list of issues)."""
-    issues = []
-
-    # Word count check
-    words = insert.split()
-    word_count = len(words)
-    if word_count < 15:
-        issues.append(f"Too short: {word_count} words (need 15-25)")
-    elif word_count > 25:
-        issues.append(f"Too long: {word_count} words (need 15-25)")
-
-    # Punctuation check
-    if not insert.strip().endswith((".", "!", "?")):
-        issues.append("Missing ending punctuation (. ! ?)")
-
-    # Banned phrases check
-    insert_lower = insert.lower()
-    for phrase in BANNED_PHRASES:
-        if phrase in insert_lower:
-            issues.append(f"Contains banned phrase: '{phrase}'")
-
-    # Em dash check
-    if "—" in insert:
-        issues.append("Contains em dash (use 'and' instead)")
-
-    return len(issues) == 0, issues
-
-
 def assign_confidence(
     insert: str, sources: list[str], research_quality: str
 ) -> str:
@@ -225,35 +342,59 @@ def assign_confidence(
     return "MEDIUM"
 
 
-def research_and_generate_insert(
-    client: anthropic.Anthropic,
-    contact: dict,
-    prompt_rules: str,
-    model: str,
-) -> dict:
+def response_usage(response) -> dict:
+    """Token counts reported by an API response (missing counts are 0)."""
+    usage = getattr(response, "usage", None)
+    counts = {}
+    for attr in USAGE_FIELDS:
+        source = getattr(usage, "server_tool_use", None) if attr == "web_search_requests" else usage
+        value = getattr(source, attr, 0)
+        counts[attr] = value if isinstance(value, int) else 0
+    return counts
+
+
+def response_tokens(response) -> int:
+    """Input + output tokens reported by an API response (0 if unavailable)."""
+    usage = response_usage(response)
+    return usage["input_tokens"] + usage["output_tokens"]
+
+
+def fallback_result(company: str) -> dict:
+    """Generic LOW-confidence insert used when research or parsing fails."""
+    return {
+        "insert": f"I've been thinking a lot about {company}'s work and would love to learn from your experience.",
+        "word_count": 17,
+        "confidence": "LOW",
+        "sources": [],
+    }
+
+
+@lru_cache(maxsize=8)
+def build_system_prompt(prompt_rules: str) -> str:
     """
-    Research contact and generate personalized insert using Claude API with web search.
-    Returns dict with: insert, word_count, confidence, sources
+    The contact-independent system prompt (rules, JSON schema, fallback).
+    Built once per set of rules; it is sent as a cached prefix on every call.
     """
-    name = contact.get("Name", "")
-    company = contact.get("Company", "")
-    title = contact.get("Title", "")
-
-    system_prompt = f"""You are helping write personalized email inserts for cold outreach.
+    return f"""You are helping write personalized email inserts for cold outreach.
 
 {prompt_rules}
 
 Your task:
 1. Research the person using web search to find accurate, current information
 2. Generate ONE personalized insert sentence (15-25 words exactly)
-3. Return your response in this exact JSON format:
+3. Record your answer by calling the record_insert tool with these fields
+   (if you cannot call it, reply with exactly this JSON object instead):
 {{
-    "insert": "Your 15-25 word sentence here.",
-    "word_count": 22,
+    "facts": ["Specific fact found about the person", "Another fact"],
     "sources": ["Source 1", "Source 2"],
-    "research_quality": "detailed|basic|minimal"
+    "research_quality": "detailed|basic|minimal",
+    "insert": "Your 15-25 word sentence here.",
+    "word_count": 22
 }}
 
+facts: the specific, verifiable facts your research found (they are saved and
+reused to write new inserts later without searching again).
+
 research_quality meanings:
 - "detailed": Found multiple sources with specific facts about the person
 - "basic": Found some info from one source
@@ -264,111 +405,1128 @@ If you can't find much info, use this fallback pattern:
 
 CRITICAL: The insert MUST be 15-25 words. Count carefully before responding."""
 
+
+def linkedin_context(contact: dict) -> dict:
+    """Non-empty LinkedIn enrichment fields for a contact, keyed by label."""
+    return {
+        label: contact[column].strip()
+        for column, label in LINKEDIN_COLUMNS.items()
+        if (contact.get(column) or "").strip()
+    }
+
+
+def search_budget(profile: dict, max_uses: int = MAX_SEARCHES) -> int:
+    """
+    Web searches to allow given what LinkedIn already told us: none when the
+    headline and About text are enough, fewer the more is known, never more
+    than max_uses.
+    """
+    headline = profile.get("Headline", "")
+    about = profile.get("About", "")
+    if headline and len(about) >= ABOUT_ENOUGH_CHARS:
+        return 0
+    budget = MAX_SEARCHES
+    if headline:
+        budget -= 2
+    if about:
+        budget -= 1
+    if profile.get("Website"):
+        budget -= 1
+    return min(max_uses, max(1, budget))
+
+
+def build_insert_request(
+    contact: dict,
+    prompt_rules: str,
+    model: str,
+    company_research: Optional[dict] = None,
+) -> dict:
+    """
+    Messages API parameters for one contact (shared by live and batch mode).
+    The system prompt is identical for every contact and marked as a
+    cacheable prefix; only the user message varies. With shared company
+    research, it is passed as context and the search budget is reduced to
+    person-specific searches. LinkedIn enrichment columns are passed as
+    context too and shrink the budget further (see search_budget); with no
+    searches left the web search tool is left out entirely.
+    """
+    name = contact.get("Name", "")
+    company = contact.get("Company", "")
+    title = contact.get("Title", "")
+
     user_message = f"""Research and generate a personalized insert for:
 Name: {name}
 Company: {company}
 Title: {title}
 
 Use web search to find current information about this person, then generate an insert."""
+    max_uses = MAX_SEARCHES
+    if company_research:
+        facts = "\n".join(f"- {fact}" for fact in company_research["facts"]) or "- (none found)"
+        user_message += f"""
+
+{company} has already been researched. Don't search for company background;
+only search for things specific to {name}. Company facts:
+{facts}
+Company sources: {", ".join(company_research["sources"]) or "none"}"""
+        max_uses = PERSON_MAX_SEARCHES
+
+    profile = linkedin_context(contact)
+    if profile:
+        max_uses = search_budget(profile, max_uses)
+        details = "\n".join(f"{label}: {value}" for label, value in profile.items())
+        user_message += f"""
+
+From their LinkedIn profile (already gathered; count it as a source, "LinkedIn"):
+{details}"""
+        if max_uses == 0:
+            user_message += "\n\nThis is enough to write the insert. Do NOT search."
+        else:
+            user_message += f"\n\nOnly search for what this doesn't cover (at most {max_uses} searches)."
+
+    params = {
+        "model": model,
+        "max_tokens": 1024,
+        "system": [
+            {
+                "type": "text",
+                "text": build_system_prompt(prompt_rules),
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "tools": [
+            {
+                "type": "web_search_20250305",
+                "name": "web_search",
+                "max_uses": max_uses,
+            },
+            RECORD_INSERT_TOOL,
+        ],
+        "messages": [{"role": "user", "content": user_message}],
+    }
+    if max_uses == 0:
+        params["tools"] = [RECORD_INSERT_TOOL]
+        params["tool_choice"] = {"type": "tool", "name": RECORD_INSERT_TOOL["name"]}
+    return params
 
-    try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=1024,
-            system=system_prompt,
-            tools=[
-                {
-                    "type": "web_search_20250305",
-                    "name": "web_search",
-                    "max_uses": 5,
-                }
-            ],
-            messages=[{"role": "user", "content": user_message}],
-        )
 
-        # Extract text response
-        text_content = ""
-        for block in response.content:
-            if hasattr(block, "text"):
-                text_content += block.text
-
-        # Parse JSON from response
-        json_match = re.search(r"\{[\s\S]*\}", text_content)
-        if json_match:
-            result = json.loads(json_match.group())
-            insert = result.get("insert", "")
-            sources = result.get("sources", [])
-            research_quality = result.get("research_quality", "minimal")
-
-            # Validate and assign confidence
-            word_count = len(insert.split())
-            confidence = assign_confidence(insert, sources, research_quality)
-
-            return {
-                "insert": insert,
-                "word_count": word_count,
-                "confidence": confidence,
-                "sources": sources,
+def build_generation_request(
+    contact: dict, research: dict, prompt_rules: str, model: str
+) -> dict:
+    """
+    Generation-only parameters for a contact with cached research: same cached
+    system prompt, no web search tool, facts passed in the user message. The
+    record_insert tool call is forced since there is nothing to search first.
+    """
+    facts = "\n".join(f"- {fact}" for fact in research["facts"]) or "- (none found)"
+    user_message = f"""Research for this person has already been done. Do NOT search again.
+Write a new personalized insert using only these facts:
+Name: {contact.get("Name", "")}
+Company: {contact.get("Company", "")}
+Title: {contact.get("Title", "")}
+
+Facts:
+{facts}
+
+Sources: {", ".join(research["sources"]) or "none"}
+Research quality: {research["research_quality"]}"""
+    profile = linkedin_context(contact)
+    if profile:
+        details = "\n".join(f"{label}: {value}" for label, value in profile.items())
+        user_message += f"\n\nFrom their LinkedIn profile:\n{details}"
+
+    return {
+        "model": model,
+        "max_tokens": 512,
+        "system": [
+            {
+                "type": "text",
+                "text": build_system_prompt(prompt_rules),
+                "cache_control": {"type": "ephemeral"},
             }
+        ],
+        "tools": [RECORD_INSERT_TOOL],
+        "tool_choice": {"type": "tool", "name": RECORD_INSERT_TOOL["name"]},
+        "messages": [{"role": "user", "content": user_message}],
+    }
+
+
+def build_company_request(company: str, model: str) -> dict:
+    """Parameters for the one-off company research call."""
+    return {
+        "model": model,
+        "max_tokens": 1024,
+        "system": "You research companies for personalized cold outreach. "
+        "Find what the company builds or does, and any recent news or milestones. "
+        "Finish by calling the record_company tool.",
+        "tools": [
+            {
+                "type": "web_search_20250305",
+                "name": "web_search",
+                "max_uses": COMPANY_MAX_SEARCHES,
+            },
+            RECORD_COMPANY_TOOL,
+        ],
+        "messages": [{"role": "user", "content": f"Research this company: {company}"}],
+    }
+
+
+class CompanyResearch:
+    """
+    Company facts shared by contacts at the same employer. Each company is
+    researched at most once (concurrent workers wait for the first), and only
+    companies with 2+ pending contacts are worth a separate call. Research
+    calls are recorded to telemetry, and their usage and cost accumulate until
+    main() collects them with take_spend().
+    """
+
+    def __init__(
+        self,
+        companies: list,
+        cache: Optional[ResearchCache] = None,
+        telemetry: Optional[TelemetryWriter] = None,
+    ):
+        counts = Counter(company_key(company) for company in companies)
+        self.shared = {key for key, count in counts.items() if count >= 2 and key}
+        self.cache = cache
+        self.telemetry = telemetry
+        self.researched = 0
+        self.reused = 0
+        self._results = {}
+        self._locks = {key: threading.Lock() for key in self.shared}
+        self._stats_lock = threading.Lock()
+        self._usage = dict.fromkeys(USAGE_FIELDS, 0)
+        self._cost = 0.0
+
+    def is_shared(self, company: str) -> bool:
+        return company_key(company) in self.shared
+
+    def is_known(self, company: str) -> bool:
+        """True if get() can answer for the company without a research call."""
+        key = company_key(company)
+        if key not in self.shared or key in self._results:
+            return True
+        return bool(self.cache) and self.cache.get_company(company) is not None
+
+    def get(
+        self,
+        client: anthropic.Anthropic,
+        company: str,
+        model: str,
+        governor: Optional[RequestGovernor] = None,
+    ) -> Optional[dict]:
+        """Company facts/sources for a shared company (None if not shared or research failed)."""
+        key = company_key(company)
+        if key not in self.shared:
+            return None
+        with self._locks[key]:
+            if key not in self._results:
+                research = self.cache.get_company(company) if self.cache else None
+                if research is None:
+                    try:
+                        research = self._research(client, company, model, governor)
+                    except Exception as e:
+                        # Still failing after retries: the next colleague tries again
+                        logger.warning(f"{company} | Company research failed: {e}")
+                        return None
+                    if research and self.cache:
+                        self.cache.put_company(company, research["facts"], research["sources"])
+                    with self._stats_lock:
+                        self.researched += 1
+                self._results[key] = research
+            else:
+                with self._stats_lock:
+                    self.reused += 1
+            return self._results[key]
+
+    def take_spend(self) -> tuple[dict, float]:
+        """Usage and cost of research calls since the last take_spend()."""
+        with self._stats_lock:
+            spend = self._usage, self._cost
+            self._usage = dict.fromkeys(USAGE_FIELDS, 0)
+            self._cost = 0.0
+        return spend
+
+    def _record(self, company, model, usage, latency, error=None):
+        with self._stats_lock:
+            self._usage = add_usage(self._usage, usage)
+            self._cost += call_cost(model, usage)
+        if self.telemetry:
+            self.telemetry.record(company_event(company, model, usage, latency, error))
+
+    def _research(self, client, company, model, governor) -> Optional[dict]:
+        """
+        One research call, retrying transient errors through the governor.
+        Raises if they persist; any other failure returns None, which get()
+        keeps for the rest of the run.
+        """
+        governor = governor or RequestGovernor()
+
+        def create():
+            slot = governor.acquire()
+            response = client.messages.create(**build_company_request(company, model))
+            governor.record(slot, response_tokens(response))
+            return response
+
+        started = time.monotonic()
+        try:
+            response = call_with_retries(create, governor, company)
+        except Exception as e:
+            self._record(company, model, {}, time.monotonic() - started, "Company research failed")
+            if is_transient_error(e):
+                raise
+            logger.warning(f"{company} | Company research failed: {e}")
+            return None
+        self._record(company, model, response_usage(response), time.monotonic() - started)
+        for block in response.content:
+            if (
+                getattr(block, "type", None) == "tool_use"
+                and getattr(block, "name", None) == RECORD_COMPANY_TOOL["name"]
+                and isinstance(getattr(block, "input", None), dict)
+            ):
+                return {
+                    "facts": block.input.get("facts", []),
+                    "sources": block.input.get("sources", []),
+                }
+        logger.warning(f"{company} | Company research returned no record_company call")
+        return None
+
+
+def extract_insert_fields(response) -> tuple[Optional[dict], str]:
+    """
+    Pull the answer fields out of a response. Returns (fields, parse_method).
+    Prefers the record_insert tool call; otherwise scans the text for the last
+    JSON object with an "insert" key, tolerating prose and stray braces.
+    """
+    text_content = ""
+    for block in response.content:
+        if (
+            getattr(block, "type", None) == "tool_use"
+            and getattr(block, "name", None) == RECORD_INSERT_TOOL["name"]
+            and isinstance(getattr(block, "input", None), dict)
+        ):
+            return block.input, "tool"
+        text = getattr(block, "text", None)
+        if isinstance(text, str):
+            text_content += text
+
+    decoder = json.JSONDecoder()
+    found = None
+    pos = text_content.find("{")
+    while pos != -1:
+        try:
+            value, end = decoder.raw_decode(text_content, pos)
+        except json.JSONDecodeError:
+            pos = text_content.find("{", pos + 1)
+            continue
+        if isinstance(value, dict) and "insert" in value:
+            found = value
+        pos = text_content.find("{", end)
+    return found, "text" if found else "failed"
+
+
+def parse_insert_response(response, contact: dict, research: Optional[dict] = None) -> dict:
+    """
+    Turn a Messages API response into an insert result.
+    Returns dict with: insert, word_count, confidence, sources, facts,
+    research_quality, usage, parse_method. With cached research, its sources and quality
+    are used instead of whatever the model echoes back.
+    """
+    result, parse_method = extract_insert_fields(response)
+    if result:
+        if research:
+            result.update(research)
+        insert = result.get("insert", "")
+        sources = result.get("sources", [])
+        facts = result.get("facts", [])
+        research_quality = result.get("research_quality", "minimal")
+
+        # Validate and assign confidence
+        word_count = len(insert.split())
+        confidence = assign_confidence(insert, sources, research_quality)
 
-        # Fallback if JSON parsing fails
-        logger.warning(f"Could not parse JSON from response for {name}")
         return {
-            "insert": f"I've been thinking a lot about {company}'s work and would love to learn from your experience.",
-            "word_count": 17,
-            "confidence": "LOW",
-            "sources": [],
+            "insert": insert,
+            "word_count": word_count,
+            "confidence": confidence,
+            "sources": sources,
+            "facts": facts,
+            "research_quality": research_quality,
+            "usage": response_usage(response),
+            "parse_method": parse_method,
         }
 
-    except anthropic.RateLimitError:
-        logger.error(f"Rate limit hit for {name}, waiting...")
-        raise
+    # Fallback if no answer could be parsed
+    logger.warning(f"Could not parse insert from response for {contact.get('Name', '')}")
+    result = fallback_result(contact.get("Company", ""))
+    result["usage"] = response_usage(response)
+    result["parse_method"] = parse_method
+    return result
+
+
+def add_usage(total: dict, usage: dict) -> dict:
+    """Sum two token usage dicts."""
+    return {field: total.get(field, 0) + usage.get(field, 0) for field in USAGE_FIELDS}
+
+
+def completed_insert(buffer: str) -> Optional[tuple[str, int, int]]:
+    """
+    Find a fully streamed "insert" value in partial JSON.
+    Returns (insert, start of its object, end of the value) or None.
+    """
+    match = INSERT_VALUE.search(buffer)
+    if not match:
+        return None
+    try:
+        insert = json.loads(f'"{match.group(1)}"')
+    except json.JSONDecodeError:
+        return None
+    return insert, max(buffer.rfind("{", 0, match.start()), 0), match.end()
+
+
+def partial_insert(buffer: str) -> Optional[str]:
+    """The part of an "insert" value streamed so far (None before it starts)."""
+    match = INSERT_KEY.search(buffer)
+    if not match:
+        return None
+    raw = buffer[match.end():]
+    for cut in range(6):  # A chunk can end partway through an escape (up to \uXXXX)
+        try:
+            return json.loads(f'"{raw[:len(raw) - cut]}"')
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+def streamed_fields(buffer: str, insert: str) -> dict:
+    """The fields streamed before the "insert" key (the research), plus insert."""
+    key = INSERT_KEY.search(buffer)
+    start = max(buffer.rfind("{", 0, key.start()), 0)
+    try:
+        fields = json.loads(buffer[start:key.start()].rstrip(", \n\t") + "}")
+    except json.JSONDecodeError:
+        fields = {}
+    if not isinstance(fields, dict):
+        fields = {}
+    fields["insert"] = insert
+    return fields
+
+
+def stream_insert_response(client: anthropic.Anthropic, params: dict, contact: dict):
+    """
+    Stream a call, logging SEARCHING / WRITING as the model gets there.
+    The insert is checked as it is written (check_partial: too long, banned
+    phrase, em dash) and validated in full once complete. At the first broken
+    rule the stream is closed (no more output is generated) and the research
+    streamed before the insert is returned as a partial response for
+    repair_insert. Returns (response, aborted).
+    """
+    name = contact.get("Name", "")
+    buffers = {"tool": "", "text": ""}
+    record_index = None
+    stage = None
+
+    def progress(new_stage):
+        nonlocal stage
+        if new_stage != stage:
+            stage = new_stage
+            logger.info(f"{name} | {stage.upper()}")
+
+    with client.messages.stream(**params) as stream:
+        for event in stream:
+            if event.type == "content_block_start":
+                block = event.content_block
+                if block.type == "server_tool_use":
+                    progress("searching")
+                elif block.type == "tool_use" and block.name == RECORD_INSERT_TOOL["name"]:
+                    record_index = event.index
+                    progress("writing")
+                continue
+            if event.type != "content_block_delta":
+                continue
+
+            if event.delta.type == "input_json_delta" and event.index == record_index:
+                kind = "tool"
+                buffers[kind] += event.delta.partial_json
+            elif event.delta.type == "text_delta":
+                kind = "text"
+                buffers[kind] += event.delta.text
+            else:
+                continue
+
+            found = completed_insert(buffers[kind])
+            if found:
+                insert = found[0]
+                issues = validate_insert(insert)[1]
+            else:
+                insert = partial_insert(buffers[kind])
+                if insert is None:
+                    continue
+                issues = [issue.message for issue in check_partial(insert)]
+            if kind == "text":
+                progress("writing")
+            if not issues:
+                if found:
+                    buffers[kind] = ""  # Checked; let the rest stream in
+                continue
+
+            logger.info(f"{name} | ABORTED | insert failed validation: {'; '.join(issues)}")
+            fields = streamed_fields(buffers[kind], insert)
+            partial = SimpleNamespace(
+                content=[
+                    SimpleNamespace(
+                        type="tool_use", name=RECORD_INSERT_TOOL["name"], input=fields
+                    )
+                ],
+                usage=getattr(stream.current_message_snapshot, "usage", None),
+            )
+            return partial, True
+
+        return stream.get_final_message(), False
+
+
+def cached_response(responses: ResponseCache, params: dict) -> Optional[anthropic.types.Message]:
+    """A stored response for this exact request, with zero usage (replaying costs nothing)."""
+    body = responses.get(params)
+    if body is None:
+        return None
+    body["usage"] = {"input_tokens": 0, "output_tokens": 0}
+    try:
+        return anthropic.types.Message.model_validate(body)
+    except ValueError as e:
+        logger.warning(f"Ignoring unreadable cached response: {e}")
+        responses.discard(params)
+        return None
+
+
+def create_message(
+    client: anthropic.Anthropic,
+    params: dict,
+    governor: Optional[RequestGovernor] = None,
+    responses: Optional[ResponseCache] = None,
+    refresh: bool = False,
+    stream_contact: Optional[dict] = None,
+) -> tuple:
+    """
+    One Messages call through the governor and the response cache.
+    Returns (response, from_cache, aborted). An identical earlier request is
+    replayed without an API call unless refresh; new responses are stored.
+    With stream_contact the call is streamed (stream_insert_response); aborted
+    partial responses are never cached.
+    """
+    if responses and not refresh:
+        response = cached_response(responses, params)
+        if response is not None:
+            return response, True, False
+
+    slot = governor.acquire() if governor else None
+    aborted = False
+    if stream_contact is not None:
+        response, aborted = stream_insert_response(client, params, stream_contact)
+    else:
+        response = client.messages.create(**params)
+    if governor:
+        governor.record(slot, response_tokens(response))
+    if responses and not aborted and isinstance(response, anthropic.types.Message):
+        responses.put(params, response.model_dump(mode="json"))
+    return response, False, aborted
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Rate limits, connection failures and 5xx/overloaded responses are worth retrying."""
+    if isinstance(error, (anthropic.RateLimitError, anthropic.APIConnectionError)):
+        return True
+    return isinstance(error, anthropic.APIStatusError) and error.status_code >= 500
+
+
+def retry_wait(error: Exception) -> float:
+    """Seconds to hold off after a transient error (its retry-after, or the default)."""
+    response = getattr(error, "response", None)
+    return retry_after_seconds(response.headers if response is not None else {})
+
+
+def call_with_retries(call, governor: RequestGovernor, label: str):
+    """
+    Return call(), retrying transient errors after pausing the governor for
+    their retry-after (call must acquire from the same governor). Re-raises
+    after the last retry, and at once for any other error.
+    """
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        try:
+            return call()
+        except Exception as e:
+            if not is_transient_error(e) or attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            wait_time = retry_wait(e)
+            logger.warning(f"{label} | API error ({e}), retrying in {wait_time:.0f}s...")
+            governor.pause(wait_time)
+
+
+def repair_insert(
+    client: anthropic.Anthropic,
+    contact: dict,
+    result: dict,
+    prompt_rules: str,
+    model: str,
+    max_repairs: int = DEFAULT_MAX_REPAIRS,
+    governor: Optional[RequestGovernor] = None,
+    responses: Optional[ResponseCache] = None,
+    refresh: bool = False,
+) -> dict:
+    """
+    Send validate_insert's issues back to the model in a short follow-up turn
+    (no web search) until the insert passes or max_repairs is reached.
+    Returns the final result with repair_attempts set. Transient errors are
+    retried through the governor and re-raised once retries run out.
+    """
+    name = contact.get("Name", "")
+    governor = governor or RequestGovernor()
+    result["repair_attempts"] = 0
+    # Fallback inserts have no research to rewrite from
+    if "facts" not in result:
+        return result
+
+    research = {
+        "facts": result["facts"],
+        "sources": result["sources"],
+        "research_quality": result["research_quality"],
+    }
+    while result["repair_attempts"] < max_repairs:
+        is_valid, issues = validate_insert(result["insert"])
+        if is_valid:
+            break
+
+        params = build_generation_request(contact, research, prompt_rules, model)
+        issue_list = "\n".join(f"- {issue}" for issue in issues)
+        params["messages"] += [
+            {"role": "assistant", "content": json.dumps({"insert": result["insert"]})},
+            {
+                "role": "user",
+                "content": f"""That insert failed validation:
+{issue_list}
+
+Rewrite it to fix every issue. Return the same JSON format.""",
+            },
+        ]
+        try:
+            response, _, _ = call_with_retries(
+                lambda: create_message(client, params, governor, responses, refresh),
+                governor,
+                f"{name} | Repair",
+            )
+        except Exception as e:
+            if is_transient_error(e):
+                # The research and earlier repairs were billed; the caller counts them
+                e.usage = add_usage(getattr(e, "usage", {}), result.get("usage", {}))
+                raise
+            logger.warning(f"{name} | Repair call failed, keeping last insert: {e}")
+            break
+
+        repaired = parse_insert_response(response, contact, research)
+        if responses and not validate_insert(repaired.get("insert", ""))[0]:
+            # Otherwise the next repair, asked the same thing, replays this answer
+            responses.discard(params)
+        attempts = result["repair_attempts"] + 1
+        usage = add_usage(result.get("usage", {}), repaired["usage"])
+        if "facts" in repaired:
+            repaired["cached_research"] = result.get("cached_research", False)
+            result = repaired
+        result["repair_attempts"] = attempts
+        result["usage"] = usage
+        logger.info(f"{name} | REPAIR {attempts}/{max_repairs} | issues: {'; '.join(issues)}")
+
+    return result
+
+
+def research_and_generate_insert(
+    client: anthropic.Anthropic,
+    contact: dict,
+    prompt_rules: str,
+    model: str,
+    governor: Optional[RequestGovernor] = None,
+    cache: Optional[ResearchCache] = None,
+    refresh: bool = False,
+    max_repairs: int = 0,
+    companies: Optional[CompanyResearch] = None,
+    stream: bool = False,
+    responses: Optional[ResponseCache] = None,
+) -> dict:
+    """
+    Research contact and generate personalized insert using Claude API with web search.
+    Returns dict with: insert, word_count, confidence, sources (see parse_insert_response)
+    If a governor is given, the call waits for RPM/TPM budget and reports its usage.
+    If a research cache is given, cached facts are reused through a generation-only
+    call (unless refresh), and new non-minimal research is stored.
+    Inserts failing validation get up to max_repairs follow-up turns (repair_insert).
+    Contacts at a company shared with other contacts get its research from companies.
+    With stream, progress is logged live and an insert that fails validation
+    aborts the call early and always gets at least one repair.
+    With a response cache, a request identical to an earlier one (including the
+    original research call, even when its research is now cached, unless
+    rebuilding it would take a live company research call) is replayed for
+    free; refresh bypasses it. LOW results are never replayed.
+    """
+    name = contact.get("Name", "")
+    company = contact.get("Company", "")
+
+    try:
+        research = cache.get(name, company) if cache and not refresh else None
+        params = None
+        # With research cached, the original call is only rebuilt as a response
+        # cache key; that isn't worth a live company research call
+        company_pending = research and companies and not companies.is_known(company)
+        if not research or (responses and not refresh and not company_pending):
+            company_research = (
+                companies.get(client, company, model, governor) if companies else None
+            )
+            params = build_insert_request(contact, prompt_rules, model, company_research)
+        # Prefer replaying the original research call; otherwise reuse the facts
+        if research and not (params and responses.contains(params)):
+            params = build_generation_request(contact, research, prompt_rules, model)
+        else:
+            research = None
+
+        response, from_cache, aborted = create_message(
+            client, params, governor, responses, refresh, contact if stream else None
+        )
+
+        result = parse_insert_response(response, contact, research)
+        result["cached_research"] = bool(research)
+        store_research(cache, contact, result, research)
+        if aborted:
+            max_repairs = max(max_repairs, 1)
+        result = repair_insert(
+            client, contact, result, prompt_rules, model, max_repairs, governor,
+            responses, refresh,
+        )
+        if responses and result["confidence"] == "LOW":
+            # Only good answers are replayed; a rerun should get a fresh attempt
+            responses.discard(params)
+        result["aborted"] = aborted
+        result["cached_response"] = from_cache
+        return result
+
     except Exception as e:
+        # Rate limits and transient errors are retried by generate_with_retries
+        if is_transient_error(e):
+            raise
         logger.error(f"API error for {name}: {e}")
-        return {
-            "insert": f"I've been thinking a lot about {company}'s work and would love to learn from your experience.",
-            "word_count": 17,
-            "confidence": "LOW",
-            "sources": [],
+        return fallback_result(company)
+
+
+def store_research(
+    cache: Optional[ResearchCache],
+    contact: dict,
+    result: dict,
+    research: Optional[dict],
+):
+    """Save freshly researched facts; minimal research is left uncached so it is retried."""
+    if not cache or research or result.get("research_quality", "minimal") == "minimal":
+        return
+    cache.put(
+        contact.get("Name", ""),
+        contact.get("Company", ""),
+        result["facts"],
+        result["sources"],
+        result["research_quality"],
+    )
+
+
+def record_generation(
+    telemetry: Optional[TelemetryWriter],
+    contact: dict,
+    model: str,
+    result: Optional[dict],
+    latency: Optional[float],
+    retries: int = 0,
+    batch: bool = False,
+    error: Optional[str] = None,
+):
+    """Record a telemetry event for a generation, validating its final insert."""
+    if not telemetry:
+        return
+    issues = []
+    if result is not None:
+        if "parse_method" not in result:
+            error = error or "API error"  # research_and_generate_insert fell back
+        else:
+            issues = validate_insert(result.get("insert", ""))[1]
+    telemetry.record(
+        generation_event(contact, model, result, latency, retries, issues, batch, error)
+    )
+
+
+def generate_with_retries(
+    client: anthropic.Anthropic,
+    contact: dict,
+    prompt_rules: str,
+    model: str,
+    governor: Optional[RequestGovernor] = None,
+    cache: Optional[ResearchCache] = None,
+    refresh: bool = False,
+    max_repairs: int = 0,
+    companies: Optional[CompanyResearch] = None,
+    stream: bool = False,
+    telemetry: Optional[TelemetryWriter] = None,
+    responses: Optional[ResponseCache] = None,
+) -> dict:
+    """
+    Generate an insert, retrying rate limits, 5xx/overloaded responses and
+    connection errors. Re-raises after the last retry. Each pauses the governor
+    for the response's retry-after, so every worker holds off together and the
+    retry starts as soon as the pause ends.
+    With telemetry, one event is recorded for the generation (see insert_telemetry).
+    """
+    name = contact.get("Name", "Unknown")
+    governor = governor or RequestGovernor()
+    started = time.monotonic()
+    spent = {}  # Usage of attempts that failed after some billed calls
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        try:
+            result = research_and_generate_insert(
+                client,
+                contact,
+                prompt_rules,
+                model,
+                governor,
+                cache,
+                refresh,
+                max_repairs,
+                companies,
+                stream,
+                responses,
+            )
+            if spent:
+                result["usage"] = add_usage(spent, result.get("usage", {}))
+            record_generation(telemetry, contact, model, result, time.monotonic() - started, attempt)
+            return result
+        except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+            rate_limited = isinstance(e, anthropic.RateLimitError)
+            if not is_transient_error(e):
+                raise
+            spent = add_usage(spent, getattr(e, "usage", {}))
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                record_generation(
+                    telemetry, contact, model, {"usage": spent}, time.monotonic() - started,
+                    attempt,
+                    error="Rate limit exceeded after retries" if rate_limited
+                    else "Server error after retries",
+                )
+                e.usage = spent  # Still billed; main() charges it to the run budget
+                raise
+            wait_time = retry_wait(e)
+            reason = "Rate limited" if rate_limited else f"API error ({e})"
+            logger.warning(f"{name} | {reason}, retrying in {wait_time:.0f}s...")
+            governor.pause(wait_time)
+
+
+class CascadeStats:
+    """Per-tier call counts, latency and token spend for --model cascade."""
+
+    def __init__(self, tiers: list):
+        self.tiers = tiers
+        self._lock = threading.Lock()
+        self._stats = {
+            tier: {"calls": 0, "accepted": 0, "escalated": 0, "seconds": [], "usage": {}}
+            for tier in tiers
         }
 
+    def record(self, tier: str, seconds: float, result: dict, accepted: bool):
+        with self._lock:
+            stats = self._stats[tier]
+            stats["calls"] += 1
+            stats["accepted" if accepted else "escalated"] += 1
+            stats["seconds"].append(seconds)
+            stats["usage"] = add_usage(stats["usage"], result.get("usage", {}))
+
+    def format_summary(self) -> str:
+        lines = [
+            f"  {'Tier':<8}{'Calls':>7}{'Accepted':>10}{'Escalated':>11}"
+            f"{'p50 s':>8}{'p95 s':>8}{'In tok':>10}{'Out tok':>10}"
+        ]
+        for tier in self.tiers:
+            stats = self._stats[tier]
+            seconds = sorted(stats["seconds"])
+            p50 = seconds[len(seconds) // 2] if seconds else 0.0
+            p95 = seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))] if seconds else 0.0
+            usage = stats["usage"]
+            input_tokens = sum(
+                usage.get(field, 0)
+                for field in ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+            )
+            lines.append(
+                f"  {tier:<8}{stats['calls']:>7}{stats['accepted']:>10}{stats['escalated']:>11}"
+                f"{p50:>8.1f}{p95:>8.1f}{input_tokens:>10}{usage.get('output_tokens', 0):>10}"
+            )
+        return "\n".join(lines)
+
+
+def cascade_accepts(result: dict) -> bool:
+    """A cheap-tier result is kept if it passes validation and research wasn't minimal."""
+    is_valid, _ = validate_insert(result["insert"])
+    return is_valid and result.get("research_quality", "minimal") != "minimal"
+
+
+def cascade_generate(
+    client: anthropic.Anthropic,
+    contact: dict,
+    prompt_rules: str,
+    tiers: list,
+    stats: CascadeStats,
+    **kwargs,
+) -> dict:
+    """
+    Generate with the first (cheapest) tier and escalate to the next only when
+    cascade_accepts fails. The last tier's result is always kept.
+    kwargs are passed to generate_with_retries. Sets result["tier"].
+    """
+    name = contact.get("Name", "Unknown")
+    spent = {}
+    for n, tier in enumerate(tiers):
+        started = time.monotonic()
+        try:
+            result = generate_with_retries(client, contact, prompt_rules, MODELS[tier], **kwargs)
+        except Exception as e:
+            e.usage = add_usage(spent, getattr(e, "usage", {}))  # Include cheaper tiers
+            raise
+        is_last = n == len(tiers) - 1
+        accepted = is_last or cascade_accepts(result)
+        stats.record(tier, time.monotonic() - started, result, accepted)
+        spent = add_usage(spent, result.get("usage", {}))
+        if accepted:
+            # Token totals for the contact include the escalated tiers
+            result["tier"] = tier
+            result["usage"] = spent
+            return result
+        logger.info(f"{name} | ESCALATE | {tier} -> {tiers[n + 1]}")
+
+
+def build_output_row(contact: dict, result: dict, campaign: str) -> dict:
+    """Output CSV/sheet row for a contact and its generated insert."""
+    return {
+        "Campaign": campaign,
+        "Name": contact.get("Name", ""),
+        "Email": contact.get("Email", ""),
+        "Email Confidence": contact.get("Email Confidence", ""),
+        "Company": contact.get("Company", ""),
+        "Title": contact.get("Title", ""),
+        "Personalized Insert": result["insert"],
+        "Word Count": result["word_count"],
+        "Insert Confidence": result["confidence"],
+        "Sources": ", ".join(result["sources"]),
+    }
+
+
+def iter_live_results(
+    generate: Callable[[dict], dict],
+    pending: list,
+    workers: int,
+    total: int,
+    budget: Optional[RunBudget] = None,
+) -> Iterator[tuple]:
+    """
+    Run generate(contact) for pending (index, contact) pairs on a thread pool and
+    yield (contact, future) in scheduled order, keeping at most workers*2 calls in
+    flight. Once the budget is exhausted no further contacts are started.
+    """
+    in_flight = deque()
+    queue = iter(pending)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+
+        def fill_window():
+            while len(in_flight) < workers * 2:
+                if budget and budget.exhausted(len(in_flight)):
+                    return
+                item = next(queue, None)
+                if item is None:
+                    return
+                i, contact = item
+                logger.info(f"[{i}/{total}] {contact.get('Name', 'Unknown')} | PROCESSING")
+                future = pool.submit(generate, contact)
+                in_flight.append((contact, future))
+
+        fill_window()
+        while in_flight:
+            yield in_flight.popleft()
+            fill_window()
+
+
+def batch_state_path(output: str) -> str:
+    """State file recording the in-progress batch for an output CSV."""
+    return output + ".batch.json"
+
+
+def load_batch_state(path: str) -> Optional[dict]:
+    """Load an in-progress batch state, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_batch_state(path: str, state: dict):
+    """Write batch state atomically so an interrupted run never leaves half a file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def submit_insert_batch(
+    client: anthropic.Anthropic,
+    pending: list,
+    prompt_rules: str,
+    model: str,
+    state_path: str,
+    cache: Optional[ResearchCache] = None,
+    refresh: bool = False,
+    companies: Optional[CompanyResearch] = None,
+) -> dict:
+    """
+    Submit pending (index, contact) pairs as one Message Batch and save its state.
+    Returns the state: batch_id plus the submitted contacts in scheduled order.
+    Contacts with cached research get generation-only requests; shared company
+    research is done with live calls before submitting.
+    """
+    requests = []
+    submitted = []
+    for i, contact in pending[:MAX_BATCH_REQUESTS]:
+        custom_id = f"contact-{i}"
+        research = (
+            cache.get(contact.get("Name", ""), contact.get("Company", ""))
+            if cache and not refresh
+            else None
+        )
+        if research:
+            params = build_generation_request(contact, research, prompt_rules, model)
+        else:
+            company_research = (
+                companies.get(client, contact.get("Company", ""), model) if companies else None
+            )
+            params = build_insert_request(contact, prompt_rules, model, company_research)
+        requests.append({"custom_id": custom_id, "params": params})
+        submitted.append({"custom_id": custom_id, "contact": contact, "research": research})
+
+    if len(pending) > MAX_BATCH_REQUESTS:
+        logger.warning(
+            f"Batch limited to {MAX_BATCH_REQUESTS} contacts; "
+            f"re-run for the remaining {len(pending) - MAX_BATCH_REQUESTS}"
+        )
+
+    batch = client.messages.batches.create(requests=requests)
+    state = {
+        "batch_id": batch.id,
+        "model": model,
+        "submitted_at": datetime.now().isoformat(timespec="seconds"),
+        "requests": submitted,
+    }
+    save_batch_state(state_path, state)
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} contacts")
+    return state
+
+
+def wait_for_batch(
+    client: anthropic.Anthropic,
+    batch_id: str,
+    poll_interval: Optional[float] = None,
+):
+    """Poll a batch until processing has ended. Returns the final batch."""
+    if poll_interval is None:
+        poll_interval = BATCH_POLL_SECONDS
+    while True:
+        batch = client.messages.batches.retrieve(batch_id)
+        if batch.processing_status == "ended":
+            return batch
+        counts = batch.request_counts
+        logger.info(
+            f"Batch {batch_id} | {counts.processing} processing, "
+            f"{counts.succeeded} succeeded, {counts.errored} errored"
+        )
+        time.sleep(poll_interval)
+
+
+def iter_batch_results(
+    client: anthropic.Anthropic,
+    state: dict,
+    checkpoint: CheckpointWriter,
+    cache: Optional[ResearchCache] = None,
+    prompt_rules: str = "",
+    max_repairs: int = 0,
+    telemetry: Optional[TelemetryWriter] = None,
+) -> Iterator[tuple]:
+    """
+    Yield (contact, future) for each batch request in scheduled order, skipping
+    contacts already in the checkpoint (written before an interruption).
+    Inserts failing validation are repaired with live follow-up calls.
+    """
+    requests = {r["custom_id"]: r for r in state["requests"]}
+    outcomes = {}
+    for item in client.messages.batches.results(state["batch_id"]):
+        request = requests.get(item.custom_id)
+        if request is None:
+            continue
+        contact = request["contact"]
+        if item.result.type == "succeeded":
+            research = request.get("research")
+            result = parse_insert_response(item.result.message, contact, research)
+            result["cached_research"] = bool(research)
+            store_research(cache, contact, result, research)
+            outcomes[item.custom_id] = result
+        else:
+            error = getattr(item.result, "error", None)
+            outcomes[item.custom_id] = RuntimeError(
+                f"Batch request {item.result.type}" + (f": {error}" if error else "")
+            )
+
+    for request in state["requests"]:
+        contact = request["contact"]
+        if checkpoint.is_processed(contact):
+            continue
+        future = Future()
+        outcome = outcomes.get(request["custom_id"])
+        if isinstance(outcome, dict):
+            try:
+                outcome = repair_insert(
+                    client, contact, outcome, prompt_rules, state["model"], max_repairs
+                )
+            except Exception as e:
+                outcome = e  # Repairs still rate limited after retries
+        if isinstance(outcome, dict):
+            record_generation(telemetry, contact, state["model"], outcome, None, batch=True)
+            future.set_result(outcome)
+        else:
+            outcome = outcome or RuntimeError("Missing from batch results")
+            record_generation(
+                telemetry, contact, state["model"], None, None, batch=True, error=str(outcome)
+            )
+            future.set_exception(outcome)
+        yield contact, future
+
 
 def write_csv_row(filepath: str, row: dict, is_first: bool = False):
     """Append a row to CSV file. Creates file with headers if is_first."""
-    fieldnames = [
-        "Campaign",
-        "Name",
-        "Email",
-        "Email Confidence",
-        "Company",
-        "Title",
-        "Personalized Insert",
-        "Word Count",
-        "Insert Confidence",
-        "Sources",
-    ]
-
     mode = "w" if is_first else "a"
     with open(filepath, mode, newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS)
         if is_first:
             writer.writeheader()
         writer.writerow(row)
 
 
-def add_to_google_sheet(worksheet, row_data: dict, headers: list[str]):
-    """Add a new row to Google Sheet. Writes by column name."""
-    # Find next empty row
-    all_values = worksheet.get_all_values()
-    next_row = len(all_values) + 1
+def build_sheet_row(output_row: dict) -> dict:
+    """Google Sheet row for a checkpoint row."""
+    sheet_row = dict(output_row)
+    sheet_row["Email Status"] = ""  # Ready for drafting
+    return sheet_row
 
-    # Map column names to positions
-    col_map = {h: i + 1 for i, h in enumerate(headers)}
 
-    # Write each field by column name
-    for field, value in row_data.items():
-        if field in col_map:
-            worksheet.update_cell(next_row, col_map[field], value)
+def add_to_google_sheet(worksheet, row_data: dict, headers: list[str]):
+    """Add a new row to Google Sheet. Writes by column name, in one API call."""
+    worksheet.append_row(
+        sheet_row_values(row_data, headers),
+        value_input_option="USER_ENTERED",
+        table_range="A1",
+    )
 
 
 def ensure_sheet_columns(worksheet) -> list[str]:
@@ -406,7 +1564,9 @@ def main():
         description="Research contacts and generate personalized email inserts"
     )
     parser.add_argument(
-        "-i", "--input", required=True, help="Input CSV file with contacts"
+        "-i",
+        "--input",
+        help="Input CSV file with contacts (or email_finder .jsonl/.parquet results)",
     )
     parser.add_argument(
         "-o",
@@ -418,17 +1578,219 @@ def main():
         "--delay",
         type=float,
         default=1.0,
-        help="Seconds between API calls (default: 1.0)",
+        help="Minimum seconds between API call starts with --workers 1 (default: 1.0)",
     )
     parser.add_argument(
         "--model",
-        choices=["haiku", "sonnet", "opus"],
+        choices=["haiku", "sonnet", "opus", "cascade"],
         default="sonnet",
-        help="Claude model to use (default: sonnet)",
+        help="Claude model to use, or cascade to escalate through --cascade-tiers "
+        "(default: sonnet)",
+    )
+    parser.add_argument(
+        "--cascade-tiers",
+        default=",".join(DEFAULT_CASCADE_TIERS),
+        help="Comma-separated models for --model cascade, cheapest first "
+        f"(default: {','.join(DEFAULT_CASCADE_TIERS)})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Contacts researched concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=50,
+        help="Max API requests per minute across all workers (default: 50, 0 = off)",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=0,
+        help="Max input+output tokens per minute across all workers (default: 0 = off)",
+    )
+    parser.add_argument(
+        "--research-cache",
+        default=DEFAULT_CACHE_FILE,
+        help=f"SQLite file caching research facts/sources (default: {DEFAULT_CACHE_FILE})",
+    )
+    parser.add_argument(
+        "--no-research-cache",
+        action="store_true",
+        help="Always research with web search; don't read or write the research cache",
+    )
+    parser.add_argument(
+        "--research-ttl-days",
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        help=f"Days before cached research expires (default: {DEFAULT_TTL_DAYS})",
+    )
+    parser.add_argument(
+        "--refresh",
+        "--refresh-research",
+        dest="refresh_research",
+        action="store_true",
+        help="Ignore cached research and responses and call the API again "
+        "(results are re-cached)",
+    )
+    parser.add_argument(
+        "--response-cache",
+        default=DEFAULT_RESPONSE_CACHE_FILE,
+        help="SQLite file caching full model responses by prompt hash "
+        f"(default: {DEFAULT_RESPONSE_CACHE_FILE})",
+    )
+    parser.add_argument(
+        "--response-cache-mb",
+        type=float,
+        default=DEFAULT_RESPONSE_CACHE_MB,
+        help="Size limit of the response cache; least recently used responses are "
+        f"evicted first (default: {DEFAULT_RESPONSE_CACHE_MB})",
+    )
+    parser.add_argument(
+        "--no-response-cache",
+        action="store_true",
+        help="Don't replay or store full responses",
+    )
+    parser.add_argument(
+        "--no-company-research",
+        action="store_true",
+        help="Research every contact's company from scratch instead of once per company",
+    )
+    parser.add_argument(
+        "--max-repairs",
+        type=int,
+        default=DEFAULT_MAX_REPAIRS,
+        help="Follow-up turns to fix an insert that fails validation "
+        f"(default: {DEFAULT_MAX_REPAIRS}, 0 = off)",
+    )
+    parser.add_argument(
+        "--flush-every",
+        type=int,
+        default=DEFAULT_FLUSH_EVERY,
+        help=f"Rows buffered before each checkpoint write (default: {DEFAULT_FLUSH_EVERY})",
+    )
+    parser.add_argument(
+        "--fsync-interval",
+        type=float,
+        default=DEFAULT_FSYNC_INTERVAL,
+        help="Max seconds between fsyncs of the checkpoint "
+        f"(default: {DEFAULT_FSYNC_INTERVAL}, 0 = every write)",
+    )
+    parser.add_argument(
+        "--sheet-batch-rows",
+        type=int,
+        default=DEFAULT_BATCH_ROWS,
+        help=f"Rows per Google Sheet append (default: {DEFAULT_BATCH_ROWS})",
+    )
+    parser.add_argument(
+        "--sheet-flush-seconds",
+        type=float,
+        default=DEFAULT_FLUSH_SECONDS,
+        help="Max seconds a finished row waits before being appended to the sheet "
+        f"(default: {DEFAULT_FLUSH_SECONDS})",
+    )
+    parser.add_argument(
+        "--sheet-queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_ROWS,
+        help="Finished rows queued for the background sheet writer before "
+        f"generation waits (default: {DEFAULT_QUEUE_ROWS})",
+    )
+    parser.add_argument(
+        "--telemetry",
+        default=DEFAULT_TELEMETRY_FILE,
+        help="JSONL file that gets one event per insert generation "
+        f"(default: {DEFAULT_TELEMETRY_FILE})",
+    )
+    parser.add_argument(
+        "--no-telemetry",
+        action="store_true",
+        help="Don't record telemetry events",
+    )
+    parser.add_argument(
+        "--report",
+        nargs="?",
+        const="latest",
+        metavar="RUN_ID",
+        help="Print latency, cost and failure stats for a run in the telemetry file "
+        "(default: the latest run) and exit",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses: show live progress and abort inserts that fail "
+        "validation while they're being written",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit pending contacts as one Message Batch and wait for results "
+        "(cheaper, not interactive; resumes if interrupted)",
+    )
+    parser.add_argument(
+        "--priority",
+        action="append",
+        nargs="?",
+        const=DEFAULT_PRIORITY[0],
+        metavar="COLUMN[:VALUES]",
+        help="Process the most valuable contacts first instead of in input-file order. "
+        "'Email Confidence:HIGH,MEDIUM,LOW' puts listed values first, a bare column "
+        "sorts numerically, highest first. Repeat to break ties "
+        f"(no value: '{DEFAULT_PRIORITY[0]}')",
+    )
+    parser.add_argument(
+        "--max-runtime",
+        type=float,
+        metavar="SECONDS",
+        help="Stop starting new contacts after this many seconds (resume with the same command)",
+    )
+    parser.add_argument(
+        "--max-cost",
+        type=float,
+        metavar="USD",
+        help="Stop starting new contacts once estimated spend reaches this many dollars",
     )
 
     args = parser.parse_args()
 
+    if args.report:
+        if not os.path.exists(args.telemetry):
+            print(f"\nError: no telemetry file at {args.telemetry}")
+            return 1
+        events = load_events(args.telemetry, None if args.report == "latest" else args.report)
+        if not events:
+            print(f"\nError: no events for run {args.report} in {args.telemetry}")
+            return 1
+        print(format_report(build_report(events)))
+        return 0
+    if not args.input:
+        parser.error("the following arguments are required: -i/--input")
+
+    if args.stream and args.batch:
+        print("\nError: --stream can't be combined with --batch")
+        return 1
+    if args.batch and (args.max_runtime is not None or args.max_cost is not None):
+        print("\nError: --max-runtime and --max-cost can't be combined with --batch")
+        return 1
+    try:
+        priority = parse_priority(args.priority or [])
+    except ValueError as e:
+        print(f"\nError: {e}")
+        return 1
+
+    cascade_tiers = []
+    if args.model == "cascade":
+        cascade_tiers = [t.strip() for t in args.cascade_tiers.split(",") if t.strip()]
+        unknown = [t for t in cascade_tiers if t not in MODELS]
+        if not cascade_tiers or unknown:
+            print(f"\nError: --cascade-tiers must list models from: {', '.join(MODELS)}")
+            return 1
+        if args.batch:
+            print("\nError: --model cascade can't be combined with --batch")
+            return 1
+
     # Check for API key
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
@@ -457,30 +1819,104 @@ def main():
 
     # Load input contacts
     logger.info(f"Loading contacts from: {args.input}")
-    contacts = load_input_csv(args.input)
+    contacts = load_input_contacts(args.input)
     logger.info(f"Found {len(contacts)} contacts in input file")
 
-    # Load already-processed contacts (checkpoint)
-    processed = load_processed_contacts(args.output)
-    if processed:
-        logger.info(f"Found {len(processed)} already-processed contacts (will skip)")
+    # Open the output CSV checkpoint; its sidecar index makes resuming cheap
+    checkpoint = CheckpointWriter(
+        args.output,
+        OUTPUT_FIELDS,
+        flush_every=args.flush_every,
+        fsync_interval=args.fsync_interval,
+    )
+    if len(checkpoint):
+        logger.info(f"Found {len(checkpoint)} already-processed contacts (will skip)")
 
     # Connect to Google Sheet
     logger.info("Connecting to Google Sheet...")
     worksheet = get_google_sheet(config)
     headers = ensure_sheet_columns(worksheet)
+    appender = SheetAppender(
+        worksheet,
+        headers,
+        batch_rows=args.sheet_batch_rows,
+        flush_seconds=args.sheet_flush_seconds,
+    )
 
-    # Initialize Claude client
-    client = anthropic.Anthropic(api_key=api_key)
-    model = MODELS[args.model]
-    logger.info(f"Using model: {args.model} ({model})")
+    # Uploads run in the background; the journal records how many checkpoint
+    # rows are confirmed in the sheet (rows from before it existed count as synced)
+    journal = synced_path(args.output)
+    synced = min(load_synced(journal, checkpoint.row_count), checkpoint.row_count)
+    sheet_writer = BackgroundSheetWriter(
+        appender, journal, synced=synced, max_queue=args.sheet_queue_size
+    )
+    replayed_count = checkpoint.row_count - synced
+    if replayed_count:
+        logger.info(f"Replaying {replayed_count} rows not yet confirmed in the sheet")
+        for row in checkpoint.iter_rows_from(synced):
+            sheet_writer.put(build_sheet_row(row))
+
+    # Shared request/token budget; --delay spaces out calls in single-worker mode
+    workers = max(1, args.workers)
+    governor = RequestGovernor(
+        rpm=args.rpm,
+        tpm=args.tpm,
+        min_interval=args.delay if workers == 1 else 0.0,
+    )
+    if workers > 1:
+        logger.info(f"Using {workers} workers (rpm={args.rpm}, tpm={args.tpm or 'off'})")
+
+    # Initialize Claude client; every response's rate-limit headers (and any
+    # 429's retry-after) feed the governor, so calls are paced before they fail.
+    # SDK retries are off: generate_with_retries retries through the governor
+    client = anthropic.Anthropic(
+        api_key=api_key,
+        max_retries=0,
+        http_client=anthropic.DefaultHttpxClient(
+            event_hooks={"response": [governor.observe_response]}
+        ),
+    )
+    cascade_stats = None
+    if cascade_tiers:
+        model = None
+        cascade_stats = CascadeStats(cascade_tiers)
+        logger.info(f"Using model cascade: {' -> '.join(cascade_tiers)}")
+    else:
+        model = MODELS[args.model]
+        logger.info(f"Using model: {args.model} ({model})")
+
+    # Research cache: regenerated inserts reuse facts instead of searching again
+    cache = None
+    if not args.no_research_cache:
+        cache = ResearchCache(args.research_cache, ttl_days=args.research_ttl_days)
+        logger.info(f"Using research cache: {args.research_cache}")
+
+    # Identical requests (reruns, campaign branches) replay stored responses
+    responses = None
+    if not args.no_response_cache:
+        responses = ResponseCache(args.response_cache, max_mb=args.response_cache_mb)
+        logger.info(f"Using response cache: {args.response_cache}")
+
+    # One JSONL event per generation; --report summarizes them later
+    telemetry = None
+    if not args.no_telemetry:
+        telemetry = TelemetryWriter(args.telemetry)
+        logger.info(f"Recording telemetry to {args.telemetry} (run {telemetry.run_id})")
 
     # Process contacts
-    is_first_write = not os.path.exists(args.output)
     processed_count = 0
     skipped_count = 0
     error_count = 0
-
+    usage_totals = dict.fromkeys(USAGE_FIELDS, 0)
+    repaired_count = 0
+    aborted_count = 0
+    repair_calls = 0
+    parse_counts = dict.fromkeys(PARSE_METHODS, 0)
+    enriched_count = 0
+    no_search_count = 0
+
+    # Validate and checkpoint-filter up front; only pending contacts are scheduled
+    pending = []
     for i, contact in enumerate(contacts, 1):
         name = contact.get("Name", "Unknown")
 
@@ -492,91 +1928,162 @@ def main():
             continue
 
         # Check if already processed (checkpoint)
-        if is_already_processed(contact, processed):
+        if checkpoint.is_processed(contact):
             logger.info(f"{name} | SKIP | Already processed")
             skipped_count += 1
             continue
 
-        # Process this contact
-        logger.info(f"[{i}/{len(contacts)}] {name} | PROCESSING")
-
-        try:
-            # Research and generate insert
-            result = research_and_generate_insert(
-                client, contact, prompt_rules, model
+        pending.append((i, contact))
+
+    # With --priority, most valuable contacts first, so a run cut short by a
+    # budget has done those
+    pending = order_contacts(pending, priority)
+    budget = RunBudget(max_runtime=args.max_runtime, max_cost=args.max_cost)
+
+    # Companies with 2+ pending contacts are researched once and shared
+    companies = None
+    if not args.no_company_research:
+        companies = CompanyResearch([c.get("Company", "") for _, c in pending], cache, telemetry)
+        if companies.shared:
+            logger.info(f"Sharing company research for {len(companies.shared)} companies")
+
+    # Results are written by this thread alone, in scheduled (priority) order,
+    # so the CSV checkpoint and sheet stay consistent
+    state_path = batch_state_path(args.output)
+    state = None
+    if args.batch:
+        state = load_batch_state(state_path)
+        if state:
+            logger.info(f"Resuming batch {state['batch_id']} ({len(state['requests'])} contacts)")
+        elif pending:
+            state = submit_insert_batch(
+                client,
+                pending,
+                prompt_rules,
+                model,
+                state_path,
+                cache,
+                args.refresh_research,
+                companies,
             )
-
-            # Prepare output row
-            output_row = {
-                "Campaign": campaign,
-                "Name": contact.get("Name", ""),
-                "Email": contact.get("Email", ""),
-                "Email Confidence": contact.get("Email Confidence", ""),
-                "Company": contact.get("Company", ""),
-                "Title": contact.get("Title", ""),
-                "Personalized Insert": result["insert"],
-                "Word Count": result["word_count"],
-                "Insert Confidence": result["confidence"],
-                "Sources": ", ".join(result["sources"]),
+        if state:
+            wait_for_batch(client, state["batch_id"])
+            results = iter_batch_results(
+                client, state, checkpoint, cache, prompt_rules, args.max_repairs, telemetry
+            )
+        else:
+            results = iter([])
+    else:
+        def generate(contact):
+            options = {
+                "governor": governor,
+                "cache": cache,
+                "refresh": args.refresh_research,
+                "max_repairs": args.max_repairs,
+                "companies": companies,
+                "stream": args.stream,
+                "telemetry": telemetry,
+                "responses": responses,
             }
+            if cascade_stats:
+                return cascade_generate(
+                    client, contact, prompt_rules, cascade_tiers, cascade_stats, **options
+                )
+            return generate_with_retries(client, contact, prompt_rules, model, **options)
 
-            # Write to CSV (checkpoint)
-            write_csv_row(args.output, output_row, is_first=is_first_write)
-            is_first_write = False
-
-            # Add to Google Sheet
-            sheet_row = output_row.copy()
-            sheet_row["Email Status"] = ""  # Ready for drafting
-            add_to_google_sheet(worksheet, sheet_row, headers)
+        results = iter_live_results(generate, pending, workers, len(contacts), budget)
 
-            logger.info(
-                f"{name} | DONE | {result['word_count']} words, "
-                f"{result['confidence']} confidence"
-            )
-            processed_count += 1
-
-            # Rate limiting
-            if i < len(contacts):
-                time.sleep(args.delay)
-
-        except anthropic.RateLimitError:
-            # Exponential backoff
-            for wait_time in [5, 10, 20]:
-                logger.warning(f"Rate limited, waiting {wait_time}s...")
-                time.sleep(wait_time)
-                try:
-                    result = research_and_generate_insert(
-                        client, contact, prompt_rules, model
-                    )
-                    # Success - write and continue
-                    output_row = {
-                        "Campaign": campaign,
-                        "Name": contact.get("Name", ""),
-                        "Email": contact.get("Email", ""),
-                        "Email Confidence": contact.get("Email Confidence", ""),
-                        "Company": contact.get("Company", ""),
-                        "Title": contact.get("Title", ""),
-                        "Personalized Insert": result["insert"],
-                        "Word Count": result["word_count"],
-                        "Insert Confidence": result["confidence"],
-                        "Sources": ", ".join(result["sources"]),
-                    }
-                    write_csv_row(args.output, output_row, is_first=is_first_write)
-                    is_first_write = False
-                    sheet_row = output_row.copy()
-                    sheet_row["Email Status"] = ""
-                    add_to_google_sheet(worksheet, sheet_row, headers)
-                    processed_count += 1
-                    break
-                except anthropic.RateLimitError:
-                    continue
-            else:
+    # Buffered checkpoint rows are flushed even if the run is interrupted
+    started_count = 0
+    try:
+        for contact, future in results:
+            name = contact.get("Name", "Unknown")
+            started_count += 1
+            failed_usage = None
+            try:
+                result = future.result()
+
+                # Write to CSV (checkpoint)
+                output_row = build_output_row(contact, result, campaign)
+                checkpoint.write(output_row)
+
+                # Queue for the Google Sheet (uploaded in batches in the background)
+                sheet_writer.put(build_sheet_row(output_row))
+
+                usage = result.get("usage", {})
+                usage_totals = add_usage(usage_totals, usage)
+                # Cascade usage is priced at the accepted tier (an overestimate)
+                priced_model = MODELS[result["tier"]] if result.get("tier") else model
+                budget.charge(call_cost(priced_model, usage, batch=args.batch))
+                profile = linkedin_context(contact)
+                if profile:
+                    enriched_count += 1
+                    if search_budget(profile) == 0:
+                        no_search_count += 1
+                if result.get("parse_method") in parse_counts:
+                    parse_counts[result["parse_method"]] += 1
+                attempts = result.get("repair_attempts", 0)
+                repair_calls += attempts
+                if attempts and result["confidence"] != "LOW":
+                    repaired_count += 1
+                if result.get("aborted"):
+                    aborted_count += 1
+                notes = [f"{result['word_count']} words", f"{result['confidence']} confidence"]
+                if result.get("cached_research"):
+                    notes.append("cached research")
+                if result.get("aborted"):
+                    notes.append("aborted early")
+                if attempts:
+                    notes.append(f"{attempts} repair(s)")
+                if result.get("tier"):
+                    notes.append(f"tier {result['tier']}")
+                logger.info(
+                    f"{name} | DONE | {', '.join(notes)} | "
+                    f"cache read {usage.get('cache_read_input_tokens', 0)}, "
+                    f"cache write {usage.get('cache_creation_input_tokens', 0)}, "
+                    f"uncached in {usage.get('input_tokens', 0)}, "
+                    f"out {usage.get('output_tokens', 0)} tokens"
+                )
+                processed_count += 1
+
+            except anthropic.RateLimitError as e:
                 logger.error(f"{name} | FAIL | Rate limit exceeded after retries")
                 error_count += 1
+                failed_usage = getattr(e, "usage", {})
 
-        except Exception as e:
-            logger.error(f"{name} | ERROR | {e}")
-            error_count += 1
+            except Exception as e:
+                logger.error(f"{name} | ERROR | {e}")
+                error_count += 1
+                failed_usage = getattr(e, "usage", {})
+
+            if failed_usage:
+                # Calls made before the failure were billed all the same; a failed
+                # cascade is priced at its top tier
+                usage_totals = add_usage(usage_totals, failed_usage)
+                priced_model = model or MODELS[cascade_tiers[-1]]
+                budget.charge(call_cost(priced_model, failed_usage, batch=args.batch))
+            if companies:
+                # Shared research is billed live, and isn't a contact of its own
+                company_usage, company_cost = companies.take_spend()
+                usage_totals = add_usage(usage_totals, company_usage)
+                budget.charge(company_cost, contacts=0)
+    finally:
+        checkpoint.close()
+        sheet_writer.close()
+
+    if budget.stop_reason:
+        logger.warning(f"Stopped early: {budget.stop_reason}")
+
+    # Every batch result is in the checkpoint; failed contacts are resubmitted next run
+    if state:
+        os.remove(state_path)
+
+    if cache:
+        cache.close()
+    if telemetry:
+        telemetry.close()
+    if responses:
+        responses.close()
 
     # Summary
     print(f"\n{'='*50}")
@@ -584,13 +2091,69 @@ def main():
     print(f"  Processed: {processed_count}")
     print(f"  Skipped:   {skipped_count}")
     print(f"  Errors:    {error_count}")
+    print(f"  Repaired:  {repaired_count} ({repair_calls} repair calls)")
+    if args.stream:
+        print(f"  Streamed:  {aborted_count} aborted early on a failing insert")
+    print(
+        f"  Parsed:    {parse_counts['tool']} via tool, {parse_counts['text']} from text, "
+        f"{parse_counts['failed']} failed"
+    )
+    print(
+        f"  Tokens:    {usage_totals['cache_read_input_tokens']} cache read, "
+        f"{usage_totals['cache_creation_input_tokens']} cache write, "
+        f"{usage_totals['input_tokens']} uncached input, "
+        f"{usage_totals['output_tokens']} output"
+    )
+    if cache:
+        print(f"  Research:  {cache.hits} cached, {cache.misses} searched")
+    if responses:
+        print(
+            f"  Responses: {responses.hits} replayed from cache, "
+            f"{responses.evictions} evicted"
+        )
+    if enriched_count:
+        print(
+            f"  LinkedIn:  {enriched_count} used profile context "
+            f"({no_search_count} with no web search)"
+        )
+    if companies and companies.shared:
+        print(
+            f"  Companies: {companies.researched} researched once, "
+            f"{companies.reused} reuses"
+        )
+    if cascade_stats:
+        print("  Cascade tiers:")
+        print(cascade_stats.format_summary())
+    print(
+        f"  Pacing:    {governor.wait_seconds:.0f}s waiting for budget, "
+        f"{governor.rate_limited} rate-limit responses"
+    )
+    print(f"  Sheet:     {appender.rows_written} rows in {appender.calls} append calls")
+    if replayed_count:
+        print(f"  Replayed:  {replayed_count} rows from an interrupted upload")
+    if sheet_writer.error:
+        print(
+            f"  WARNING:   sheet upload failed ({sheet_writer.error}); "
+            f"{checkpoint.row_count - sheet_writer.synced} rows will be replayed next run"
+        )
     print(f"  Output:    {args.output}")
     print(f"  Log:       {LOG_FILE}")
+    if telemetry:
+        print(f"  Telemetry: {args.telemetry} (--report {telemetry.run_id})")
+    if budget.stop_reason:
+        print(
+            f"  Stopped:   {budget.stop_reason}; {len(pending) - started_count} contacts "
+            "left for the next run"
+        )
+    elif args.max_cost is not None:
+        print(f"  Spend:     ${budget.spent:.4f} of ${args.max_cost:.2f} budget")
     print(f"{'='*50}")
 
     logger.info(
         f"Complete. Processed: {processed_count}, "
-        f"Skipped: {skipped_count}, Errors: {error_count}"
+        f"Skipped: {skipped_count}, Errors: {error_count}, "
+        f"Cache read: {usage_totals['cache_read_input_tokens']}, "
+        f"Cache write: {usage_totals['cache_creation_input_tokens']}"
     )
 
     return 0 if error_count == 0 else 1
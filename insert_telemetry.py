@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Insert Telemetry - Structured per-call events and run reports for insert_generator.py.
+
+Every insert generation (one model, including its rate-limit retries and
+repair turns) is appended as one JSON line to insert_telemetry.jsonl: model,
+token counts, web searches, wall-clock latency, retries, validation outcome,
+confidence and estimated cost. build_report() aggregates one run into p50/p95
+latency, cost per valid insert and a breakdown of failures, which is what
+--model, --delay and --workers should be tuned against. Shared company research
+calls get their own events (mode "company") so their tokens, searches and cost
+are counted too.
+
+Usage:
+    telemetry = TelemetryWriter("insert_telemetry.jsonl")
+    telemetry.record(generation_event(contact, model, result, latency, retries))
+    telemetry.close()
+
+    python3 insert_generator.py --report            # latest run
+    python3 insert_generator.py --report RUN_ID
+"""
+
+import json
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Callable, Optional
+
+DEFAULT_TELEMETRY_FILE = "insert_telemetry.jsonl"
+
+# USD per million tokens, matched on the model family in the model ID
+PRICES_PER_MTOK = {
+    "haiku": {"input": 1.00, "output": 5.00, "cache_write": 1.25, "cache_read": 0.10},
+    "sonnet": {"input": 3.00, "output": 15.00, "cache_write": 3.75, "cache_read": 0.30},
+    "opus": {"input": 15.00, "output": 75.00, "cache_write": 18.75, "cache_read": 1.50},
+}
+WEB_SEARCH_PRICE = 10.00 / 1000  # USD per search
+BATCH_DISCOUNT = 0.5             # Message Batches bill tokens at half price
+
+
+def model_prices(model: str) -> Optional[dict]:
+    for family, prices in PRICES_PER_MTOK.items():
+        if family in (model or ""):
+            return prices
+    return None
+
+
+def call_cost(model: str, usage: dict, batch: bool = False) -> float:
+    """Estimated USD cost of a call's token usage and web searches (0 for unknown models)."""
+    prices = model_prices(model)
+    if not prices:
+        return 0.0
+    tokens = (
+        usage.get("input_tokens", 0) * prices["input"]
+        + usage.get("output_tokens", 0) * prices["output"]
+        + usage.get("cache_creation_input_tokens", 0) * prices["cache_write"]
+        + usage.get("cache_read_input_tokens", 0) * prices["cache_read"]
+    ) / 1_000_000
+    if batch:
+        tokens *= BATCH_DISCOUNT
+    return tokens + usage.get("web_search_requests", 0) * WEB_SEARCH_PRICE
+
+
+def issue_code(issue: str) -> str:
+    """Short failure category for a validate_insert issue ("Too short: 9 words" -> "Too short")."""
+    return issue.split(":")[0].split("(")[0].strip()
+
+
+def generation_event(
+    contact: dict,
+    model: str,
+    result: Optional[dict],
+    latency: Optional[float],
+    retries: int = 0,
+    issues: Optional[list] = None,
+    batch: bool = False,
+    error: Optional[str] = None,
+) -> dict:
+    """One telemetry event for a finished (or failed) insert generation."""
+    result = result or {}
+    usage = result.get("usage", {})
+    return {
+        "name": contact.get("Name", ""),
+        "company": contact.get("Company", ""),
+        "model": model,
+        "mode": "batch" if batch else "live",
+        "latency_s": None if latency is None else round(latency, 3),
+        "rate_limit_retries": retries,
+        "repair_attempts": result.get("repair_attempts", 0),
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+        "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0),
+        "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0),
+        "web_searches": usage.get("web_search_requests", 0),
+        "cached_research": result.get("cached_research", False),
+        "parse_method": result.get("parse_method"),
+        "aborted": result.get("aborted", False),
+        "valid": error is None and not issues and bool(result.get("insert")),
+        "issues": issues or [],
+        "confidence": result.get("confidence"),
+        "cost_usd": round(call_cost(model, usage, batch), 6),
+        "error": error,
+    }
+
+
+def company_event(
+    company: str,
+    model: str,
+    usage: Optional[dict],
+    latency: Optional[float],
+    error: Optional[str] = None,
+) -> dict:
+    """One telemetry event for a shared company research call (never a valid insert)."""
+    event = generation_event({"Company": company}, model, {"usage": usage or {}}, latency, error=error)
+    event["mode"] = "company"
+    return event
+
+
+class TelemetryWriter:
+    """Thread-safe JSONL appender; every event is stamped with the run ID and time."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_TELEMETRY_FILE,
+        run_id: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.clock = clock
+        self.events = 0
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def record(self, event: dict):
+        line = json.dumps({"run_id": self.run_id, "ts": round(self.clock(), 3), **event})
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.events += 1
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def load_events(path: str, run_id: Optional[str] = None) -> list:
+    """Events for one run (the most recent if run_id is None). Unreadable lines are skipped."""
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    if not events:
+        return []
+    run_id = run_id or events[-1].get("run_id")
+    return [event for event in events if event.get("run_id") == run_id]
+
+
+def percentile(values: list, pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def build_report(events: list) -> dict:
+    """Aggregate a run's events: latency percentiles, cost per valid insert, failures."""
+    latencies = [e["latency_s"] for e in events if e.get("latency_s") is not None]
+    cost = sum(e.get("cost_usd", 0) for e in events)
+    valid = sum(1 for e in events if e.get("valid"))
+
+    failures = Counter()
+    for event in events:
+        if event.get("error"):
+            failures["API error"] += 1
+        elif event.get("parse_method") == "failed":
+            failures["Unparseable response"] += 1
+        for issue in event.get("issues", []):
+            failures[issue_code(issue)] += 1
+
+    by_model = defaultdict(list)
+    for event in events:
+        by_model[event.get("model")].append(event)
+    models = {}
+    for model, model_events in by_model.items():
+        model_latencies = [e["latency_s"] for e in model_events if e.get("latency_s") is not None]
+        model_valid = sum(1 for e in model_events if e.get("valid"))
+        model_cost = sum(e.get("cost_usd", 0) for e in model_events)
+        models[model] = {
+            "calls": len(model_events),
+            "valid": model_valid,
+            "p50_latency_s": percentile(model_latencies, 50),
+            "cost_usd": round(model_cost, 4),
+            "cost_per_valid_usd": round(model_cost / model_valid, 4) if model_valid else None,
+        }
+
+    return {
+        "run_id": events[0].get("run_id") if events else None,
+        "calls": len(events),
+        "valid": valid,
+        "p50_latency_s": percentile(latencies, 50),
+        "p95_latency_s": percentile(latencies, 95),
+        "input_tokens": sum(e.get("input_tokens", 0) for e in events),
+        "output_tokens": sum(e.get("output_tokens", 0) for e in events),
+        "cache_read_input_tokens": sum(e.get("cache_read_input_tokens", 0) for e in events),
+        "web_searches": sum(e.get("web_searches", 0) for e in events),
+        "rate_limit_retries": sum(e.get("rate_limit_retries", 0) for e in events),
+        "repair_attempts": sum(e.get("repair_attempts", 0) for e in events),
+        "confidence": dict(Counter(e.get("confidence") for e in events if e.get("confidence"))),
+        "cost_usd": round(cost, 4),
+        "cost_per_valid_usd": round(cost / valid, 4) if valid else None,
+        "failures": dict(failures.most_common()),
+        "models": models,
+    }
+
+
+def format_report(report: dict) -> str:
+    def seconds(value):
+        return "-" if value is None else f"{value:.1f}s"
+
+    def dollars(value):
+        return "-" if value is None else f"${value:.4f}"
+
+    lines = [
+        f"Run {report['run_id']}: {report['calls']} calls, {report['valid']} valid inserts",
+        f"  Latency:   p50 {seconds(report['p50_latency_s'])}, p95 {seconds(report['p95_latency_s'])}",
+        f"  Tokens:    {report['input_tokens']} input, {report['output_tokens']} output, "
+        f"{report['cache_read_input_tokens']} cache read, {report['web_searches']} web searches",
+        f"  Retries:   {report['rate_limit_retries']} rate-limit, {report['repair_attempts']} repair",
+        f"  Cost:      {dollars(report['cost_usd'])} total, "
+        f"{dollars(report['cost_per_valid_usd'])} per valid insert",
+    ]
+    if report["confidence"]:
+        lines.append(
+            "  Confidence: "
+            + ", ".join(f"{level} {count}" for level, count in sorted(report["confidence"].items()))
+        )
+    if report["failures"]:
+        lines.append("  Failures:")
+        lines += [f"    {count:>5}  {reason}" for reason, count in report["failures"].items()]
+    lines.append("  By model:")
+    lines.append(f"    {'model':<28} {'calls':>5} {'valid':>5} {'p50':>7} {'cost':>10} {'per valid':>10}")
+    for model, stats in report["models"].items():
+        lines.append(
+            f"    {str(model):<28} {stats['calls']:>5} {stats['valid']:>5} "
+            f"{seconds(stats['p50_latency_s']):>7} {dollars(stats['cost_usd']):>10} "
+            f"{dollars(stats['cost_per_valid_usd']):>10}"
+        )
+    return "\n".join(lines)
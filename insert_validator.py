@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Insert Validator - The insert rules shared by insert_generator.py and verify_drafts.py.
+
+An insert must be 15-25 words, end with . ! or ?, contain no em dash and use
+none of the banned phrases. Banned phrases are matched by one precompiled,
+case-insensitive alternation with word boundaries, so "i noticed" catches
+"I noticed" but not "Chi noticed", and adding a phrase costs nothing per insert.
+
+Every problem is an Issue with a stable code (too_short, too_long,
+missing_punctuation, banned_phrase, em_dash) and a readable message.
+validate_many() checks a whole column of inserts with a single regex pass over
+all of them, for re-validating a sheet after the rules change. check_partial()
+checks an insert that is still being streamed, for the rules it can already
+break.
+
+Usage:
+    is_valid, issues = validate_insert(insert)   # messages, as before
+    issues = check_insert(insert)                # [Issue(code, message), ...]
+    issues = check_partial(streamed_so_far)      # too long, banned phrase, em dash
+    results = validate_many(column_values)       # one issue list per insert
+"""
+
+import re
+from bisect import bisect_right
+from collections import Counter
+from typing import Iterable, Iterator, List, NamedTuple, Pattern, Tuple
+
+MIN_WORDS = 15
+MAX_WORDS = 25
+ENDING_PUNCTUATION = (".", "!", "?")
+EM_DASH = "—"
+
+# Banned phrases for insert validation (lowercase)
+BANNED_PHRASES = [
+    "i came across",
+    "i noticed",
+    "your remarkable",
+    "your impressive",
+    "your incredible",
+    "i would be honored",
+    "i am deeply interested",
+    "your journey",
+    "your path inspires",
+    "as someone who",
+    "i believe that",
+    "resonates with me",
+    "i am passionate about",
+    "aligns with my interests",
+]
+
+TOO_SHORT = "too_short"
+TOO_LONG = "too_long"
+MISSING_PUNCTUATION = "missing_punctuation"
+BANNED_PHRASE = "banned_phrase"
+EM_DASH_USED = "em_dash"
+
+
+class Issue(NamedTuple):
+    code: str
+    message: str
+
+
+def compile_banned(phrases: Iterable[str]) -> Pattern:
+    """
+    One alternation of the phrases, longest first, ending on a word boundary.
+    It is matched against lowercased text, and find_banned checks the leading
+    boundary: a leading \\b or IGNORECASE would stop the regex engine from
+    skipping ahead to the phrases' first letters, which is most of its speed.
+    """
+    ordered = sorted({p.lower() for p in phrases}, key=len, reverse=True)
+    return re.compile("(?:" + "|".join(re.escape(p) for p in ordered) + r")\b")
+
+
+BANNED_PATTERN = compile_banned(BANNED_PHRASES)
+_PHRASE_ORDER = {phrase: n for n, phrase in enumerate(BANNED_PHRASES)}
+
+
+def find_banned(lowered: str, pattern: Pattern = BANNED_PATTERN) -> Iterator[Tuple[int, str]]:
+    """(offset, phrase) for each banned phrase that starts a word in lowercased text."""
+    pos = 0
+    while True:
+        match = pattern.search(lowered, pos)
+        if not match:
+            return
+        start = match.start()
+        before = lowered[start - 1] if start else " "
+        if before.isalnum() or before == "_":
+            pos = start + 1  # Inside a word ("chi noticed"); look again one character on
+            continue
+        yield start, match.group(0)
+        pos = match.end()
+
+
+def _banned_issues(phrases: List[str]) -> List[Issue]:
+    if not phrases:
+        return []
+    found = sorted(set(phrases), key=lambda p: _PHRASE_ORDER.get(p, len(_PHRASE_ORDER)))
+    return [Issue(BANNED_PHRASE, f"Contains banned phrase: '{phrase}'") for phrase in found]
+
+
+def _rule_issues(insert: str, banned: List[Issue]) -> List[Issue]:
+    """All issues for an insert, in rule order, given its banned-phrase issues."""
+    issues = []
+    word_count = len(insert.split())
+    if word_count < MIN_WORDS:
+        issues.append(Issue(TOO_SHORT, f"Too short: {word_count} words (need {MIN_WORDS}-{MAX_WORDS})"))
+    elif word_count > MAX_WORDS:
+        issues.append(Issue(TOO_LONG, f"Too long: {word_count} words (need {MIN_WORDS}-{MAX_WORDS})"))
+    if not insert.strip().endswith(ENDING_PUNCTUATION):
+        issues.append(Issue(MISSING_PUNCTUATION, "Missing ending punctuation (. ! ?)"))
+    issues.extend(banned)
+    if EM_DASH in insert:
+        issues.append(Issue(EM_DASH_USED, "Contains em dash (use 'and' instead)"))
+    return issues
+
+
+def check_insert(insert: str) -> List[Issue]:
+    """Every rule the insert breaks (empty if it's valid)."""
+    insert = insert or ""
+    banned = _banned_issues([phrase for _, phrase in find_banned(insert.lower())])
+    return _rule_issues(insert, banned)
+
+
+def check_partial(text: str) -> List[Issue]:
+    """
+    Issues an insert still being written already has, however it ends: too
+    many words, a banned phrase or an em dash. The last word may be cut off,
+    so words and phrases are only checked up to the last whitespace.
+    """
+    text = text or ""
+    complete = text
+    if text and not text[-1].isspace():
+        parts = text.rsplit(None, 1)
+        complete = parts[0] if len(parts) == 2 else ""
+    issues = []
+    word_count = len(complete.split())
+    if word_count > MAX_WORDS:
+        issues.append(Issue(TOO_LONG, f"Too long: {word_count}+ words (need {MIN_WORDS}-{MAX_WORDS})"))
+    issues.extend(_banned_issues([phrase for _, phrase in find_banned(complete.lower())]))
+    if EM_DASH in text:
+        issues.append(Issue(EM_DASH_USED, "Contains em dash (use 'and' instead)"))
+    return issues
+
+
+def validate_insert(insert: str) -> tuple[bool, list[str]]:
+    """Validate insert against rules. Returns (is_valid, list of issues)."""
+    issues = check_insert(insert)
+    return len(issues) == 0, [issue.message for issue in issues]
+
+
+def validate_many(inserts: Iterable) -> List[List[Issue]]:
+    """
+    Issues for each insert, in order. Banned phrases are found with one regex
+    pass over all inserts lowercased and joined by newlines (no phrase spans a
+    newline), and each match is mapped back to its insert by offset.
+    """
+    texts = ["" if value is None else str(value) for value in inserts]
+    lowered = [text.lower() for text in texts]  # Lowercasing can change a length
+    starts = []
+    offset = 0
+    for text in lowered:
+        starts.append(offset)
+        offset += len(text) + 1
+
+    found = [[] for _ in texts]
+    for start, phrase in find_banned("\n".join(lowered)):
+        found[bisect_right(starts, start) - 1].append(phrase)
+
+    return [_rule_issues(text, _banned_issues(phrases)) for text, phrases in zip(texts, found)]
+
+
+def issue_counts(results: Iterable[List[Issue]]) -> Counter:
+    """How many inserts break each rule."""
+    counts = Counter()
+    for issues in results:
+        counts.update({issue.code for issue in issues})
+    return counts
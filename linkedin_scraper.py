@@ -135,6 +135,16 @@ class LinkedInScraper:
             except:
                 pass
             
+            # Get About section
+            try:
+                about_el = self.page.query_selector(
+                    'section:has(#about) div.inline-show-more-text span[aria-hidden="true"]'
+                )
+                if about_el:
+                    profile.about = about_el.inner_text().strip()
+            except:
+                pass
+            
             # Try to get contact info (requires clicking "Contact info")
             try:
                 contact_link = self.page.query_selector('a[href*="contact-info"]')
@@ -191,7 +201,7 @@ def load_contacts(filepath: str) -> List[Dict]:
 def save_results(contacts: List[Dict], profiles: Dict[str, LinkedInProfile], filepath: str):
     """Save enriched contacts to CSV."""
     fieldnames = list(contacts[0].keys()) if contacts else []
-    new_fields = ['LI_Email', 'LI_Phone', 'LI_Website', 'LI_Twitter', 'LI_Headline', 'LI_Location']
+    new_fields = ['LI_Email', 'LI_Phone', 'LI_Website', 'LI_Twitter', 'LI_Headline', 'LI_Location', 'LI_About']
     fieldnames.extend([f for f in new_fields if f not in fieldnames])
     
     with open(filepath, 'w', newline='', encoding='utf-8') as f:
@@ -209,6 +219,7 @@ def save_results(contacts: List[Dict], profiles: Dict[str, LinkedInProfile], fil
                 contact['LI_Twitter'] = profile.twitter
                 contact['LI_Headline'] = profile.headline
                 contact['LI_Location'] = profile.location
+                contact['LI_About'] = profile.about
                 
             writer.writerow(contact)
 
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Rate Governor - Shared request/token budget for concurrent API workers.
+
+Every worker calls acquire() before an API request and record() with the
+actual token usage afterwards. The governor blocks callers so that, over any
+sliding 60-second window, requests stay under the RPM limit and input+output
+tokens stay under the TPM limit. Until a call's usage is known, its tokens
+are estimated from the running average of completed calls.
+
+The governor also paces from the provider's own accounting: observe() reads
+the anthropic-ratelimit-* headers of every response, spreads the remaining
+requests evenly until their reset, and holds new calls when the remaining
+token budget can't cover the next one. A 429 pauses every worker for its
+retry-after, so one throttled call doesn't turn into a retry storm. Hooking
+observe_response into the HTTP client covers every call; the client should be
+built with max_retries=0 so that retries go back through acquire() (and any
+pause) instead of being resent by the SDK.
+
+Usage:
+    governor = RequestGovernor(rpm=50, tpm=80000)
+    client = anthropic.Anthropic(max_retries=0, http_client=anthropic.DefaultHttpxClient(
+        event_hooks={"response": [governor.observe_response]}))
+    slot = governor.acquire()
+    response = client.messages.create(...)
+    governor.record(slot, response.usage.input_tokens + response.usage.output_tokens)
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Mapping, Optional
+
+# Token estimate used before any call has completed
+DEFAULT_TOKEN_ESTIMATE = 8000
+
+# Pause after a 429 that carries no retry-after header
+DEFAULT_RETRY_AFTER = 5.0
+
+REQUESTS_REMAINING = "anthropic-ratelimit-requests-remaining"
+REQUESTS_RESET = "anthropic-ratelimit-requests-reset"
+# Combined and input-only token buckets; the tighter one wins
+TOKEN_HEADERS = [
+    (
+        "anthropic-ratelimit-tokens-limit",
+        "anthropic-ratelimit-tokens-remaining",
+        "anthropic-ratelimit-tokens-reset",
+    ),
+    (
+        "anthropic-ratelimit-input-tokens-limit",
+        "anthropic-ratelimit-input-tokens-remaining",
+        "anthropic-ratelimit-input-tokens-reset",
+    ),
+]
+
+
+def _header_int(headers: Mapping, name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+def seconds_until(reset: Optional[str], wall_now: float) -> Optional[float]:
+    """Seconds from wall_now until an RFC 3339 reset timestamp (None if absent)."""
+    if not reset:
+        return None
+    try:
+        return max(0.0, datetime.fromisoformat(reset.replace("Z", "+00:00")).timestamp() - wall_now)
+    except ValueError:
+        return None
+
+
+def retry_after_seconds(headers: Mapping) -> float:
+    """The retry-after header in seconds, or DEFAULT_RETRY_AFTER."""
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+class RequestGovernor:
+    """Sliding-window RPM/TPM limiter shared by all worker threads."""
+
+    def __init__(
+        self,
+        rpm: int = 0,
+        tpm: int = 0,
+        min_interval: float = 0.0,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.rpm = rpm                      # 0 = no request limit
+        self.tpm = tpm                      # 0 = no token limit
+        self.min_interval = min_interval    # minimum seconds between request starts
+        self.window = window
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self._cond = threading.Condition()
+        self._slots = deque()               # [start_time, tokens] per request in window
+        self._last_start = None
+        self._completed = 0
+        self._completed_tokens = 0
+        self.wait_seconds = 0.0             # total time callers spent blocked
+        self.rate_limited = 0               # 429 responses seen
+        self._paced_interval = 0.0          # spacing that spends remaining requests evenly
+        self._not_before = 0.0              # no request starts before this (header/429 holds)
+
+    @property
+    def token_estimate(self) -> int:
+        """Average tokens per completed call (or the default before any)."""
+        if not self._completed:
+            return DEFAULT_TOKEN_ESTIMATE
+        return max(1, self._completed_tokens // self._completed)
+
+    def _prune(self, now: float):
+        while self._slots and now - self._slots[0][0] >= self.window:
+            self._slots.popleft()
+
+    def _delay_needed(self, now: float, tokens: int) -> float:
+        """Seconds until a request of this size fits, 0 if it fits now."""
+        delays = [self._not_before - now]
+        interval = max(self.min_interval, self._paced_interval)
+        if interval and self._last_start is not None:
+            delays.append(self._last_start + interval - now)
+        if self.rpm and len(self._slots) >= self.rpm:
+            delays.append(self._slots[len(self._slots) - self.rpm][0] + self.window - now)
+        if self.tpm and self._slots:
+            used = sum(slot[1] for slot in self._slots)
+            # A single oversized request is still allowed through an empty window
+            excess = used + tokens - self.tpm
+            for start, slot_tokens in self._slots:
+                if excess <= 0:
+                    break
+                excess -= slot_tokens
+                delays.append(start + self.window - now)
+        return max(delays)
+
+    def acquire(self, estimated_tokens: Optional[int] = None) -> list:
+        """Block until the request fits in the budget; returns a slot for record()."""
+        started = self.clock()
+        with self._cond:
+            tokens = estimated_tokens or self.token_estimate
+            while True:
+                now = self.clock()
+                self._prune(now)
+                delay = self._delay_needed(now, tokens)
+                if delay <= 0:
+                    break
+                self._cond.wait(timeout=delay)
+            slot = [now, tokens]
+            self._slots.append(slot)
+            self._last_start = now
+            self.wait_seconds += now - started
+            return slot
+
+    def record(self, slot: list, actual_tokens: int):
+        """Replace a slot's estimate with the tokens the call actually used."""
+        with self._cond:
+            slot[1] = actual_tokens
+            self._completed += 1
+            self._completed_tokens += actual_tokens
+            self._cond.notify_all()
+
+    def observe(self, headers: Mapping):
+        """Pace upcoming requests from a response's rate-limit headers."""
+        with self._cond:
+            now = self.clock()
+            wall_now = self.wall_clock()
+            hold_until = now
+
+            remaining = _header_int(headers, REQUESTS_REMAINING)
+            reset_in = seconds_until(headers.get(REQUESTS_RESET), wall_now)
+            if remaining is not None and reset_in is not None:
+                if remaining <= 0:
+                    hold_until = max(hold_until, now + reset_in)
+                    self._paced_interval = 0.0
+                else:
+                    self._paced_interval = reset_in / remaining
+
+            needed = self.token_estimate
+            for limit_header, remaining_header, reset_header in TOKEN_HEADERS:
+                remaining = _header_int(headers, remaining_header)
+                if remaining is None or remaining >= needed:
+                    continue
+                limit = _header_int(headers, limit_header)
+                reset_in = seconds_until(headers.get(reset_header), wall_now)
+                if limit:
+                    # Buckets refill continuously at limit tokens per minute
+                    wait = (needed - remaining) * 60.0 / limit
+                    if reset_in is not None:
+                        wait = min(wait, reset_in)
+                elif reset_in is not None:
+                    wait = reset_in
+                else:
+                    continue
+                hold_until = max(hold_until, now + wait)
+
+            if hold_until > self._not_before:
+                self._not_before = hold_until
+            self._cond.notify_all()
+
+    def pause(self, seconds: float):
+        """Hold every new request for seconds (e.g. a 429's retry-after)."""
+        with self._cond:
+            self._not_before = max(self._not_before, self.clock() + seconds)
+            self._cond.notify_all()
+
+    def observe_response(self, response):
+        """httpx response hook: observe headers and pause on 429."""
+        self.observe(response.headers)
+        if response.status_code == 429:
+            with self._cond:
+                self.rate_limited += 1
+            self.pause(retry_after_seconds(response.headers))
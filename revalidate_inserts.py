@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Revalidate Inserts - Re-check every insert already in the Google Sheet against
+the current rules in insert_validator.py.
+
+After a rule change (a new banned phrase, a tighter word count) this finds every
+affected row without touching Outlook. The contact and insert columns are
+pulled in one ranged read, all inserts are validated in one pass, and the
+results can be written back as a compact issue-code column ("Insert Issues")
+in a single batch update, saved as a local report, and/or queued as an
+insert_generator.py input CSV for regeneration.
+
+Usage:
+    python3 revalidate_inserts.py                          # summary only
+    python3 revalidate_inserts.py --write-issues           # fill the Insert Issues column
+    python3 revalidate_inserts.py --report issues.csv --queue regenerate.csv
+    python3 revalidate_inserts.py --campaign round-2-middlebury-alumni
+
+    python3 insert_generator.py -i regenerate.csv -o regenerated.csv
+"""
+
+import argparse
+import csv
+import time
+from collections import Counter
+from typing import Dict, List
+
+from gspread.utils import rowcol_to_a1
+
+from email_drafter import get_google_sheet, load_config
+from insert_validator import issue_counts, validate_many
+
+INSERT_COLUMN = "Personalized Insert"
+ISSUES_COLUMN = "Insert Issues"
+
+# Columns read alongside the insert; the queue needs insert_generator's inputs
+CONTACT_COLUMNS = ["Campaign", "Name", "Email", "Email Confidence", "Company", "Title"]
+QUEUE_FIELDS = ["Name", "Company", "Email", "Title", "Email Confidence"]
+REPORT_FIELDS = ["Row", "Campaign", "Name", "Email", "Company", "Issues", "Details", "Insert"]
+
+
+def column_letter(col: int) -> str:
+    return rowcol_to_a1(1, col).rstrip("0123456789")
+
+
+def read_columns(worksheet, headers: List[str], columns: List[str]) -> List[Dict]:
+    """
+    Data rows (from row 2) with the given columns, fetched in one batch_get.
+    Columns missing from the sheet come back blank.
+    """
+    present = [c for c in columns if c in headers]
+    letters = [column_letter(headers.index(c) + 1) for c in present]
+    value_ranges = worksheet.batch_get([f"{letter}2:{letter}" for letter in letters]) if present else []
+
+    values = {}
+    for column, value_range in zip(present, value_ranges):
+        values[column] = [cells[0] if cells else "" for cells in value_range]
+    row_count = max((len(v) for v in values.values()), default=0)
+
+    rows = []
+    for n in range(row_count):
+        row = {"Row": n + 2}
+        for column in columns:
+            column_values = values.get(column, [])
+            row[column] = column_values[n] if n < len(column_values) else ""
+        rows.append(row)
+    return rows
+
+
+def ensure_issues_column(worksheet, headers: List[str]) -> int:
+    """1-based column of Insert Issues, adding the header if the sheet lacks it."""
+    if ISSUES_COLUMN not in headers:
+        worksheet.update_cell(1, len(headers) + 1, ISSUES_COLUMN)
+        headers.append(ISSUES_COLUMN)
+    return headers.index(ISSUES_COLUMN) + 1
+
+
+def write_issue_column(worksheet, col: int, rows: List[Dict]):
+    """Write every row's issue codes with one batch update (clears rows that now pass)."""
+    if not rows:
+        return
+    letter = column_letter(col)
+    worksheet.batch_update(
+        [{
+            "range": f"{letter}2:{letter}{len(rows) + 1}",
+            "values": [[row[ISSUES_COLUMN]] for row in rows],
+        }],
+        value_input_option="RAW",
+    )
+
+
+def write_csv(path: str, fields: List[str], rows: List[Dict]):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-validate every insert in the Google Sheet against the current rules"
+    )
+    parser.add_argument("--campaign", help="Only check rows from this campaign")
+    parser.add_argument(
+        "--write-issues",
+        action="store_true",
+        help=f"Write issue codes to the '{ISSUES_COLUMN}' sheet column in one batch update",
+    )
+    parser.add_argument("--report", metavar="CSV", help="Write failing rows and their issues to a local CSV")
+    parser.add_argument(
+        "--queue",
+        metavar="CSV",
+        help="Write failing contacts as an insert_generator.py input CSV for regeneration",
+    )
+    args = parser.parse_args()
+
+    config = load_config()
+    worksheet = get_google_sheet(config)
+    headers = worksheet.row_values(1)
+    if INSERT_COLUMN not in headers:
+        print(f"\nError: sheet has no '{INSERT_COLUMN}' column")
+        return 1
+
+    started = time.perf_counter()
+    rows = read_columns(worksheet, headers, CONTACT_COLUMNS + [INSERT_COLUMN, ISSUES_COLUMN])
+    read_seconds = time.perf_counter() - started
+
+    # Other campaigns keep their codes; blank inserts haven't been generated yet
+    selected = []
+    for row in rows:
+        if args.campaign and row["Campaign"] != args.campaign:
+            continue
+        if row[INSERT_COLUMN].strip():
+            selected.append(row)
+        else:
+            row[ISSUES_COLUMN] = ""
+    started = time.perf_counter()
+    results = validate_many(row[INSERT_COLUMN] for row in selected)
+    validate_seconds = time.perf_counter() - started
+
+    failing = []
+    by_campaign = Counter()
+    for row, issues in zip(selected, results):
+        row[ISSUES_COLUMN] = ",".join(dict.fromkeys(issue.code for issue in issues))
+        if issues:
+            row["Issues"] = row[ISSUES_COLUMN]
+            row["Details"] = "; ".join(issue.message for issue in issues)
+            row["Insert"] = row[INSERT_COLUMN]
+            failing.append(row)
+            by_campaign[row["Campaign"] or "(none)"] += 1
+
+    print(f"\n{'='*50}")
+    print("Revalidation:")
+    print(f"  Checked:   {len(selected)} inserts (read {read_seconds:.2f}s, "
+          f"validated in {validate_seconds * 1000:.0f}ms)")
+    print(f"  Failing:   {len(failing)}")
+    for code, count in issue_counts(results).most_common():
+        print(f"    {count:>5}  {code}")
+    if by_campaign:
+        print("  By campaign:")
+        for campaign, count in by_campaign.most_common():
+            print(f"    {count:>5}  {campaign}")
+
+    if args.write_issues:
+        col = ensure_issues_column(worksheet, headers)
+        write_issue_column(worksheet, col, rows)
+        print(f"  Sheet:     '{ISSUES_COLUMN}' updated for {len(rows)} rows in one batch update")
+    if args.report:
+        write_csv(args.report, REPORT_FIELDS, failing)
+        print(f"  Report:    {args.report}")
+    if args.queue:
+        write_csv(args.queue, QUEUE_FIELDS, failing)
+        print(f"  Queue:     {args.queue} ({len(failing)} contacts)")
+        print(f"             python3 insert_generator.py -i {args.queue} -o regenerated.csv")
+    print(f"{'='*50}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
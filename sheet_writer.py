@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Sheet Writer - Batched Google Sheet appends for insert_generator.py.
+
+Writing a contact used to cost a full-sheet download (to find the next empty
+row) plus one update_cell call per field. SheetAppender instead maps each
+finished row to the header order once, buffers it, and appends the buffer
+with a single append_rows call every batch_rows rows or flush_seconds
+seconds. Quota (429) and transient server errors are retried with backoff.
+
+BackgroundSheetWriter runs a SheetAppender on its own thread behind a bounded
+queue, so model calls never wait on Sheets latency. After every successful
+append it records how many checkpoint rows are confirmed in the sheet in a
+small journal file (<output>.synced); rows past that count are replayed on the
+next start.
+
+Usage:
+    appender = SheetAppender(worksheet, headers, batch_rows=25)
+    appender.add(row)
+    appender.close()
+
+    writer = BackgroundSheetWriter(appender, synced_path("inserts.csv"), synced=120)
+    writer.put(row)
+    writer.close()  # drains the queue
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from gspread.exceptions import APIError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_ROWS = 25
+DEFAULT_FLUSH_SECONDS = 10.0
+
+# Seconds to wait before each retry of a throttled or failed append
+RETRY_BACKOFF = [2, 4, 8, 16, 32]
+
+# Sheets API status codes worth retrying
+RETRYABLE_CODES = {429, 500, 502, 503, 504}
+
+# Rows waiting for the background writer before put() blocks
+DEFAULT_QUEUE_ROWS = 500
+
+# How often an idle background writer checks for a time-based flush
+IDLE_POLL_SECONDS = 1.0
+
+_STOP = object()
+
+
+def sheet_row_values(row: Dict, headers: List[str]) -> List:
+    """Row values in sheet column order; columns the row doesn't have are blank."""
+    return [row.get(header, "") for header in headers]
+
+
+def is_retryable(error: APIError) -> bool:
+    code = getattr(error, "code", None)
+    if code is None:
+        code = getattr(getattr(error, "response", None), "status_code", None)
+    return code in RETRYABLE_CODES
+
+
+def append_with_retry(
+    worksheet,
+    rows: List[List],
+    sleep: Callable[[float], None] = time.sleep,
+):
+    """Append rows below the sheet's table in one call, retrying quota errors."""
+    for wait_time in [0] + RETRY_BACKOFF:
+        if wait_time:
+            logger.warning(f"Sheets quota/server error, retrying in {wait_time}s...")
+            sleep(wait_time)
+        try:
+            worksheet.append_rows(
+                rows, value_input_option="USER_ENTERED", table_range="A1"
+            )
+            return
+        except APIError as e:
+            if not is_retryable(e) or wait_time == RETRY_BACKOFF[-1]:
+                raise
+
+
+class SheetAppender:
+    """Write-behind buffer of finished rows, flushed with one append_rows call."""
+
+    def __init__(
+        self,
+        worksheet,
+        headers: List[str],
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.worksheet = worksheet
+        self.headers = list(headers)
+        self.batch_rows = max(1, batch_rows)
+        self.flush_seconds = flush_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.calls = 0
+        self.rows_written = 0
+        self._buffer = []
+        self._oldest = None
+
+    def add(self, row: Dict):
+        """Buffer a row; flushes when the batch is full or the oldest row is due."""
+        self._buffer.append(sheet_row_values(row, self.headers))
+        if self._oldest is None:
+            self._oldest = self.clock()
+        if self.due():
+            self.flush()
+
+    def due(self) -> bool:
+        """True when the buffer should be flushed now."""
+        if not self._buffer:
+            return False
+        return (
+            len(self._buffer) >= self.batch_rows
+            or self.clock() - self._oldest >= self.flush_seconds
+        )
+
+    def flush(self):
+        """Append every buffered row with one API call."""
+        if not self._buffer:
+            return
+        append_with_retry(self.worksheet, self._buffer, self.sleep)
+        self.calls += 1
+        self.rows_written += len(self._buffer)
+        self._buffer = []
+        self._oldest = None
+
+    def close(self):
+        self.flush()
+
+
+def synced_path(csv_path: str) -> str:
+    return csv_path + ".synced"
+
+
+def load_synced(path: str, default: int) -> int:
+    """Checkpoint rows confirmed in the sheet, or default if there is no journal."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return int(f.read().strip() or 0)
+    except FileNotFoundError:
+        return default
+    except ValueError:
+        logger.warning(f"Unreadable sheet journal {path}, replaying every row")
+        return 0
+
+
+def save_synced(path: str, count: int):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(f"{count}\n")
+    os.replace(tmp_path, path)
+
+
+class BackgroundSheetWriter:
+    """Uploads rows through a SheetAppender on a background thread."""
+
+    def __init__(
+        self,
+        appender: SheetAppender,
+        journal_path: str,
+        synced: int = 0,
+        max_queue: int = DEFAULT_QUEUE_ROWS,
+    ):
+        self.appender = appender
+        self.journal_path = journal_path
+        self.synced = synced
+        self.error: Optional[Exception] = None
+        self._base = synced - appender.rows_written
+        self._queue = queue.Queue(maxsize=max(1, max_queue))
+        save_synced(journal_path, synced)
+        self._thread = threading.Thread(target=self._run, name="sheet-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, row: Dict):
+        """Queue a row for upload; blocks only while the queue is full."""
+        self._queue.put(row)
+
+    def _run(self):
+        while True:
+            try:
+                row = self._queue.get(timeout=IDLE_POLL_SECONDS)
+            except queue.Empty:
+                row = None
+            if row is _STOP:
+                self._upload(self.appender.flush)
+                return
+            if self.error is not None:
+                continue  # Uploads stopped; the rest is replayed next run
+            if row is None:
+                if self.appender.due():
+                    self._upload(self.appender.flush)
+            else:
+                self._upload(lambda: self.appender.add(row))
+
+    def _upload(self, action: Callable[[], None]):
+        if self.error is not None:
+            return
+        try:
+            action()
+        except Exception as e:
+            self.error = e
+            logger.error(f"Sheet upload failed, remaining rows will be replayed next run: {e}")
+            return
+        synced = self._base + self.appender.rows_written
+        if synced != self.synced:
+            self.synced = synced
+            save_synced(self.journal_path, synced)
+
+    def close(self):
+        """Upload everything still queued and wait for the thread to finish."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
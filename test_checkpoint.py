@@ -0,0 +1,158 @@
+"""Tests for checkpoint.py - durable output CSV and sidecar index."""
+
+import csv
+import os
+from unittest.mock import patch
+
+import pytest
+from checkpoint import INDEX_RECORD, CheckpointWriter, index_path
+
+FIELDS = ["Name", "Email", "Company", "Personalized Insert"]
+
+
+def make_row(i, **overrides):
+    row = {"Name": f"Person {i}", "Email": f"p{i}@co.com", "Company": "Co", "Personalized Insert": f"Insert {i}."}
+    row.update(overrides)
+    return row
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture
+def output(tmp_path):
+    return str(tmp_path / "out.csv")
+
+
+class TestWriting:
+    """Tests for appending rows."""
+
+    def test_header_and_rows_written(self, output):
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            checkpoint.write(make_row(1))
+            checkpoint.write(make_row(2))
+        rows = read_rows(output)
+        assert [r["Name"] for r in rows] == ["Person 1", "Person 2"]
+
+    def test_rows_buffered_until_flush_every(self, output):
+        checkpoint = CheckpointWriter(output, FIELDS, flush_every=3)
+        checkpoint.write(make_row(1))
+        checkpoint.write(make_row(2))
+        assert read_rows(output) == []
+        checkpoint.write(make_row(3))
+        assert len(read_rows(output)) == 3
+        checkpoint.close()
+
+    def test_close_flushes_partial_buffer(self, output):
+        checkpoint = CheckpointWriter(output, FIELDS, flush_every=10)
+        checkpoint.write(make_row(1))
+        checkpoint.close()
+        assert len(read_rows(output)) == 1
+
+    def test_newlines_kept_on_one_line(self, output):
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            checkpoint.write(make_row(1, **{"Personalized Insert": "Line one\nline two."}))
+        with open(output) as f:
+            assert len(f.readlines()) == 2
+        assert read_rows(output)[0]["Personalized Insert"] == "Line one line two."
+
+    def test_fsync_at_most_every_interval(self, output):
+        now = [0.0]
+        with patch("checkpoint.os.fsync") as mock_fsync:
+            checkpoint = CheckpointWriter(output, FIELDS, fsync_interval=5.0, clock=lambda: now[0])
+            checkpoint.write(make_row(1))
+            now[0] = 2.0
+            checkpoint.write(make_row(2))
+            assert mock_fsync.call_count == 0
+            now[0] = 6.0
+            checkpoint.write(make_row(3))
+            assert mock_fsync.call_count == 2  # CSV + index
+            checkpoint.close()
+
+
+class TestResume:
+    """Tests for resuming from the checkpoint and its index."""
+
+    def test_processed_contacts_found(self, output):
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            checkpoint.write(make_row(1))
+            checkpoint.write(make_row(2, Email=""))
+
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            assert checkpoint.is_processed({"Email": "P1@co.com"})
+            assert checkpoint.is_processed({"Name": "person 2", "Company": "co"})
+            assert not checkpoint.is_processed({"Email": "p3@co.com", "Name": "Person 3"})
+            assert len(checkpoint) == 2
+
+    def test_resume_reads_index_not_csv(self, output):
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            for i in range(5):
+                checkpoint.write(make_row(i))
+
+        with patch.object(CheckpointWriter, "_iter_rows", side_effect=AssertionError("CSV parsed")):
+            with CheckpointWriter(output, FIELDS) as checkpoint:
+                assert len(checkpoint) == 5
+
+    def test_unindexed_tail_recovered(self, output):
+        """A crash between the CSV and index writes loses no keys."""
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            for i in range(3):
+                checkpoint.write(make_row(i))
+        idx = index_path(output)
+        os.truncate(idx, os.path.getsize(idx) - INDEX_RECORD.size)
+
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            assert checkpoint.is_processed({"Email": "p2@co.com"})
+        assert os.path.getsize(idx) == 3 * INDEX_RECORD.size
+
+    def test_torn_tail_cut(self, output):
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            checkpoint.write(make_row(1))
+        with open(output, "a") as f:
+            f.write('Person 2,p2@co.com,Co,"Half a ro')
+
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            assert not checkpoint.is_processed({"Email": "p2@co.com"})
+            checkpoint.write(make_row(3))
+        assert [r["Name"] for r in read_rows(output)] == ["Person 1", "Person 3"]
+
+    def test_missing_index_rebuilt_from_legacy_csv(self, output):
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerow(make_row(1))
+
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            assert checkpoint.is_processed({"Email": "p1@co.com"})
+        assert os.path.getsize(index_path(output)) == INDEX_RECORD.size
+
+    def test_replaced_csv_rebuilds_index(self, output):
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            for i in range(3):
+                checkpoint.write(make_row(i))
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerow(make_row(9))
+
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            assert checkpoint.is_processed({"Email": "p9@co.com"})
+            assert not checkpoint.is_processed({"Email": "p0@co.com"})
+
+    def test_row_count_and_iter_rows_from(self, output):
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            for i in range(4):
+                checkpoint.write(make_row(i, Email="same@co.com"))
+            assert checkpoint.row_count == 4
+
+        with CheckpointWriter(output, FIELDS) as checkpoint:
+            assert checkpoint.row_count == 4
+            assert [r["Name"] for r in checkpoint.iter_rows_from(2)] == ["Person 2", "Person 3"]
+            assert [r["Name"] for r in checkpoint.iter_rows_from(0)][0] == "Person 0"
+            assert list(checkpoint.iter_rows_from(4)) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,99 @@
+"""Tests for contact_scheduler.py - priority ordering and run budgets."""
+
+import pytest
+from contact_scheduler import RunBudget, order_contacts, parse_priority
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def pending(*contacts):
+    return list(enumerate(contacts, 1))
+
+
+class TestPriority:
+    """Tests for parsing rules and ordering contacts."""
+
+    def test_parse_ranked_and_numeric_rules(self):
+        rules = parse_priority(["Email Confidence: high, medium", "Priority"])
+        assert rules[0].column == "Email Confidence"
+        assert rules[0].ranks == ["HIGH", "MEDIUM"]
+        assert rules[1].ranks is None
+
+    def test_missing_column_rejected(self):
+        with pytest.raises(ValueError):
+            parse_priority([":HIGH"])
+
+    def test_ranked_values_first_unlisted_last(self):
+        rules = parse_priority(["Email Confidence:HIGH,MEDIUM,LOW"])
+        items = pending(
+            {"Email Confidence": "low"}, {"Email Confidence": ""},
+            {"Email Confidence": "HIGH"}, {"Email Confidence": "MEDIUM"},
+        )
+        assert [i for i, _ in order_contacts(items, rules)] == [3, 4, 1, 2]
+
+    def test_numeric_highest_first_blank_last(self):
+        items = pending({"Priority": "2"}, {"Priority": "x"}, {"Priority": "10"}, {})
+        assert [i for i, _ in order_contacts(items, parse_priority(["Priority"]))] == [3, 1, 2, 4]
+
+    def test_later_rules_break_ties_and_input_order_kept(self):
+        rules = parse_priority(["Tier:A", "Priority"])
+        items = pending(
+            {"Tier": "A", "Priority": "1"}, {"Tier": "B"},
+            {"Tier": "A", "Priority": "5"}, {"Tier": "B"},
+        )
+        assert [i for i, _ in order_contacts(items, rules)] == [3, 1, 2, 4]
+
+    def test_no_rules_keeps_order(self):
+        items = pending({"Name": "b"}, {"Name": "a"})
+        assert order_contacts(items, []) == items
+
+
+class TestRunBudget:
+    """Tests for stopping at a runtime or cost limit."""
+
+    def test_unlimited_never_exhausted(self):
+        budget = RunBudget()
+        budget.charge(1000)
+        assert not budget.exhausted(in_flight=50)
+
+    def test_runtime_limit(self):
+        clock = FakeClock()
+        budget = RunBudget(max_runtime=60, clock=clock)
+        clock.now = 59
+        assert not budget.exhausted()
+        clock.now = 60
+        assert budget.exhausted()
+        assert "--max-runtime 60s" in budget.stop_reason
+
+    def test_cost_limit_projects_calls_in_flight(self):
+        budget = RunBudget(max_cost=1.0)
+        budget.charge(0.25)
+        budget.charge(0.25)
+        assert not budget.exhausted(in_flight=1)
+        assert budget.exhausted(in_flight=2)
+        assert "--max-cost $1.00" in budget.stop_reason
+
+    def test_shared_spend_not_averaged_as_a_contact(self):
+        budget = RunBudget(max_cost=1.0)
+        budget.charge(0.3, contacts=0)
+        budget.charge(0.1)
+        assert budget.charged == 1
+        assert budget.projected_cost(in_flight=2) == pytest.approx(1.2)
+
+    def test_stays_exhausted(self):
+        clock = FakeClock()
+        budget = RunBudget(max_runtime=1, clock=clock)
+        clock.now = 2
+        assert budget.exhausted()
+        budget.max_runtime = 100
+        assert budget.exhausted()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,84 @@
+"""Tests for email_extractor.py - streaming address extraction."""
+
+import pytest
+from email_extractor import (
+    NameMatcher,
+    extract_emails,
+    extract_from_response,
+    is_junk,
+    iter_emails,
+    matches_name,
+)
+
+
+class FakeStreamResponse:
+    """Minimal stand-in for a streamed requests response."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.bytes_read = 0
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), chunk_size):
+            chunk = self.body[i:i + chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+
+class TestExtraction:
+    """Tests for pattern scanning and junk filtering."""
+
+    def test_extract_emails_filters_junk_and_lowercases(self):
+        """Junk domains are dropped and addresses lower-cased."""
+        text = "Write to Ada.Lovelace@Acme.com or webmaster@w3.org, not test@example.com."
+
+        assert extract_emails(text) == {"ada.lovelace@acme.com"}
+
+    def test_junk_blocklist_covers_subdomains_and_asset_names(self):
+        """Parent domains and image filenames are treated as junk."""
+        assert is_junk("abc123@o123.ingest.sentry.io") is True
+        assert is_junk("logo@2x.png") is True
+        assert is_junk("ada@acme.com") is False
+
+    def test_address_split_across_chunks_is_found(self):
+        """An address straddling a chunk boundary is still extracted whole."""
+        chunks = [b"<p>mail ada.love", b"lace@acme.com</p> and grace@", b"navy.mil"]
+
+        assert list(iter_emails(chunks)) == ["ada.lovelace@acme.com", "grace@navy.mil"]
+
+    def test_duplicates_yielded_once(self):
+        """Each address is yielded once per stream."""
+        chunks = [b"ada@acme.com ", b"ADA@acme.com ada@acme.com"]
+
+        assert list(iter_emails(chunks)) == ["ada@acme.com"]
+
+    def test_response_scan_stops_at_max_bytes(self):
+        """Reading stops once max_bytes have been consumed."""
+        body = b"ada@acme.com " + b"x " * 100000 + b"late@acme.com"
+        resp = FakeStreamResponse(body)
+
+        emails = extract_from_response(resp, max_bytes=4096, chunk_size=1024)
+
+        assert emails == {"ada@acme.com"}
+        assert resp.bytes_read == 4096
+
+
+class TestNameMatcher:
+    """Tests for name-token matching."""
+
+    def test_matches_segment_and_concatenated_forms(self):
+        """Token segments and concatenations both match."""
+        matcher = NameMatcher("Ada Lovelace")
+
+        assert matcher.matches("ada.l@acme.com") is True
+        assert matcher.matches("adalovelace@gmail.com") is True
+        assert matcher.matches("info@acme.com") is False
+
+    def test_single_letter_parts_are_ignored(self):
+        """Initials are too short to be evidence of a match."""
+        assert matches_name("j@acme.com", "J. Smith") is False
+        assert matches_name("smith@acme.com", "J. Smith") is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
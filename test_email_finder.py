@@ -0,0 +1,192 @@
+"""Tests for email_finder.py - metrics and lookups against local stand-ins."""
+
+import json
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from benchmarks.fake_providers import FakeProviderConfig, FakeProviders
+from email_finder import (
+    Contact,
+    EmailFinder,
+    SourceMetrics,
+    QUOTA_SOURCES,
+)
+
+
+@pytest.fixture
+def providers():
+    """Local provider stand-ins with no latency and no rate limiting."""
+    config = FakeProviderConfig(page_size_kb=4).scaled(0)
+    for profile in config.profiles.values():
+        profile.rate_limit_rate = 0.0
+        profile.hit_rate = 1.0
+    with FakeProviders(config) as running:
+        yield running
+
+
+@pytest.fixture
+def finder(providers):
+    """EmailFinder pointed at the stand-ins with all keys set."""
+    finder = EmailFinder(**providers.finder_kwargs())
+    finder.hunter_key = finder.apollo_key = "test"
+    finder.rocketreach_key = finder.clearbit_key = "test"
+    finder.rate_limits = {source: 0 for source in finder.rate_limits}
+    return finder
+
+
+def _call(source, emails, statuses=(200,), latency_ms=10.0):
+    return {
+        "source": source,
+        "emails": list(emails),
+        "statuses": list(statuses),
+        "latency_ms": latency_ms,
+        "throttle_ms": 0.0,
+    }
+
+
+class TestSourceMetrics:
+    """Tests for per-source aggregation."""
+
+    def test_unique_find_only_counts_emails_no_other_source_found(self):
+        """A source only gets a unique find for emails nobody else returned."""
+        metrics = SourceMetrics()
+        contact = Contact(name="Ada Lovelace", company="Acme")
+
+        metrics.record_contact(contact, [
+            _call("hunter", ["ada@acme.com"]),
+            _call("apollo", ["ada@acme.com"]),
+            _call("google", ["ada.lovelace@gmail.com"]),
+        ])
+        summary = metrics.summary()
+
+        assert summary["hunter"]["hit_rate"] == 1.0
+        assert summary["hunter"]["unique_find_rate"] == 0.0
+        assert summary["google"]["unique_find_rate"] == 1.0
+
+    def test_quota_counts_successful_calls_to_metered_sources(self):
+        """Only 2xx responses from quota sources count as spend."""
+        metrics = SourceMetrics()
+        contact = Contact(name="Ada Lovelace", company="Acme")
+
+        metrics.record_contact(contact, [
+            _call("hunter", [], statuses=[200, 429]),
+            _call("google", [], statuses=[200, 200]),
+        ])
+        summary = metrics.summary()
+
+        assert "hunter" in QUOTA_SOURCES
+        assert summary["hunter"]["quota_spent"] == 1
+        assert summary["hunter"]["statuses"] == {"200": 1, "429": 1}
+        assert summary["google"]["quota_spent"] == 0
+
+    def test_latency_histogram_buckets(self):
+        """Latencies land in the first bucket whose bound they fit under."""
+        metrics = SourceMetrics()
+        contact = Contact(name="Ada Lovelace", company="Acme")
+
+        for ms in (20, 80, 20000):
+            metrics.record_contact(contact, [_call("hunter", [], latency_ms=ms)])
+        histogram = metrics.summary()["hunter"]["latency_histogram"]
+
+        assert histogram["<=50ms"] == 1
+        assert histogram["<=100ms"] == 1
+        assert histogram[">10000ms"] == 1
+
+    def test_jsonl_written_per_call_with_summary_on_close(self, tmp_path):
+        """Each call is a JSONL line; close() appends the summary."""
+        path = tmp_path / "metrics.jsonl"
+        metrics = SourceMetrics(str(path))
+        contact = Contact(name="Ada Lovelace", company="Acme")
+
+        metrics.record_contact(contact, [_call("hunter", ["ada@acme.com"])])
+        metrics.close()
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+
+        assert lines[0]["type"] == "call"
+        assert lines[0]["source"] == "hunter"
+        assert lines[0]["unique"] == 1
+        assert lines[-1]["type"] == "summary"
+
+
+class TestFindEmailInstrumentation:
+    """find_email against the local stand-ins."""
+
+    def test_find_email_records_every_source(self, finder):
+        """API sources and Google are recorded with their HTTP statuses."""
+        contact = Contact(name="Ada Lovelace", company="Acme Robotics")
+
+        finder.find_email(contact)
+        summary = finder.metrics.summary()
+
+        for source in ("hunter", "apollo", "rocketreach", "clearbit", "google"):
+            assert summary[source]["calls"] == 1
+            assert summary[source]["requests"] >= 1
+        assert "github" not in summary  # Not a tech company, no requests made
+        assert any(e["source"] == "hunter.io" for e in contact.emails_found)
+
+    def test_smtp_verification_uses_local_dns_and_smtp(self, finder):
+        """SMTP verification resolves MX and talks to the stand-in server."""
+        assert finder.verify_email_smtp("ada.lovelace@acmerobotics.com") is True
+
+
+class TestSearchWebsite:
+    """Website crawl against the local stand-in sites."""
+
+    def test_finds_name_matching_address_on_team_page(self, finder):
+        """A name-matching address on a contact/team page is returned."""
+        contact = Contact(name="Grace Hopper", company="Acme Robotics")
+
+        results = finder.search_website(contact)
+
+        assert [r.email for r in results] == ["grace.hopper@acmerobotics.com"]
+        assert results[0].source == "website"
+
+    def test_robots_txt_is_respected_and_cached(self, finder):
+        """Disallowed paths are skipped and robots.txt is fetched once per site."""
+        root = finder.endpoints["website"].format(host="acmerobotics.com")
+
+        assert finder._robots_allows(root, f"{root}/people") is False
+        assert finder._robots_allows(root, f"{root}/team") is True
+        assert list(finder._robots_cache) == [root]
+
+    def test_late_crawl_responses_stay_with_the_website_call(self, finder):
+        """A crawl page still running after the search returns isn't billed to the next source."""
+        root = finder.endpoints["website"].format(host="acmerobotics.com")
+        website = _call("website", [], statuses=[])
+        hunter = _call("hunter", [], statuses=[])
+        finder._call_context.call = hunter
+        worker = threading.Thread(
+            target=finder._crawl_page,
+            args=(root, f"{root}/team", threading.Event(), time.monotonic() + 10, website),
+        )
+        worker.start()
+        worker.join()
+        finder._call_context.call = None
+
+        assert website["statuses"] and set(website["statuses"]) == {200}
+        assert hunter["statuses"] == []
+
+    def test_stop_rechecked_after_robots_fetch(self, finder):
+        """A search that ends while robots.txt is fetched doesn't fetch the page."""
+        root = finder.endpoints["website"].format(host="acmerobotics.com")
+        stop = threading.Event()
+
+        def slow_robots(root, url):
+            stop.set()
+            return True
+
+        with patch.object(finder, "_robots_allows", side_effect=slow_robots), \
+                patch.object(finder, "_open_page") as open_page:
+            emails = finder._crawl_page(root, f"{root}/team", stop, time.monotonic() + 10)
+
+        assert emails == set()
+        assert not open_page.called
+
+    def test_no_sites_means_no_requests(self, finder):
+        """Contacts without a website or company are skipped."""
+        assert finder.search_website(Contact(name="Grace Hopper", company="")) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
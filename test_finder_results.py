@@ -0,0 +1,143 @@
+"""Tests for finder_results.py - JSONL/Parquet result records."""
+
+import json
+import pytest
+from unittest.mock import patch
+from email_finder import Contact
+from finder_results import (
+    JsonlResultWriter,
+    best_candidate,
+    export_parquet,
+    iter_results,
+    iter_results_jsonl,
+    record_to_contact_row,
+)
+
+
+@pytest.fixture
+def contact():
+    """Contact with more candidates than the CSV layout can hold."""
+    contact = Contact(name="Ada Lovelace", company="Acme", title="CTO")
+    contact.lookup_ms = 812.4
+    contact.sources_checked = ["hunter", "google", "patterns"]
+    contact.emails_found = [
+        {"email": "ada@acme.com", "source": "pattern_guess", "confidence": "low", "verified": True, "latency_ms": 0.1},
+        {"email": "a.lovelace@acme.com", "source": "hunter.io", "confidence": "high", "verified": False, "latency_ms": 120.0},
+        {"email": "ada.l@gmail.com", "source": "google_search", "confidence": "medium", "verified": False, "latency_ms": 300.0},
+        {"email": "lovelace@acme.com", "source": "pattern_guess", "confidence": "low", "verified": False, "latency_ms": 0.1},
+    ]
+    return contact
+
+
+class TestJsonlWriter:
+    """Tests for the append-only writer and reader."""
+
+    def test_keeps_every_candidate_with_verification_and_timing(self, tmp_path, contact):
+        """All candidates survive, including verified flag and latency."""
+        path = tmp_path / "results.jsonl"
+
+        with JsonlResultWriter(str(path)) as writer:
+            writer.write(contact)
+        record = next(iter_results_jsonl(str(path)))
+
+        assert len(record["candidates"]) == 4
+        assert record["candidates"][0]["verified"] is True
+        assert record["candidates"][1]["latency_ms"] == 120.0
+        assert record["lookup_ms"] == 812.4
+
+    def test_appends_across_writers_and_skips_torn_line(self, tmp_path, contact):
+        """Reopening appends; a partially written last line is ignored."""
+        path = tmp_path / "results.jsonl"
+        for _ in range(2):
+            with JsonlResultWriter(str(path)) as writer:
+                writer.write(contact)
+        with open(path, "a") as f:
+            f.write('{"name": "Torn')
+
+        assert len(list(iter_results_jsonl(str(path)))) == 2
+
+    def test_truncate_starts_a_fresh_file(self, tmp_path, contact):
+        """A truncating writer (the Parquet sidecar) drops earlier runs' records."""
+        path = tmp_path / "results.jsonl"
+        for truncate in (False, True):
+            with JsonlResultWriter(str(path), truncate=truncate) as writer:
+                writer.write(contact)
+
+        assert len(list(iter_results_jsonl(str(path)))) == 1
+
+
+class TestDownstreamMapping:
+    """Tests for mapping records to insert_generator input rows."""
+
+    def test_best_candidate_prefers_verified_then_confidence(self, tmp_path, contact):
+        """A verified address beats an unverified high-confidence one."""
+        path = tmp_path / "results.jsonl"
+        with JsonlResultWriter(str(path)) as writer:
+            writer.write(contact)
+        record = next(iter_results_jsonl(str(path)))
+
+        assert best_candidate(record)["email"] == "ada@acme.com"
+
+    def test_record_to_contact_row_uses_insert_generator_columns(self):
+        """Rows carry Name/Company/Title/Email/Email Confidence."""
+        record = {
+            "name": "Ada Lovelace", "company": "Acme", "title": "CTO",
+            "candidates": [{"email": "ada@acme.com", "source": "hunter.io", "confidence": "high", "verified": False}],
+        }
+
+        row = record_to_contact_row(record)
+
+        assert row["Email"] == "ada@acme.com"
+        assert row["Email Confidence"] == "HIGH"
+        assert row["Title"] == "CTO"
+
+    def test_record_without_candidates_has_blank_email(self):
+        """No candidates means an empty Email (insert_generator will skip it)."""
+        row = record_to_contact_row({"name": "Ada", "company": "Acme", "candidates": []})
+
+        assert row["Email"] == ""
+
+
+class TestParquetExport:
+    """Tests for the optional Parquet export."""
+
+    def test_round_trip_through_parquet(self, tmp_path, contact):
+        """Exported Parquet streams back the same records."""
+        pytest.importorskip("pyarrow")
+        jsonl = tmp_path / "results.jsonl"
+        parquet = tmp_path / "results.parquet"
+        with JsonlResultWriter(str(jsonl)) as writer:
+            writer.write(contact)
+            writer.write(contact)
+
+        count = export_parquet(str(jsonl), str(parquet))
+        records = list(iter_results(str(parquet)))
+
+        assert count == 2
+        assert records[0]["candidates"] == json.loads(jsonl.read_text().splitlines()[0])["candidates"]
+
+    def test_parquet_run_leaves_existing_jsonl_results_alone(self, tmp_path, contact, monkeypatch):
+        """-o x.parquet streams to its own partial file, not the user's x.jsonl."""
+        pytest.importorskip("pyarrow")
+        import email_finder
+
+        contacts_csv = tmp_path / "contacts.csv"
+        contacts_csv.write_text("Name,Company\nAda Lovelace,Acme\n")
+        jsonl = tmp_path / "x.jsonl"
+        jsonl.write_text('{"name": "Earlier run"}\n')
+        parquet = tmp_path / "x.parquet"
+        monkeypatch.setattr(
+            "sys.argv", ["email_finder.py", "-i", str(contacts_csv), "-o", str(parquet)]
+        )
+
+        with patch.object(email_finder.EmailFinder, "find_email", return_value=contact):
+            for _ in range(2):
+                email_finder.main()
+
+        assert jsonl.read_text() == '{"name": "Earlier run"}\n'
+        assert len(list(iter_results(str(parquet)))) == 1
+        assert not (tmp_path / "x.parquet.partial.jsonl").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,161 @@
+"""Tests for insert_cache.py - persistent research cache."""
+
+import pytest
+from insert_cache import ResearchCache, ResponseCache, company_key, prompt_key, research_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = ResearchCache(str(tmp_path / "cache.db"), ttl_days=1, clock=clock)
+    yield cache
+    cache.close()
+
+
+class TestResearchKey:
+    """Tests for cache key normalization."""
+
+    def test_case_and_punctuation_ignored(self):
+        assert research_key("Ada  Lovelace", "Acme, Inc.") == research_key("ada lovelace", "ACME Inc")
+
+    def test_name_and_company_both_matter(self):
+        assert research_key("Ada", "Acme") != research_key("Ada", "Other")
+        assert research_key("Ada", "Acme") != research_key("Bob", "Acme")
+
+
+class TestCompanyKey:
+    """Tests for company normalization."""
+
+    def test_legal_suffix_ignored(self):
+        assert company_key("Acme, Inc.") == company_key("acme") == "acme"
+
+    def test_suffix_only_name_kept(self):
+        assert company_key("Co") == "co"
+
+
+class TestResearchCache:
+    """Tests for storing and reading research."""
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get("Ada", "Acme") is None
+        assert cache.misses == 1
+
+    def test_roundtrip(self, cache):
+        cache.put("Ada", "Acme", ["Built the engine"], ["Wikipedia"], "detailed")
+        research = cache.get("ada", "acme")
+        assert research == {
+            "facts": ["Built the engine"],
+            "sources": ["Wikipedia"],
+            "research_quality": "detailed",
+        }
+        assert cache.hits == 1
+
+    def test_put_replaces_entry(self, cache):
+        cache.put("Ada", "Acme", ["old"], [], "basic")
+        cache.put("Ada", "Acme", ["new"], ["Blog"], "detailed")
+        assert cache.get("Ada", "Acme")["facts"] == ["new"]
+
+    def test_entry_expires_after_ttl(self, cache, clock):
+        cache.put("Ada", "Acme", ["fact"], [], "basic")
+        clock.now += 86400 + 1
+        assert cache.get("Ada", "Acme") is None
+
+    def test_purge_expired(self, cache, clock):
+        cache.put("Ada", "Acme", ["fact"], [], "basic")
+        clock.now += 86400 + 1
+        cache.put("Bob", "Acme", ["fact"], [], "basic")
+        assert cache.purge_expired() == 1
+        assert cache.get("Bob", "Acme") is not None
+
+    def test_company_roundtrip(self, cache):
+        cache.put_company("Acme Inc", ["Builds rockets"], ["acme.com"])
+        assert cache.get_company("ACME") == {"facts": ["Builds rockets"], "sources": ["acme.com"]}
+
+    def test_company_entry_expires(self, cache, clock):
+        cache.put_company("Acme", ["Builds rockets"], [])
+        clock.now += 86400 + 1
+        assert cache.get_company("Acme") is None
+
+    def test_persists_across_instances(self, tmp_path, clock):
+        path = str(tmp_path / "cache.db")
+        first = ResearchCache(path, clock=clock)
+        first.put("Ada", "Acme", ["fact"], ["Web"], "basic")
+        first.close()
+
+        second = ResearchCache(path, clock=clock)
+        assert second.get("Ada", "Acme")["sources"] == ["Web"]
+        second.close()
+
+
+
+def request(user, model="m"):
+    return {"model": model, "system": "rules", "messages": [{"role": "user", "content": user}]}
+
+
+class TestPromptKey:
+    """Tests for content-addressed response keys."""
+
+    def test_same_request_same_key(self):
+        assert prompt_key(request("Ada")) == prompt_key(dict(reversed(list(request("Ada").items()))))
+
+    def test_model_and_message_matter(self):
+        assert prompt_key(request("Ada")) != prompt_key(request("Bob"))
+        assert prompt_key(request("Ada")) != prompt_key(request("Ada", model="other"))
+
+    def test_non_prompt_fields_ignored(self):
+        assert prompt_key({**request("Ada"), "metadata": {"user_id": "x"}}) == prompt_key(request("Ada"))
+
+
+class TestResponseCache:
+    """Tests for storing, replaying and evicting responses."""
+
+    @pytest.fixture
+    def responses(self, tmp_path, clock):
+        responses = ResponseCache(str(tmp_path / "responses.db"), max_mb=1, clock=clock)
+        yield responses
+        responses.close()
+
+    def test_roundtrip_counts_hits(self, responses):
+        assert responses.get(request("Ada")) is None
+        responses.put(request("Ada"), {"content": [{"type": "text", "text": "hi"}]})
+        assert responses.get(request("Ada")) == {"content": [{"type": "text", "text": "hi"}]}
+        assert (responses.hits, responses.misses) == (1, 1)
+        assert responses.contains(request("Ada"))
+
+    def test_discard(self, responses):
+        responses.put(request("Ada"), {"x": 1})
+        responses.discard(request("Ada"))
+        assert not responses.contains(request("Ada"))
+
+    def test_least_recently_used_evicted_over_size(self, tmp_path, clock):
+        responses = ResponseCache(str(tmp_path / "r.db"), max_mb=250 / (1024 * 1024), clock=clock)
+        body = {"text": "x" * 90}
+        for user in ("a", "b"):
+            responses.put(request(user), body)
+            clock.now += 1
+        responses.get(request("a"))  # a is now more recent than b
+        clock.now += 1
+        responses.put(request("c"), body)
+
+        assert responses.contains(request("a"))
+        assert not responses.contains(request("b"))
+        assert responses.contains(request("c"))
+        assert responses.evictions == 1
+        assert responses.size_bytes() <= 250
+        responses.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
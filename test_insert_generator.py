@@ -7,6 +7,7 @@ import pytest
 from unittest.mock import MagicMock, patch, call
 from insert_generator import (
     load_input_csv,
+    load_input_contacts,
     validate_required_columns,
     load_processed_contacts,
     is_already_processed,
@@ -17,12 +18,29 @@ from insert_generator import (
     write_csv_row,
     add_to_google_sheet,
     ensure_sheet_columns,
+    generate_with_retries,
+    build_output_row,
+    build_insert_request,
+    parse_insert_response,
+    research_and_generate_insert,
+    extract_insert_fields,
+    completed_insert,
+    partial_insert,
+    stream_insert_response,
+    CompanyResearch,
+    linkedin_context,
+    search_budget,
     MODELS,
     REQUIRED_COLUMNS,
     BANNED_PHRASES,
 )
 
 
+def tool_names(request_kwargs):
+    """Names of the tools offered in a messages.create call."""
+    return [tool["name"] for tool in request_kwargs.get("tools", [])]
+
+
 class TestLoadCSV:
     """Tests for CSV loading functionality."""
 
@@ -66,6 +84,34 @@ class TestLoadCSV:
         assert contacts[0]["Email"] == ""
 
 
+class TestLoadFinderResults:
+    """Tests for reading email_finder JSONL results as input."""
+
+    def test_jsonl_results_map_to_input_columns(self, tmp_path):
+        """Best candidate becomes Email/Email Confidence."""
+        results = tmp_path / "results.jsonl"
+        results.write_text(json.dumps({
+            "name": "John Doe", "company": "Acme Corp", "title": "CEO",
+            "candidates": [
+                {"email": "jdoe@acme.com", "source": "pattern_guess", "confidence": "low", "verified": False},
+                {"email": "john@acme.com", "source": "hunter.io", "confidence": "high", "verified": False},
+            ],
+        }) + "\n")
+
+        contacts = load_input_contacts(str(results))
+
+        assert contacts[0]["Email"] == "john@acme.com"
+        assert contacts[0]["Email Confidence"] == "HIGH"
+        assert validate_required_columns(contacts[0]) == (True, "")
+
+    def test_csv_input_still_supported(self, tmp_path):
+        """CSV paths fall through to load_input_csv."""
+        csv_file = tmp_path / "contacts.csv"
+        csv_file.write_text("Name,Company,Email,Title\nJohn Doe,Acme,john@acme.com,CEO\n")
+
+        assert load_input_contacts(str(csv_file))[0]["Name"] == "John Doe"
+
+
 class TestRequiredColumns:
     """Tests for required column validation."""
 
@@ -480,25 +526,23 @@ class TestSheetColumnMatching:
     def test_add_to_google_sheet_writes_by_column_name(self):
         """Should write to columns by name, not position."""
         mock_worksheet = MagicMock()
-        mock_worksheet.get_all_values.return_value = [
-            ["Name", "Email", "Company", "Personalized Insert"]
-        ]
 
-        headers = ["Name", "Email", "Company", "Personalized Insert"]
+        headers = ["Name", "Email", "Company", "Personalized Insert", "Sent Date"]
         row_data = {
-            "Name": "John Doe",
-            "Email": "john@acme.com",
             "Company": "Acme",
+            "Name": "John Doe",
             "Personalized Insert": "Test insert.",
+            "Email": "john@acme.com",
         }
 
         add_to_google_sheet(mock_worksheet, row_data, headers)
 
-        # Verify cells were updated by column name position
-        calls = mock_worksheet.update_cell.call_args_list
-        # Row 2 (first data row), column positions based on headers
-        assert any(c[0][1] == 1 and c[0][2] == "John Doe" for c in calls)  # Name col 1
-        assert any(c[0][1] == 2 and c[0][2] == "john@acme.com" for c in calls)  # Email col 2
+        # One append call, values in header order, blank for missing columns
+        mock_worksheet.append_row.assert_called_once()
+        values = mock_worksheet.append_row.call_args[0][0]
+        assert values == ["John Doe", "john@acme.com", "Acme", "Test insert.", ""]
+        assert not mock_worksheet.get_all_values.called
+        assert not mock_worksheet.update_cell.called
 
     def test_ensure_sheet_columns_adds_missing(self):
         """Should add missing columns to sheet."""
@@ -513,6 +557,564 @@ class TestSheetColumnMatching:
         assert "Campaign" in headers
 
 
+class TestPromptCaching:
+    """Tests for the cached system prompt prefix."""
+
+    def test_system_prompt_marked_cacheable(self):
+        """System prompt is one text block with an ephemeral cache breakpoint."""
+        params = build_insert_request({"Name": "A"}, "# Rules", MODELS["sonnet"])
+        assert len(params["system"]) == 1
+        block = params["system"][0]
+        assert block["cache_control"] == {"type": "ephemeral"}
+        assert "# Rules" in block["text"]
+
+    def test_prefix_identical_across_contacts(self):
+        """Only the user message varies between contacts."""
+        a = build_insert_request({"Name": "Ada", "Company": "X"}, "# Rules", "m")
+        b = build_insert_request({"Name": "Bob", "Company": "Y"}, "# Rules", "m")
+        assert a["system"] == b["system"]
+        assert a["tools"] == b["tools"]
+        assert "Ada" not in a["system"][0]["text"]
+        assert "Name: Ada" in a["messages"][0]["content"]
+        assert "Name: Bob" in b["messages"][0]["content"]
+
+    def test_system_prompt_built_once(self):
+        """The system prompt text is reused, not rebuilt, for each contact."""
+        a = build_insert_request({"Name": "Ada"}, "# Rules", "m")
+        b = build_insert_request({"Name": "Bob"}, "# Rules", "m")
+        assert a["system"][0]["text"] is b["system"][0]["text"]
+
+    def test_usage_includes_cache_tokens(self):
+        """Parsed results report cache read/write token counts."""
+        response = MagicMock()
+        response.content = [MagicMock(text='{"insert": "hi there", "sources": [], "research_quality": "basic"}')]
+        response.usage.input_tokens = 40
+        response.usage.output_tokens = 60
+        response.usage.cache_creation_input_tokens = 0
+        response.usage.cache_read_input_tokens = 1500
+        result = parse_insert_response(response, {"Name": "A"})
+        assert result["usage"]["cache_read_input_tokens"] == 1500
+        assert result["usage"]["input_tokens"] == 40
+
+
+class TestStructuredOutput:
+    """Tests for record_insert tool parsing and the tolerant text fallback."""
+
+    def _response(self, *blocks):
+        response = MagicMock()
+        response.content = list(blocks)
+        return response
+
+    def test_tool_call_preferred(self):
+        tool_block = MagicMock(type="tool_use", input={"insert": "From tool.", "sources": []})
+        tool_block.name = "record_insert"
+        text_block = MagicMock(type="text", text='{"insert": "From text."}')
+        fields, method = extract_insert_fields(self._response(text_block, tool_block))
+        assert fields["insert"] == "From tool."
+        assert method == "tool"
+
+    def test_json_among_prose_and_braces(self):
+        """Stray braces around the answer don't break parsing (greedy regex did)."""
+        text = (
+            'I searched {twice}. Here is the result: '
+            '{"insert": "Hello there.", "sources": ["Web"], "research_quality": "basic"} '
+            'Note: {not json}'
+        )
+        fields, method = extract_insert_fields(self._response(MagicMock(type="text", text=text)))
+        assert fields["insert"] == "Hello there."
+        assert method == "text"
+
+    def test_last_answer_object_wins(self):
+        text = '{"insert": "Draft."} then revised: {"insert": "Final."}'
+        fields, _ = extract_insert_fields(self._response(MagicMock(type="text", text=text)))
+        assert fields["insert"] == "Final."
+
+    def test_unparseable_response_counted_as_failed(self):
+        response = self._response(MagicMock(type="text", text="Sorry, no JSON here."))
+        fields, method = extract_insert_fields(response)
+        assert fields is None
+        assert method == "failed"
+        result = parse_insert_response(response, {"Name": "A", "Company": "Acme"})
+        assert result["parse_method"] == "failed"
+        assert result["confidence"] == "LOW"
+
+    def test_requests_offer_record_insert_tool(self):
+        params = build_insert_request({"Name": "A"}, "# Rules", "m")
+        assert tool_names(params) == ["web_search", "record_insert"]
+
+
+class TestCompanyResearch:
+    """Tests for sharing company research across contacts."""
+
+    def _company_response(self, facts):
+        block = MagicMock(type="tool_use", input={"facts": facts, "sources": ["acme.com"]})
+        block.name = "record_company"
+        response = MagicMock()
+        response.content = [block]
+        return response
+
+    def test_only_repeated_companies_shared(self):
+        companies = CompanyResearch(["Acme Inc", "acme", "Solo Corp"])
+        assert companies.is_shared("ACME")
+        assert not companies.is_shared("Solo Corp")
+        assert companies.get(MagicMock(), "Solo Corp", "m") is None
+
+    def test_company_researched_once(self):
+        client = MagicMock()
+        client.messages.create.return_value = self._company_response(["Builds rockets"])
+        companies = CompanyResearch(["Acme", "Acme", "Acme"])
+
+        results = [companies.get(client, "Acme", "m") for _ in range(3)]
+
+        assert client.messages.create.call_count == 1
+        assert results[0]["facts"] == ["Builds rockets"]
+        assert companies.researched == 1
+        assert companies.reused == 2
+
+    def test_concurrent_workers_single_flight(self):
+        import threading
+        import time
+
+        client = MagicMock()
+
+        def slow_create(**kwargs):
+            time.sleep(0.05)
+            return self._company_response(["Builds rockets"])
+
+        client.messages.create.side_effect = slow_create
+        companies = CompanyResearch(["Acme"] * 4)
+        threads = [threading.Thread(target=companies.get, args=(client, "Acme", "m")) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert client.messages.create.call_count == 1
+
+    def test_research_usage_recorded_and_taken_once(self, tmp_path):
+        from insert_telemetry import TelemetryWriter, load_events
+
+        response = self._company_response(["Builds rockets"])
+        response.usage = MagicMock(
+            input_tokens=800, output_tokens=100, cache_creation_input_tokens=0,
+            cache_read_input_tokens=0, server_tool_use=MagicMock(web_search_requests=3),
+        )
+        client = MagicMock()
+        client.messages.create.return_value = response
+        telemetry = TelemetryWriter(str(tmp_path / "t.jsonl"))
+        companies = CompanyResearch(["Acme", "Acme"], telemetry=telemetry)
+
+        companies.get(client, "Acme", "claude-sonnet-4-20250514")
+        companies.get(client, "Acme", "claude-sonnet-4-20250514")
+        telemetry.close()
+
+        usage, cost = companies.take_spend()
+        assert usage["web_search_requests"] == 3
+        assert usage["input_tokens"] == 800
+        assert cost > 0.03
+        assert companies.take_spend()[1] == 0.0
+        events = load_events(str(tmp_path / "t.jsonl"))
+        assert [(e["mode"], e["web_searches"]) for e in events] == [("company", 3)]
+
+    def test_cached_company_not_researched(self, tmp_path):
+        from insert_cache import ResearchCache
+
+        cache = ResearchCache(str(tmp_path / "cache.db"))
+        cache.put_company("Acme", ["Cached fact"], [])
+        client = MagicMock()
+        companies = CompanyResearch(["Acme", "Acme"], cache)
+
+        assert companies.get(client, "Acme", "m")["facts"] == ["Cached fact"]
+        assert not client.messages.create.called
+        cache.close()
+
+    def test_person_request_uses_reduced_search_budget(self):
+        params = build_insert_request(
+            {"Name": "Ada", "Company": "Acme"}, "# Rules", "m",
+            {"facts": ["Builds rockets"], "sources": ["acme.com"]},
+        )
+        assert params["tools"][0]["max_uses"] == 2
+        assert "Builds rockets" in params["messages"][0]["content"]
+        full = build_insert_request({"Name": "Ada", "Company": "Acme"}, "# Rules", "m")
+        assert full["tools"][0]["max_uses"] == 5
+
+
+class TestLinkedInEnrichment:
+    """Tests for using linkedin_scraper.py columns as pre-gathered context."""
+
+    ABOUT = "Ada has spent a decade building analytical engines. " * 5
+
+    def test_context_skips_empty_columns(self):
+        contact = {"Name": "Ada", "LI_Headline": "CEO at Acme", "LI_Location": " ", "LI_About": ""}
+        assert linkedin_context(contact) == {"Headline": "CEO at Acme"}
+
+    def test_budget_zero_when_headline_and_about_enough(self):
+        assert search_budget({"Headline": "CEO", "About": self.ABOUT}) == 0
+
+    def test_budget_shrinks_with_known_fields(self):
+        assert search_budget({}) == 5
+        assert search_budget({"Location": "NYC"}) == 5
+        assert search_budget({"Headline": "CEO"}) == 3
+        assert search_budget({"Headline": "CEO", "About": "Short.", "Website": "acme.com"}) == 1
+
+    def test_budget_capped_by_company_sharing(self):
+        assert search_budget({"Location": "NYC"}, max_uses=2) == 2
+
+    def test_well_enriched_contact_gets_no_search_tool(self):
+        contact = {"Name": "Ada", "Company": "Acme", "LI_Headline": "CEO at Acme", "LI_About": self.ABOUT}
+        params = build_insert_request(contact, "# Rules", "m")
+        assert tool_names(params) == ["record_insert"]
+        assert params["tool_choice"]["name"] == "record_insert"
+        assert "CEO at Acme" in params["messages"][0]["content"]
+
+    def test_partial_enrichment_reduces_searches(self):
+        contact = {"Name": "Ada", "Company": "Acme", "LI_Headline": "CEO at Acme"}
+        params = build_insert_request(contact, "# Rules", "m")
+        assert params["tools"][0]["max_uses"] == 3
+        assert "Headline: CEO at Acme" in params["messages"][0]["content"]
+        assert "tool_choice" not in params
+
+
+class TestResearchCache:
+    """Tests for reusing cached research through generation-only calls."""
+
+    def _response(self, insert, quality="detailed", facts=None, sources=None):
+        response = MagicMock()
+        response.content = [MagicMock(text=json.dumps({
+            "insert": insert,
+            "facts": facts or [],
+            "sources": sources or [],
+            "research_quality": quality,
+        }))]
+        return response
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        from insert_cache import ResearchCache
+
+        cache = ResearchCache(str(tmp_path / "cache.db"))
+        yield cache
+        cache.close()
+
+    def test_miss_researches_and_stores(self, cache):
+        client = MagicMock()
+        client.messages.create.return_value = self._response(
+            "First insert", facts=["Led the Series B"], sources=["TechCrunch"]
+        )
+        contact = {"Name": "Ada", "Company": "Acme", "Title": "CEO"}
+
+        result = research_and_generate_insert(client, contact, "# Rules", "m", cache=cache)
+
+        assert result["cached_research"] is False
+        assert "web_search" in tool_names(client.messages.create.call_args.kwargs)
+        assert cache.get("Ada", "Acme")["facts"] == ["Led the Series B"]
+
+    def test_hit_uses_generation_only_call(self, cache):
+        cache.put("Ada", "Acme", ["Led the Series B"], ["TechCrunch"], "detailed")
+        client = MagicMock()
+        client.messages.create.return_value = self._response("Second insert", quality="minimal")
+        contact = {"Name": "Ada", "Company": "Acme", "Title": "CEO"}
+
+        result = research_and_generate_insert(client, contact, "# Rules", "m", cache=cache)
+
+        kwargs = client.messages.create.call_args.kwargs
+        assert "web_search" not in tool_names(kwargs)
+        assert "Led the Series B" in kwargs["messages"][0]["content"]
+        assert result["cached_research"] is True
+        assert result["sources"] == ["TechCrunch"]
+        assert result["research_quality"] == "detailed"
+
+    def test_refresh_ignores_cache(self, cache):
+        cache.put("Ada", "Acme", ["Old fact"], ["Old"], "basic")
+        client = MagicMock()
+        client.messages.create.return_value = self._response("New", facts=["New fact"], sources=["Web"])
+        contact = {"Name": "Ada", "Company": "Acme", "Title": "CEO"}
+
+        research_and_generate_insert(client, contact, "# Rules", "m", cache=cache, refresh=True)
+
+        assert "web_search" in tool_names(client.messages.create.call_args.kwargs)
+        assert cache.get("Ada", "Acme")["facts"] == ["New fact"]
+
+    def test_minimal_research_not_cached(self, cache):
+        client = MagicMock()
+        client.messages.create.return_value = self._response("Generic", quality="minimal")
+        contact = {"Name": "Ada", "Company": "Acme", "Title": "CEO"}
+
+        research_and_generate_insert(client, contact, "# Rules", "m", cache=cache)
+
+        assert cache.get("Ada", "Acme") is None
+
+
+class TestResponseCache:
+    """Tests for replaying identical requests from the response cache."""
+
+    VALID = "I've been following how Acme approaches hiring and would love to hear what shaped your thinking on building teams."
+    CONTACT = {"Name": "Ada", "Company": "Acme", "Title": "CEO"}
+
+    def _message(self, insert, parse=True):
+        from anthropic.types import Message, TextBlock, ToolUseBlock, Usage
+
+        if parse:
+            block = ToolUseBlock(type="tool_use", id="toolu_1", name="record_insert", input={
+                "facts": ["Led the Series B"], "sources": ["Web", "Blog"],
+                "research_quality": "detailed", "insert": insert,
+            })
+        else:
+            block = TextBlock(type="text", text="No idea.")
+        return Message(
+            id="msg_1", type="message", role="assistant", model="m", content=[block],
+            stop_reason="tool_use", stop_sequence=None,
+            usage=Usage(input_tokens=5000, output_tokens=300),
+        )
+
+    @pytest.fixture
+    def caches(self, tmp_path):
+        from insert_cache import ResearchCache, ResponseCache
+
+        cache = ResearchCache(str(tmp_path / "cache.db"))
+        responses = ResponseCache(str(tmp_path / "responses.db"))
+        yield cache, responses
+        cache.close()
+        responses.close()
+
+    def test_rerun_replays_without_api_call(self, caches):
+        cache, responses = caches
+        client = MagicMock()
+        client.messages.create.return_value = self._message(self.VALID)
+        first = research_and_generate_insert(
+            client, self.CONTACT, "# Rules", "m", cache=cache, responses=responses
+        )
+
+        client.messages.create.reset_mock()
+        second = research_and_generate_insert(
+            client, self.CONTACT, "# Rules", "m", cache=cache, responses=responses
+        )
+
+        assert not client.messages.create.called
+        assert second["insert"] == first["insert"] == self.VALID
+        assert second["cached_response"] is True
+        assert second["usage"]["input_tokens"] == 0
+
+    def test_refresh_calls_again(self, caches):
+        cache, responses = caches
+        client = MagicMock()
+        client.messages.create.return_value = self._message(self.VALID)
+        research_and_generate_insert(client, self.CONTACT, "# Rules", "m", responses=responses)
+
+        result = research_and_generate_insert(
+            client, self.CONTACT, "# Rules", "m", refresh=True, responses=responses
+        )
+
+        assert client.messages.create.call_count == 2
+        assert result["cached_response"] is False
+
+    def test_cached_research_skips_company_call_for_lookup(self, caches):
+        """A cache-key lookup never triggers a live company research call."""
+        cache, responses = caches
+        cache.put("Ada", "Acme", ["Led the Series B"], ["Web", "Blog"], "detailed")
+        companies = CompanyResearch(["Acme", "Acme"], cache)
+        client = MagicMock()
+        client.messages.create.return_value = self._message(self.VALID)
+
+        result = research_and_generate_insert(
+            client, self.CONTACT, "# Rules", "m", cache=cache, companies=companies,
+            responses=responses,
+        )
+
+        assert client.messages.create.call_count == 1
+        assert tool_names(client.messages.create.call_args.kwargs) == ["record_insert"]
+        assert result["cached_research"] is True
+        assert companies.researched == 0
+
+    def test_invalid_repair_not_replayed_by_the_next_repair(self, caches):
+        _, responses = caches
+        client = MagicMock()
+        client.messages.create.side_effect = [
+            self._message("Too short."), self._message("Too short."), self._message(self.VALID),
+        ]
+
+        result = research_and_generate_insert(
+            client, self.CONTACT, "# Rules", "m", max_repairs=2, responses=responses
+        )
+
+        assert client.messages.create.call_count == 3
+        assert result["insert"] == self.VALID
+        assert result["repair_attempts"] == 2
+
+    def test_changed_contact_misses(self, caches):
+        _, responses = caches
+        client = MagicMock()
+        client.messages.create.return_value = self._message(self.VALID)
+        research_and_generate_insert(client, self.CONTACT, "# Rules", "m", responses=responses)
+        research_and_generate_insert(
+            client, {**self.CONTACT, "Title": "CTO"}, "# Rules", "m", responses=responses
+        )
+        assert client.messages.create.call_count == 2
+
+    def test_low_result_not_replayed(self, caches):
+        _, responses = caches
+        client = MagicMock()
+        client.messages.create.return_value = self._message("Too short.")
+        research_and_generate_insert(client, self.CONTACT, "# Rules", "m", responses=responses)
+        research_and_generate_insert(client, self.CONTACT, "# Rules", "m", responses=responses)
+        assert client.messages.create.call_count == 2
+
+    def test_unparseable_response_not_replayed(self, caches):
+        _, responses = caches
+        client = MagicMock()
+        client.messages.create.return_value = self._message(None, parse=False)
+        research_and_generate_insert(client, self.CONTACT, "# Rules", "m", responses=responses)
+        research_and_generate_insert(client, self.CONTACT, "# Rules", "m", responses=responses)
+        assert client.messages.create.call_count == 2
+
+
+class FakeStream:
+    """Stand-in for client.messages.stream(): yields events, records how many were read."""
+
+    def __init__(self, events, final_message=None):
+        self.events = events
+        self.final_message = final_message
+        self.consumed = 0
+        self.closed = False
+        self.current_message_snapshot = MagicMock(usage=MagicMock(input_tokens=100, output_tokens=5))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+    def __iter__(self):
+        for event in self.events:
+            self.consumed += 1
+            yield event
+
+    def get_final_message(self):
+        return self.final_message
+
+
+def stream_events(fields_json, chunk=12, search=True):
+    """Events for an optional web search followed by a chunked record_insert call."""
+    events = []
+    if search:
+        events.append(MagicMock(type="content_block_start", index=0,
+                                content_block=MagicMock(type="server_tool_use")))
+    tool_block = MagicMock(type="tool_use")
+    tool_block.name = "record_insert"
+    events.append(MagicMock(type="content_block_start", index=1, content_block=tool_block))
+    for i in range(0, len(fields_json), chunk):
+        delta = MagicMock(type="input_json_delta", partial_json=fields_json[i:i + chunk])
+        events.append(MagicMock(type="content_block_delta", index=1, delta=delta))
+    return events
+
+
+class TestStreaming:
+    """Tests for --stream: live progress and early abort of failing inserts."""
+
+    VALID = "I've been following how Acme approaches hiring and would love to hear what shaped your thinking on building teams."
+
+    def test_completed_insert_needs_closing_quote(self):
+        assert completed_insert('{"insert": "Half of it') is None
+        insert, start, end = completed_insert('{"facts": [], "insert": "Say \\"hi\\".", "wo')
+        assert insert == 'Say "hi".'
+        assert start == 0
+
+    def test_valid_insert_streams_to_the_end(self, caplog):
+        fields = json.dumps({"facts": ["f"], "sources": ["Web"], "research_quality": "basic",
+                             "insert": self.VALID, "word_count": 20})
+        final = MagicMock()
+        stream = FakeStream(stream_events(fields), final_message=final)
+        client = MagicMock()
+        client.messages.stream.return_value = stream
+
+        with caplog.at_level("INFO"):
+            response, aborted = stream_insert_response(client, {}, {"Name": "Ada"})
+
+        assert response is final
+        assert aborted is False
+        assert stream.consumed == len(stream.events)
+        assert "Ada | SEARCHING" in caplog.text
+        assert "Ada | WRITING" in caplog.text
+
+    def test_failing_insert_aborts_stream(self):
+        fields = json.dumps({"facts": ["Built the engine"], "sources": ["Web"],
+                             "research_quality": "detailed", "insert": "Too short.",
+                             "word_count": 2})
+        stream = FakeStream(stream_events(fields, chunk=4))
+        client = MagicMock()
+        client.messages.stream.return_value = stream
+
+        response, aborted = stream_insert_response(client, {}, {"Name": "Ada"})
+
+        assert aborted is True
+        assert stream.consumed < len(stream.events)
+        assert stream.closed
+        block = response.content[0]
+        assert block.input == {"facts": ["Built the engine"], "sources": ["Web"],
+                               "research_quality": "detailed", "insert": "Too short."}
+        assert response.usage.input_tokens == 100
+
+    def test_banned_phrase_aborts_mid_insert(self):
+        """A broken rule stops the stream while the insert is still being written."""
+        insert = ("I came across your talk on robotics and would love to hear how you "
+                  "chose which factories to automate first.")
+        fields = json.dumps({"facts": ["Built the engine"], "sources": ["Web"],
+                             "research_quality": "detailed", "insert": insert,
+                             "word_count": 21})
+        stream = FakeStream(stream_events(fields, chunk=4))
+        client = MagicMock()
+        client.messages.stream.return_value = stream
+
+        response, aborted = stream_insert_response(client, {}, {"Name": "Ada"})
+
+        assert aborted is True
+        assert stream.closed
+        streamed = response.content[0].input
+        assert streamed["facts"] == ["Built the engine"]
+        assert streamed["insert"].startswith("I came across")
+        assert "factories" not in streamed["insert"]
+        assert stream.consumed < len(stream.events) - 20
+
+    def test_partial_insert_tolerates_a_split_escape(self):
+        assert partial_insert('{"facts": [], "insert": "Say \\"hi') == 'Say "hi'
+        assert partial_insert('{"insert": "Caf\\u00') == "Caf"
+        assert partial_insert('{"facts": ["a"]') is None
+
+    def test_aborted_insert_repaired_from_streamed_research(self):
+        fields = json.dumps({"facts": ["Built the engine"], "sources": ["Web", "Blog"],
+                             "research_quality": "detailed", "insert": "Too short."})
+        repaired = MagicMock()
+        repaired.content = [MagicMock(type="text", text=json.dumps({"insert": self.VALID}))]
+        client = MagicMock()
+        client.messages.stream.return_value = FakeStream(stream_events(fields))
+        client.messages.create.return_value = repaired
+
+        result = research_and_generate_insert(
+            client, {"Name": "Ada", "Company": "Acme"}, "# Rules", "m", stream=True
+        )
+
+        assert result["aborted"] is True
+        assert result["insert"] == self.VALID
+        assert result["repair_attempts"] == 1
+        assert result["facts"] == ["Built the engine"]
+        repair_call = client.messages.create.call_args.kwargs
+        assert tool_names(repair_call) == ["record_insert"]
+
+    def test_text_answer_checked_too(self):
+        text = 'Here you go: {"sources": [], "insert": "Nope.", "word_count": 1}'
+        events = [MagicMock(type="content_block_start", index=0, content_block=MagicMock(type="text"))]
+        for i in range(0, len(text), 8):
+            events.append(MagicMock(type="content_block_delta", index=0,
+                                    delta=MagicMock(type="text_delta", text=text[i:i + 8])))
+        client = MagicMock()
+        client.messages.stream.return_value = FakeStream(events)
+
+        response, aborted = stream_insert_response(client, {}, {"Name": "Ada"})
+
+        assert aborted is True
+        assert response.content[0].input == {"sources": [], "insert": "Nope."}
+
+
 class TestRateLimiting:
     """Tests for rate limiting behavior."""
 
@@ -526,6 +1128,178 @@ class TestRateLimiting:
 
         assert args.delay == 2.5
 
+    def _rate_limit_error(self, retry_after="7"):
+        import anthropic
+
+        response = MagicMock(status_code=429, headers={"retry-after": retry_after})
+        return anthropic.RateLimitError("rate limited", response=response, body=None)
+
+    def test_retries_after_rate_limit(self):
+        """A rate-limited call pauses the shared governor for retry-after, then retries."""
+        result = {"insert": "x", "word_count": 1, "confidence": "LOW", "sources": []}
+        governor = MagicMock()
+        with patch("insert_generator.research_and_generate_insert",
+                   side_effect=[self._rate_limit_error(), result]) as mock_gen, \
+                patch("insert_generator.time.sleep") as mock_sleep:
+            assert generate_with_retries(None, {"Name": "A"}, "", "m", governor) == result
+        assert mock_gen.call_count == 2
+        governor.pause.assert_called_once_with(7.0)
+        assert not mock_sleep.called
+
+    def test_missing_retry_after_uses_default(self):
+        from rate_governor import DEFAULT_RETRY_AFTER
+
+        governor = MagicMock()
+        with patch("insert_generator.research_and_generate_insert",
+                   side_effect=[self._rate_limit_error(retry_after=None), {}]):
+            generate_with_retries(None, {"Name": "A"}, "", "m", governor)
+        governor.pause.assert_called_once_with(DEFAULT_RETRY_AFTER)
+
+    def test_raises_after_last_retry(self):
+        """After MAX_RATE_LIMIT_RETRIES retries the rate limit error propagates."""
+        import anthropic
+        from insert_generator import MAX_RATE_LIMIT_RETRIES
+
+        governor = MagicMock()
+        with patch("insert_generator.research_and_generate_insert",
+                   side_effect=self._rate_limit_error()) as mock_gen:
+            with pytest.raises(anthropic.RateLimitError):
+                generate_with_retries(None, {"Name": "A"}, "", "m", governor)
+        assert mock_gen.call_count == MAX_RATE_LIMIT_RETRIES + 1
+        assert governor.pause.call_count == MAX_RATE_LIMIT_RETRIES
+
+    VALID = (
+        "Your talk on scaling Acme's robotics line stuck with me, and I'd love to hear "
+        "how you chose which factories to automate first."
+    )
+
+    def _insert_response(self, insert=VALID):
+        response = MagicMock()
+        response.content = [MagicMock(type="text", text=json.dumps({
+            "insert": insert,
+            "facts": ["Runs robotics"],
+            "sources": ["acme.com", "news.example"],
+            "research_quality": "detailed",
+        }))]
+        return response
+
+    def _server_error(self, status=529):
+        import anthropic
+
+        response = MagicMock(status_code=status, headers={"retry-after": "2"})
+        return anthropic.InternalServerError("overloaded", response=response, body=None)
+
+    def test_overloaded_and_connection_errors_retried(self):
+        """A 529 or dropped connection is retried, not turned into a fallback insert."""
+        import anthropic
+
+        client = MagicMock()
+        client.messages.create.side_effect = [
+            self._server_error(),
+            anthropic.APIConnectionError(request=MagicMock()),
+            self._insert_response(),
+        ]
+        governor = MagicMock()
+        contact = {"Name": "Ada", "Company": "Acme"}
+
+        result = generate_with_retries(client, contact, "", "m", governor)
+
+        assert result["insert"] == self.VALID
+        assert result["confidence"] == "HIGH"
+        assert client.messages.create.call_count == 3
+        assert governor.pause.call_count == 2
+
+    def test_rate_limited_repair_retried(self):
+        """A 429 on a repair turn waits through the governor instead of keeping the bad insert."""
+        client = MagicMock()
+        client.messages.create.side_effect = [
+            self._insert_response("Too short."),
+            self._rate_limit_error(),
+            self._insert_response(),
+        ]
+        governor = MagicMock()
+
+        result = research_and_generate_insert(
+            client, {"Name": "Ada", "Company": "Acme"}, "", "m", governor, max_repairs=1
+        )
+
+        assert result["insert"] == self.VALID
+        assert result["repair_attempts"] == 1
+        governor.pause.assert_called_once_with(7.0)
+
+    def test_failed_contact_keeps_the_spend_of_its_billed_calls(self):
+        """Research billed before a repair stayed rate limited is reported on the error."""
+        import anthropic
+        from insert_generator import MAX_RATE_LIMIT_RETRIES
+
+        def create(**params):
+            if tool_names(params) == ["record_insert"]:
+                raise self._rate_limit_error()
+            response = self._insert_response("Too short.")
+            response.usage = MagicMock(
+                input_tokens=1000, output_tokens=100, cache_creation_input_tokens=0,
+                cache_read_input_tokens=0, server_tool_use=MagicMock(web_search_requests=2),
+            )
+            return response
+
+        client = MagicMock()
+        client.messages.create.side_effect = create
+
+        with pytest.raises(anthropic.RateLimitError) as raised:
+            generate_with_retries(
+                client, {"Name": "Ada", "Company": "Acme"}, "", "m", MagicMock(), max_repairs=1
+            )
+
+        attempts = MAX_RATE_LIMIT_RETRIES + 1
+        assert raised.value.usage["input_tokens"] == 1000 * attempts
+        assert raised.value.usage["web_search_requests"] == 2 * attempts
+
+    def test_rate_limited_company_research_retried(self):
+        company = MagicMock(type="tool_use", input={"facts": ["Builds rockets"], "sources": []})
+        company.name = "record_company"
+        client = MagicMock()
+        client.messages.create.side_effect = [self._rate_limit_error(), MagicMock(content=[company])]
+        governor = MagicMock()
+        companies = CompanyResearch(["Acme", "Acme"])
+
+        assert companies.get(client, "Acme", "m", governor)["facts"] == ["Builds rockets"]
+        governor.pause.assert_called_once_with(7.0)
+
+    def test_company_research_still_limited_is_not_kept(self):
+        """Research that stays rate limited is retried by the next colleague, not cached as None."""
+        from insert_generator import MAX_RATE_LIMIT_RETRIES
+
+        client = MagicMock()
+        client.messages.create.side_effect = self._rate_limit_error()
+        companies = CompanyResearch(["Acme", "Acme"])
+
+        assert companies.get(client, "Acme", "m", MagicMock()) is None
+        assert companies.get(client, "Acme", "m", MagicMock()) is None
+        assert client.messages.create.call_count == 2 * (MAX_RATE_LIMIT_RETRIES + 1)
+
+    def test_client_errors_not_retried(self):
+        import anthropic
+
+        error = anthropic.BadRequestError(
+            "bad", response=MagicMock(status_code=400, headers={}), body=None
+        )
+        governor = MagicMock()
+        with patch("insert_generator.research_and_generate_insert", side_effect=error) as mock_gen:
+            with pytest.raises(anthropic.BadRequestError):
+                generate_with_retries(None, {"Name": "A"}, "", "m", governor)
+        assert mock_gen.call_count == 1
+        assert not governor.pause.called
+
+    def test_build_output_row(self):
+        """Output row carries campaign, contact fields and joined sources."""
+        contact = {"Name": "A", "Email": "a@x.com", "Company": "X", "Title": "CEO",
+                   "Email Confidence": "HIGH"}
+        result = {"insert": "hi", "word_count": 1, "confidence": "LOW", "sources": ["a", "b"]}
+        row = build_output_row(contact, result, "camp")
+        assert row["Campaign"] == "camp"
+        assert row["Email Confidence"] == "HIGH"
+        assert row["Sources"] == "a, b"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
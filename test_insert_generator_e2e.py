@@ -4,8 +4,10 @@ These tests simulate the full pipeline with mocked API responses.
 """
 
 import csv
+import json
 import os
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, PropertyMock
 from insert_generator import (
     main,
@@ -14,6 +16,8 @@ from insert_generator import (
     validate_required_columns,
     is_already_processed,
     write_csv_row,
+    batch_state_path,
+    save_batch_state,
     MODELS,
 )
 
@@ -306,6 +310,578 @@ class TestE2ECheckpointing:
         assert processed == set()
 
 
+def run_main(tmp_path, mock_worksheet, client, extra_args, count=6, contacts_text=None):
+    """Run main() on `count` generated contacts (or contacts_text) and return the output CSV rows."""
+    contacts_csv = tmp_path / "contacts.csv"
+    contacts_csv.write_text(
+        contacts_text
+        or "Name,Company,Email,Title\n"
+        + "".join(f"Person {i},Company {i},p{i}@co{i}.com,CEO\n" for i in range(count))
+    )
+    output_csv = tmp_path / "out.csv"
+    prompt_file = tmp_path / "email_personalization_prompt.md"
+    prompt_file.write_text("# Rules")
+
+    argv = [
+        "insert_generator.py", "-i", str(contacts_csv), "-o", str(output_csv),
+        "--research-cache", str(tmp_path / "research_cache.db"),
+        "--telemetry", str(tmp_path / "telemetry.jsonl"),
+        "--response-cache", str(tmp_path / "response_cache.db"),
+    ] + extra_args
+    with patch("insert_generator.PROMPT_FILE", str(prompt_file)), \
+            patch("insert_generator.get_google_sheet", return_value=mock_worksheet), \
+            patch("insert_generator.anthropic.Anthropic", return_value=client), \
+            patch("insert_generator.get_current_branch", return_value="test-campaign"), \
+            patch("insert_generator.BATCH_POLL_SECONDS", 0), \
+            patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}), \
+            patch("sys.argv", argv):
+        main()
+
+    if not output_csv.exists():
+        return []
+    with open(output_csv) as f:
+        return list(csv.DictReader(f))
+
+
+class FakeBatches:
+    """Local stand-in for client.messages.batches (create/retrieve/results)."""
+
+    def __init__(self, polls_before_end=1, errored=()):
+        self.polls_before_end = polls_before_end
+        self.errored = set(errored)
+        self.requests = {}
+        self.create_calls = 0
+
+    def create(self, requests):
+        self.create_calls += 1
+        batch_id = f"msgbatch_{self.create_calls}"
+        self.requests[batch_id] = requests
+        return SimpleNamespace(id=batch_id)
+
+    def retrieve(self, batch_id):
+        ended = self.polls_before_end <= 0
+        self.polls_before_end -= 1
+        counts = SimpleNamespace(processing=0 if ended else 1, succeeded=0, errored=0)
+        return SimpleNamespace(
+            id=batch_id,
+            processing_status="ended" if ended else "in_progress",
+            request_counts=counts,
+        )
+
+    def results(self, batch_id):
+        # Results come back in arbitrary order
+        for request in reversed(self.requests[batch_id]):
+            custom_id = request["custom_id"]
+            if custom_id in self.errored:
+                result = SimpleNamespace(type="errored", error="overloaded")
+            else:
+                name = request["params"]["messages"][0]["content"].split("Name: ")[1].split("\n")[0]
+                message = MockAnthropicResponse(f"Batch insert for {name}", '["Web"]', "basic")
+                result = SimpleNamespace(type="succeeded", message=message)
+            yield SimpleNamespace(custom_id=custom_id, result=result)
+
+
+def make_batch_client(**kwargs):
+    client = MagicMock()
+    client.messages.batches = FakeBatches(**kwargs)
+    client.messages.create.side_effect = AssertionError("live call in batch mode")
+    return client
+
+
+class TestE2EConcurrentWorkers:
+    """Tests for --workers: concurrent calls, single ordered writer."""
+
+    def test_rows_written_in_input_order(self, tmp_path, mock_worksheet):
+        """Later contacts finishing first must not reorder the output."""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+
+        def create(**kwargs):
+            text = kwargs["messages"][0]["content"]
+            index = int(text.split("Person ")[1].split()[0])
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.02 * (6 - index))
+            with lock:
+                in_flight["now"] -= 1
+            return MockAnthropicResponse(f"Insert for person {index}", '["Web"]', "detailed")
+
+        client = MagicMock()
+        client.messages.create.side_effect = create
+
+        rows = run_main(
+            tmp_path, mock_worksheet, client, ["--workers", "3", "--delay", "0", "--max-repairs", "0"]
+        )
+
+        assert [r["Name"] for r in rows] == [f"Person {i}" for i in range(6)]
+        assert rows[4]["Personalized Insert"] == "Insert for person 4"
+        assert in_flight["max"] > 1
+        assert client.messages.create.call_count == 6
+        # All six sheet rows go up in one append, in input order
+        mock_worksheet.append_rows.assert_called_once()
+        sheet_rows = mock_worksheet.append_rows.call_args[0][0]
+        assert [row[1] for row in sheet_rows] == [f"Person {i}" for i in range(6)]
+
+
+class TestE2EBatchMode:
+    """Tests for --batch against a local stub of the batch endpoints."""
+
+    def test_batch_writes_all_results_in_order(self, tmp_path, mock_worksheet):
+        client = make_batch_client(polls_before_end=2)
+
+        rows = run_main(tmp_path, mock_worksheet, client, ["--batch", "--max-repairs", "0"], count=4)
+
+        assert [r["Name"] for r in rows] == [f"Person {i}" for i in range(4)]
+        assert rows[2]["Personalized Insert"] == "Batch insert for Person 2"
+        assert client.messages.batches.create_calls == 1
+        assert not os.path.exists(batch_state_path(str(tmp_path / "out.csv")))
+
+    def test_batch_requests_use_live_parameters(self, tmp_path, mock_worksheet):
+        client = make_batch_client()
+
+        run_main(tmp_path, mock_worksheet, client, ["--batch", "--model", "haiku", "--max-repairs", "0"], count=2)
+
+        requests = client.messages.batches.requests["msgbatch_1"]
+        assert [r["custom_id"] for r in requests] == ["contact-1", "contact-2"]
+        assert requests[0]["params"]["model"] == MODELS["haiku"]
+        assert requests[0]["params"]["tools"][0]["name"] == "web_search"
+
+    def test_errored_requests_not_written(self, tmp_path, mock_worksheet):
+        client = make_batch_client(errored={"contact-2"})
+
+        rows = run_main(tmp_path, mock_worksheet, client, ["--batch", "--max-repairs", "0"], count=3)
+
+        assert [r["Name"] for r in rows] == ["Person 0", "Person 2"]
+
+    def test_resume_uses_saved_batch(self, tmp_path, mock_worksheet):
+        """An interrupted run resumes the saved batch and skips rows already written."""
+        client = make_batch_client()
+        output_csv = str(tmp_path / "out.csv")
+        contacts = [
+            {"Name": f"Person {i}", "Company": f"Company {i}", "Email": f"p{i}@co{i}.com", "Title": "CEO"}
+            for i in range(3)
+        ]
+        requests = [
+            {"custom_id": f"contact-{i + 1}", "params": {"messages": [
+                {"role": "user", "content": f"Research:\nName: {c['Name']}\nCompany: x"}
+            ]}}
+            for i, c in enumerate(contacts)
+        ]
+        client.messages.batches.requests["msgbatch_old"] = requests
+        save_batch_state(batch_state_path(output_csv), {
+            "batch_id": "msgbatch_old",
+            "model": MODELS["sonnet"],
+            "requests": [{"custom_id": r["custom_id"], "contact": c} for r, c in zip(requests, contacts)],
+        })
+        write_csv_row(output_csv, {
+            "Campaign": "test-campaign", "Name": "Person 0", "Email": "p0@co0.com",
+            "Company": "Company 0", "Title": "CEO", "Personalized Insert": "Earlier insert",
+        }, is_first=True)
+
+        rows = run_main(tmp_path, mock_worksheet, client, ["--batch", "--max-repairs", "0"], count=3)
+
+        assert client.messages.batches.create_calls == 0
+        assert [r["Name"] for r in rows] == ["Person 0", "Person 1", "Person 2"]
+        assert rows[0]["Personalized Insert"] == "Earlier insert"
+        assert not os.path.exists(batch_state_path(output_csv))
+
+
+class TestE2ERepairLoop:
+    """Tests for --max-repairs: invalid inserts get follow-up turns."""
+
+    VALID = "I've been following how Acme approaches hiring and would love to hear what shaped your thinking on building teams."
+
+    def test_invalid_insert_repaired(self, tmp_path, mock_worksheet):
+        client = MagicMock()
+        client.messages.create.side_effect = [
+            MockAnthropicResponse("Too short insert.", '["Web", "Blog"]', "detailed"),
+            MockAnthropicResponse(self.VALID, '["Web", "Blog"]', "detailed"),
+        ]
+
+        rows = run_main(tmp_path, mock_worksheet, client, ["--delay", "0"], count=1)
+
+        assert rows[0]["Personalized Insert"] == self.VALID
+        assert rows[0]["Insert Confidence"] == "HIGH"
+        repair_call = client.messages.create.call_args_list[1].kwargs
+        assert [t["name"] for t in repair_call["tools"]] == ["record_insert"]
+        assert "Too short" in repair_call["messages"][-1]["content"]
+
+    def test_repairs_capped(self, tmp_path, mock_worksheet):
+        client = MagicMock()
+        client.messages.create.return_value = MockAnthropicResponse(
+            "Still too short.", '["Web"]', "basic"
+        )
+
+        rows = run_main(tmp_path, mock_worksheet, client, ["--delay", "0", "--max-repairs", "2"], count=1)
+
+        assert client.messages.create.call_count == 3
+        assert rows[0]["Insert Confidence"] == "LOW"
+
+
+class TestE2EModelCascade:
+    """Tests for --model cascade."""
+
+    VALID = TestE2ERepairLoop.VALID
+
+    def test_valid_cheap_result_not_escalated(self, tmp_path, mock_worksheet):
+        client = MagicMock()
+        client.messages.create.return_value = MockAnthropicResponse(self.VALID, '["Web"]', "basic")
+
+        rows = run_main(tmp_path, mock_worksheet, client,
+                        ["--model", "cascade", "--max-repairs", "0", "--delay", "0"], count=2)
+
+        assert len(rows) == 2
+        models = [c.kwargs["model"] for c in client.messages.create.call_args_list]
+        assert models == [MODELS["haiku"], MODELS["haiku"]]
+
+    def test_minimal_result_escalates(self, tmp_path, mock_worksheet):
+        client = MagicMock()
+        client.messages.create.side_effect = [
+            MockAnthropicResponse(self.VALID, '[]', "minimal"),
+            MockAnthropicResponse(self.VALID, '["Web", "Blog"]', "detailed"),
+        ]
+
+        rows = run_main(tmp_path, mock_worksheet, client,
+                        ["--model", "cascade", "--max-repairs", "0", "--delay", "0"], count=1)
+
+        models = [c.kwargs["model"] for c in client.messages.create.call_args_list]
+        assert models == [MODELS["haiku"], MODELS["sonnet"]]
+        assert rows[0]["Insert Confidence"] == "HIGH"
+
+    def test_last_tier_result_kept(self, tmp_path, mock_worksheet):
+        client = MagicMock()
+        client.messages.create.return_value = MockAnthropicResponse("Short.", '[]', "minimal")
+
+        rows = run_main(tmp_path, mock_worksheet, client,
+                        ["--model", "cascade", "--cascade-tiers", "haiku,sonnet,opus",
+                         "--max-repairs", "0", "--delay", "0"], count=1)
+
+        assert client.messages.create.call_count == 3
+        assert rows[0]["Insert Confidence"] == "LOW"
+
+    def test_cascade_summary_printed(self, tmp_path, mock_worksheet, capsys):
+        client = MagicMock()
+        client.messages.create.return_value = MockAnthropicResponse(self.VALID, '["Web"]', "basic")
+
+        run_main(tmp_path, mock_worksheet, client,
+                 ["--model", "cascade", "--max-repairs", "0", "--delay", "0"], count=1)
+
+        out = capsys.readouterr().out
+        assert "Cascade tiers:" in out
+        assert "haiku" in out and "sonnet" in out
+
+
+class TestE2EResponseCache:
+    """Tests for replaying unchanged contacts on a rerun."""
+
+    def make_client(self):
+        from anthropic.types import Message, ToolUseBlock, Usage
+
+        def create(**kwargs):
+            name = kwargs["messages"][0]["content"].split("Name: ")[1].split("\n")[0]
+            insert = f"{TestE2ERepairLoop.VALID[:-1]} at {name.split()[-1]}."
+            block = ToolUseBlock(type="tool_use", id="toolu_1", name="record_insert", input={
+                "facts": [f"Fact about {name}"], "sources": ["Web", "Blog"],
+                "research_quality": "detailed", "insert": insert,
+            })
+            return Message(
+                id="msg_1", type="message", role="assistant", model=kwargs["model"],
+                content=[block], stop_reason="tool_use", stop_sequence=None,
+                usage=Usage(input_tokens=100, output_tokens=10),
+            )
+
+        client = MagicMock()
+        client.messages.create.side_effect = create
+        return client
+
+    def remove_output(self, tmp_path):
+        for suffix in ("", ".idx", ".synced"):
+            os.remove(tmp_path / f"out.csv{suffix}")
+
+    def test_rerun_after_deleting_output_is_free(self, tmp_path, mock_worksheet):
+        first = run_main(tmp_path, mock_worksheet, self.make_client(), ["--delay", "0"], count=3)
+        self.remove_output(tmp_path)
+
+        client = self.make_client()
+        second = run_main(tmp_path, mock_worksheet, client, ["--delay", "0"], count=3)
+
+        assert client.messages.create.call_count == 0
+        assert [r["Personalized Insert"] for r in second] == [r["Personalized Insert"] for r in first]
+
+    def test_refresh_calls_api_again(self, tmp_path, mock_worksheet):
+        run_main(tmp_path, mock_worksheet, self.make_client(), ["--delay", "0"], count=2)
+        self.remove_output(tmp_path)
+
+        client = self.make_client()
+        run_main(tmp_path, mock_worksheet, client, ["--delay", "0", "--refresh"], count=2)
+
+        assert client.messages.create.call_count == 2
+        assert "web_search" in [t["name"] for t in client.messages.create.call_args.kwargs["tools"]]
+
+
+class TestE2ETelemetry:
+    """Tests for telemetry events and --report."""
+
+    def test_event_per_contact_and_report(self, tmp_path, mock_worksheet, capsys):
+        client = MagicMock()
+        client.messages.create.return_value = MockAnthropicResponse(
+            TestE2ERepairLoop.VALID, '["Web", "Blog"]', "detailed"
+        )
+        run_main(tmp_path, mock_worksheet, client, ["--delay", "0"], count=3)
+
+        with open(tmp_path / "telemetry.jsonl") as f:
+            events = [json.loads(line) for line in f]
+        assert [e["name"] for e in events] == [f"Person {i}" for i in range(3)]
+        assert all(e["valid"] and e["latency_s"] is not None for e in events)
+        assert len({e["run_id"] for e in events}) == 1
+
+        capsys.readouterr()
+        argv = ["insert_generator.py", "--report", "--telemetry", str(tmp_path / "telemetry.jsonl")]
+        with patch("sys.argv", argv):
+            assert main() == 0
+        assert "3 calls, 3 valid inserts" in capsys.readouterr().out
+
+    def test_report_missing_file(self, tmp_path, capsys):
+        argv = ["insert_generator.py", "--report", "--telemetry", str(tmp_path / "none.jsonl")]
+        with patch("sys.argv", argv):
+            assert main() == 1
+
+
+class TestE2EStreaming:
+    """Tests for --stream."""
+
+    def test_stream_rejected_with_batch(self, tmp_path, mock_worksheet):
+        client = make_batch_client()
+        rows = run_main(tmp_path, mock_worksheet, client, ["--stream", "--batch"])
+        assert rows == []
+        assert client.messages.batches.create_calls == 0
+
+    def test_stream_used_for_live_calls(self, tmp_path, mock_worksheet):
+        final = MockAnthropicResponse(TestE2ERepairLoop.VALID, '["Web", "Blog"]', "detailed")
+        stream = MagicMock()
+        stream.__enter__.return_value = stream
+        stream.__iter__.return_value = iter([])
+        stream.get_final_message.return_value = final
+        client = MagicMock()
+        client.messages.stream.return_value = stream
+
+        rows = run_main(tmp_path, mock_worksheet, client, ["--stream", "--delay", "0"], count=1)
+
+        assert rows[0]["Personalized Insert"] == TestE2ERepairLoop.VALID
+        assert client.messages.stream.call_count == 1
+        assert not client.messages.create.called
+
+
+class TestE2EBackgroundSheetWriter:
+    """Tests for sheet uploads running behind generation."""
+
+    def make_client(self):
+        client = MagicMock()
+        client.messages.create.return_value = MockAnthropicResponse(
+            TestE2ERepairLoop.VALID, '["Web", "Blog"]', "detailed"
+        )
+        return client
+
+    def test_slow_sheet_does_not_block_generation(self, tmp_path, mock_worksheet):
+        import threading
+
+        all_generated = threading.Event()
+        client = self.make_client()
+
+        def create(**kwargs):
+            if client.messages.create.call_count == 6:
+                all_generated.set()
+            return client.messages.create.return_value
+
+        client.messages.create.side_effect = create
+        waits = []
+        mock_worksheet.append_rows.side_effect = lambda *a, **k: waits.append(all_generated.wait(5))
+
+        rows = run_main(tmp_path, mock_worksheet, client, ["--delay", "0", "--sheet-batch-rows", "1"])
+
+        assert len(rows) == 6
+        assert waits == [True] * 6
+
+    def test_failed_upload_replayed_next_run(self, tmp_path, mock_worksheet):
+        from gspread.exceptions import APIError
+
+        response = MagicMock()
+        response.json.return_value = {"error": {"code": 403, "message": "denied", "status": "X"}}
+        mock_worksheet.append_rows.side_effect = APIError(response)
+        run_main(tmp_path, mock_worksheet, self.make_client(), ["--delay", "0"])
+        with open(tmp_path / "out.csv.synced") as f:
+            assert f.read().strip() == "0"
+
+        mock_worksheet.append_rows.reset_mock(side_effect=True)
+        client = self.make_client()
+        rows = run_main(tmp_path, mock_worksheet, client, ["--delay", "0"])
+
+        assert client.messages.create.call_count == 0
+        assert len(rows) == 6
+        sheet_rows = mock_worksheet.append_rows.call_args[0][0]
+        assert [row[1] for row in sheet_rows] == [f"Person {i}" for i in range(6)]
+        with open(tmp_path / "out.csv.synced") as f:
+            assert f.read().strip() == "6"
+
+    def test_existing_output_without_journal_not_replayed(self, tmp_path, mock_worksheet):
+        run_main(tmp_path, mock_worksheet, self.make_client(), ["--delay", "0"])
+        os.remove(tmp_path / "out.csv.synced")
+        mock_worksheet.append_rows.reset_mock()
+
+        run_main(tmp_path, mock_worksheet, self.make_client(), ["--delay", "0"])
+
+        assert not mock_worksheet.append_rows.called
+
+
+class TestE2EStubServer:
+    """Tests running main() over HTTP against the local Messages API stand-in."""
+
+    def run_bench(self, size, extra_args=(), **profile):
+        from benchmarks.bench_insert_generator import run_size
+        from benchmarks.fake_messages import FakeMessagesServer, MessagesProfile
+
+        args = ["--workers", "4", "--rpm", "0", "--delay", "0", *extra_args]
+        with FakeMessagesServer(MessagesProfile(**profile).scaled(0)) as server:
+            return run_size(server, size, args, sheet_latency=0)
+
+    def test_every_contact_gets_a_valid_insert(self):
+        run = self.run_bench(12)
+
+        assert run["exit_code"] == 0
+        assert run["valid_inserts"] == 12
+        assert run["sheet_rows"] == 12
+        # Only the two companies with a second contact are researched up front
+        assert run["api_requests_by_kind"]["company"] == 2
+        # ...and those calls are in telemetry too: one event and two searches per call
+        assert run["telemetry_events"] == run["api_requests"] == 14
+        assert run["web_searches"] == 28
+
+    def test_rate_limits_and_bad_answers_recovered(self):
+        # Worker threads draw from the server's RNG in no fixed order; extra
+        # retries keep a contact from failing on an unlucky run of 429s
+        with patch("insert_generator.MAX_RATE_LIMIT_RETRIES", 8):
+            run = self.run_bench(
+                20, rate_limit_rate=0.2, retry_after=0.01, invalid_rate=0.2, seed=7
+            )
+
+        from insert_generator import DEFAULT_MAX_REPAIRS
+
+        invalid = run["injected_answers"]["invalid"]
+        repairs = run["repair_attempts"]
+        assert run["rate_limited_responses"] > 0
+        assert invalid > 0
+        # Every repair is one generation-only call answering one invalid insert;
+        # an invalid answer goes unrepaired only when its contact is at the cap
+        assert repairs == run["api_requests_by_kind"]["generation"]
+        assert max(invalid - 20, 1) <= repairs <= min(invalid, 20 * DEFAULT_MAX_REPAIRS)
+        assert run["sheet_rows"] == 20
+
+    def test_every_retry_goes_through_the_governor(self):
+        from insert_generator import MAX_RATE_LIMIT_RETRIES
+
+        run = self.run_bench(1, rate_limit_rate=1.0, retry_after=0.001)
+
+        # No hidden SDK retries: one HTTP round trip per generate_with_retries attempt
+        assert run["rate_limited_responses"] == MAX_RATE_LIMIT_RETRIES + 1
+        assert run["sheet_rows"] == 0
+
+    def test_streamed_responses_parsed(self):
+        run = self.run_bench(6, ["--stream"])
+
+        assert run["valid_inserts"] == 6
+
+
+class TestE2EScheduling:
+    """Tests for priority ordering and run budgets."""
+
+    CONTACTS = (
+        "Name,Company,Email,Title,Email Confidence,Priority\n"
+        "Low,A,low@a.com,CEO,LOW,9\n"
+        "Blank,B,blank@b.com,CEO,,\n"
+        "High Minor,C,hm@c.com,CEO,HIGH,1\n"
+        "Medium,D,m@d.com,CEO,MEDIUM,5\n"
+        "High Major,E,hj@e.com,CEO,HIGH,3\n"
+    )
+
+    def make_client(self):
+        client = MagicMock()
+        client.messages.create.return_value = MockAnthropicResponse(
+            TestE2ERepairLoop.VALID, '["Web", "Blog"]', "detailed"
+        )
+        return client
+
+    def names(self, rows):
+        return [row["Name"] for row in rows]
+
+    def test_bare_priority_puts_high_email_confidence_first(self, tmp_path, mock_worksheet):
+        rows = run_main(
+            tmp_path, mock_worksheet, self.make_client(), ["--delay", "0", "--priority"],
+            contacts_text=self.CONTACTS,
+        )
+        assert self.names(rows) == ["High Minor", "High Major", "Medium", "Low", "Blank"]
+
+    def test_priority_column_breaks_ties(self, tmp_path, mock_worksheet):
+        args = ["--delay", "0", "--priority", "Email Confidence:HIGH,MEDIUM,LOW", "--priority", "Priority"]
+        rows = run_main(tmp_path, mock_worksheet, self.make_client(), args, contacts_text=self.CONTACTS)
+        assert self.names(rows)[:2] == ["High Major", "High Minor"]
+
+    def test_input_order_by_default(self, tmp_path, mock_worksheet):
+        rows = run_main(
+            tmp_path, mock_worksheet, self.make_client(), ["--delay", "0"],
+            contacts_text=self.CONTACTS,
+        )
+        assert self.names(rows) == ["Low", "Blank", "High Minor", "Medium", "High Major"]
+
+    def test_max_runtime_stops_before_starting(self, tmp_path, mock_worksheet, capsys):
+        client = self.make_client()
+        rows = run_main(tmp_path, mock_worksheet, client, ["--delay", "0", "--max-runtime", "0"])
+
+        assert rows == []
+        assert not client.messages.create.called
+        assert "6 contacts left for the next run" in capsys.readouterr().out
+
+    def test_failed_contacts_count_against_max_cost(self, tmp_path, mock_worksheet, capsys):
+        """Research billed before a contact fails still spends the budget."""
+        import anthropic
+
+        def create(**params):
+            if [t["name"] for t in params["tools"]] == ["record_insert"]:
+                response = MagicMock(status_code=429, headers={"retry-after": "0"})
+                raise anthropic.RateLimitError("rate limited", response=response, body=None)
+            response = MockAnthropicResponse("Too short.", '["Web"]', "detailed")
+            response.usage = MagicMock(
+                input_tokens=3000, output_tokens=300, cache_creation_input_tokens=0,
+                cache_read_input_tokens=0, server_tool_use=MagicMock(web_search_requests=2),
+            )
+            return response
+
+        client = MagicMock()
+        client.messages.create.side_effect = create
+        rows = run_main(
+            tmp_path, mock_worksheet, client,
+            ["--delay", "0", "--workers", "1", "--max-repairs", "1", "--max-cost", "0.02"],
+        )
+
+        assert rows == []
+        assert "--max-cost $0.02 reached" in capsys.readouterr().out
+
+    def test_max_cost_stops_early(self):
+        run = TestE2EStubServer().run_bench(
+            20, ["--workers", "1", "--max-cost", "0.1", "--no-company-research"]
+        )
+        assert 0 < run["sheet_rows"] < 20
+
+    def test_budget_rejected_with_batch(self, tmp_path, mock_worksheet):
+        client = make_batch_client()
+        rows = run_main(tmp_path, mock_worksheet, client, ["--batch", "--max-cost", "1"])
+        assert rows == []
+        assert client.messages.batches.create_calls == 0
+
+
 class TestE2EInsertValidation:
     """Tests for insert quality validation."""
 
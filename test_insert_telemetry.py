@@ -0,0 +1,137 @@
+"""Tests for insert_telemetry.py - generation events and run reports."""
+
+import json
+
+import pytest
+from insert_telemetry import (
+    TelemetryWriter,
+    build_report,
+    call_cost,
+    company_event,
+    format_report,
+    generation_event,
+    issue_code,
+    load_events,
+    percentile,
+)
+
+CONTACT = {"Name": "Ada", "Company": "Acme"}
+
+
+def make_result(insert="A valid insert.", **usage):
+    return {
+        "insert": insert,
+        "confidence": "HIGH",
+        "parse_method": "tool",
+        "repair_attempts": 0,
+        "usage": {"input_tokens": 1000, "output_tokens": 200, **usage},
+    }
+
+
+class TestCost:
+    """Tests for cost estimates."""
+
+    def test_tokens_and_searches_priced(self):
+        usage = {"input_tokens": 1_000_000, "output_tokens": 100_000, "web_search_requests": 2}
+        assert call_cost("claude-sonnet-4-20250514", usage) == pytest.approx(3.0 + 1.5 + 0.02)
+
+    def test_cache_reads_cheaper_than_input(self):
+        model = "claude-haiku-4-20250514"
+        assert call_cost(model, {"cache_read_input_tokens": 1000}) < call_cost(model, {"input_tokens": 1000})
+
+    def test_batch_discount_applies_to_tokens(self):
+        usage = {"input_tokens": 1_000_000, "web_search_requests": 1}
+        assert call_cost("claude-opus-4-20250514", usage, batch=True) == pytest.approx(7.5 + 0.01)
+
+    def test_unknown_model_costs_nothing(self):
+        assert call_cost("mystery-model", {"input_tokens": 1000}) == 0.0
+
+
+class TestEvents:
+    """Tests for building and writing events."""
+
+    def test_event_fields(self):
+        event = generation_event(
+            CONTACT, "claude-sonnet-4-20250514", make_result(web_search_requests=3), 2.5, retries=1
+        )
+        assert event["web_searches"] == 3
+        assert event["latency_s"] == 2.5
+        assert event["rate_limit_retries"] == 1
+        assert event["valid"] is True
+        assert event["cost_usd"] > 0
+
+    def test_issues_make_event_invalid(self):
+        event = generation_event(CONTACT, "m", make_result(), 1.0, issues=["Too short: 3 words"])
+        assert event["valid"] is False
+
+    def test_company_event_counts_searches_but_no_insert(self):
+        event = company_event(
+            "Acme", "claude-sonnet-4-20250514", {"input_tokens": 500, "web_search_requests": 2}, 1.5
+        )
+        assert event["mode"] == "company"
+        assert event["company"] == "Acme"
+        assert event["web_searches"] == 2
+        assert event["cost_usd"] > 0.02
+        assert event["valid"] is False
+
+    def test_writer_appends_stamped_lines(self, tmp_path):
+        path = str(tmp_path / "t.jsonl")
+        writer = TelemetryWriter(path, run_id="run-1", clock=lambda: 42.0)
+        writer.record({"name": "Ada"})
+        writer.record({"name": "Bob"})
+        writer.close()
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0] == {"run_id": "run-1", "ts": 42.0, "name": "Ada"}
+        assert writer.events == 2
+
+    def test_load_events_defaults_to_latest_run(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        path.write_text(
+            '{"run_id": "a", "name": "1"}\n'
+            "not json\n"
+            '{"run_id": "b", "name": "2"}\n'
+            '{"run_id": "b", "name": "3"}\n'
+        )
+        assert [e["name"] for e in load_events(str(path))] == ["2", "3"]
+        assert [e["name"] for e in load_events(str(path), "a")] == ["1"]
+
+
+class TestReport:
+    """Tests for aggregating a run."""
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile([], 50) is None
+
+    def test_issue_code_drops_details(self):
+        assert issue_code("Too short: 9 words (need 15-25)") == "Too short"
+        assert issue_code("Contains em dash (use 'and' instead)") == "Contains em dash"
+
+    def test_report_aggregates_run(self):
+        events = [
+            {"run_id": "r", "model": "m1", "latency_s": 1.0, "valid": True, "cost_usd": 0.02,
+             "confidence": "HIGH", "issues": []},
+            {"run_id": "r", "model": "m1", "latency_s": 3.0, "valid": False, "cost_usd": 0.02,
+             "confidence": "LOW", "issues": ["Too long: 30 words (need 15-25)"]},
+            {"run_id": "r", "model": "m2", "latency_s": 5.0, "valid": False, "cost_usd": 0.0,
+             "error": "Rate limit exceeded after retries", "issues": []},
+        ]
+        report = build_report(events)
+        assert report["p50_latency_s"] == 3.0
+        assert report["p95_latency_s"] == 5.0
+        assert report["cost_per_valid_usd"] == pytest.approx(0.04)
+        assert report["failures"] == {"Too long": 1, "API error": 1}
+        assert report["models"]["m1"]["calls"] == 2
+        assert "per valid insert" in format_report(report)
+
+    def test_no_valid_inserts_has_no_cost_per_valid(self):
+        report = build_report([{"run_id": "r", "model": "m", "cost_usd": 0.1, "valid": False}])
+        assert report["cost_per_valid_usd"] is None
+        assert "$0.1000 total, - per valid insert" in format_report(report)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,118 @@
+"""Tests for insert_validator.py - shared insert rules and bulk validation."""
+
+import time
+
+import pytest
+from insert_validator import (
+    BANNED_PHRASE,
+    BANNED_PHRASES,
+    EM_DASH_USED,
+    MISSING_PUNCTUATION,
+    TOO_LONG,
+    TOO_SHORT,
+    check_insert,
+    check_partial,
+    compile_banned,
+    find_banned,
+    issue_counts,
+    validate_insert,
+    validate_many,
+)
+
+VALID = (
+    "I've been thinking a lot about fintech and PayPal's push on "
+    "financial inclusion stands out. I'm curious what made you bet on that."
+)
+
+
+def codes(issues):
+    return [issue.code for issue in issues]
+
+
+class TestCheckInsert:
+    """Tests for single-insert checks."""
+
+    def test_valid_insert_has_no_issues(self):
+        assert check_insert(VALID) == []
+        assert validate_insert(VALID) == (True, [])
+
+    def test_banned_phrase_case_insensitive(self):
+        insert = "I Noticed " + VALID
+        assert codes(check_insert(insert)) == [BANNED_PHRASE]
+        assert validate_insert(insert)[1] == ["Contains banned phrase: 'i noticed'"]
+
+    def test_banned_phrase_needs_word_boundaries(self):
+        insert = VALID.replace("I'm curious", "Chi noticed and I'm curious")
+        assert BANNED_PHRASE not in codes(check_insert(insert))
+
+    def test_phrases_reported_once_in_list_order(self):
+        insert = "Your journey, I noticed, and I noticed your journey again today."
+        messages = [i.message for i in check_insert(insert) if i.code == BANNED_PHRASE]
+        assert messages == [
+            "Contains banned phrase: 'i noticed'",
+            "Contains banned phrase: 'your journey'",
+        ]
+
+    def test_empty_insert(self):
+        assert codes(check_insert(None)) == [TOO_SHORT, MISSING_PUNCTUATION]
+
+    def test_compile_banned_custom_list(self):
+        pattern = compile_banned(["Deep Dive", "deep"])
+        assert list(find_banned("a deep dive into it", pattern)) == [(2, "deep dive")]
+        assert list(find_banned("deeper, undeep", pattern)) == []
+
+
+class TestCheckPartial:
+    """Tests for checking an insert while it is still streaming."""
+
+    def test_unfinished_insert_is_not_short_or_unpunctuated(self):
+        assert check_partial("I've been thinking a lot about fin") == []
+
+    def test_banned_phrase_caught_once_its_last_word_is_done(self):
+        assert check_partial("Hi, I notic") == []
+        assert check_partial("Hi, I noticed") == []  # Could still become "noticeds"
+        assert codes(check_partial("Hi, I noticed ")) == [BANNED_PHRASE]
+        assert check_partial("Chi noticed that ") == []
+
+    def test_too_long_once_a_word_past_the_limit_is_complete(self):
+        words = " ".join(["word"] * 25)
+        assert check_partial(words + " wo") == []
+        assert codes(check_partial(words + " word ")) == [TOO_LONG]
+
+    def test_em_dash_caught_at_once(self):
+        assert codes(check_partial("Your launch —")) == [EM_DASH_USED]
+
+
+class TestValidateMany:
+    """Tests for bulk validation."""
+
+    def test_matches_single_checks(self):
+        inserts = [
+            VALID,
+            "I came across your work.",
+            None,
+            VALID.replace("and", "—"),
+            "your journey",
+            42,
+            "Resonates with me\nas someone who builds.",
+        ]
+        bulk = validate_many(inserts)
+        assert bulk == [check_insert("" if i is None else str(i)) for i in inserts]
+
+    def test_issue_counts(self):
+        results = validate_many([VALID, "I noticed it — really", "Short."])
+        counts = issue_counts(results)
+        assert counts[TOO_SHORT] == 2
+        assert counts[BANNED_PHRASE] == 1
+        assert counts[EM_DASH_USED] == 1
+
+    def test_ten_thousand_inserts_fast(self):
+        inserts = [VALID, f"{VALID} {BANNED_PHRASES[3]}."] * 5000
+        started = time.perf_counter()
+        results = validate_many(inserts)
+        assert time.perf_counter() - started < 2.0
+        assert issue_counts(results)[BANNED_PHRASE] == 5000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
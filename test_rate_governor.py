@@ -0,0 +1,199 @@
+"""Tests for rate_governor.py - shared RPM/TPM budget."""
+
+import threading
+
+import pytest
+from types import SimpleNamespace
+
+from rate_governor import DEFAULT_RETRY_AFTER, DEFAULT_TOKEN_ESTIMATE, RequestGovernor
+
+
+# 2026-01-01T00:00:00Z; header reset times below are relative to it
+WALL_START = 1767225600.0
+
+
+def reset_at(seconds):
+    """RFC 3339 reset timestamp `seconds` after WALL_START."""
+    from datetime import datetime, timezone
+
+    return datetime.fromtimestamp(WALL_START + seconds, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class FakeClock:
+    """Manual clock; sleeping through Condition.wait is replaced by advancing time."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_governor(clock, **kwargs):
+    governor = RequestGovernor(clock=clock, wall_clock=lambda: WALL_START + clock.now, **kwargs)
+
+    # Waiting advances the fake clock instead of blocking the test
+    def fake_wait(timeout=None):
+        clock.now += timeout
+
+    governor._cond.wait = fake_wait
+    return governor
+
+
+class TestRequestLimit:
+    """Tests for the requests-per-minute window."""
+
+    def test_requests_under_limit_do_not_wait(self):
+        clock = FakeClock()
+        governor = make_governor(clock, rpm=3)
+        for _ in range(3):
+            governor.acquire()
+        assert clock.now == 0.0
+        assert governor.wait_seconds == 0.0
+
+    def test_request_over_limit_waits_for_window(self):
+        clock = FakeClock()
+        governor = make_governor(clock, rpm=2)
+        governor.acquire()
+        clock.now = 10.0
+        governor.acquire()
+        governor.acquire()
+        # Third call must wait until the first one leaves the 60s window
+        assert clock.now == pytest.approx(60.0)
+        assert governor.wait_seconds == pytest.approx(50.0)
+
+    def test_min_interval_spaces_calls(self):
+        clock = FakeClock()
+        governor = make_governor(clock, min_interval=1.5)
+        governor.acquire()
+        governor.acquire()
+        assert clock.now == pytest.approx(1.5)
+
+
+class TestTokenLimit:
+    """Tests for the tokens-per-minute window."""
+
+    def test_default_estimate_before_any_call(self):
+        governor = RequestGovernor()
+        assert governor.token_estimate == DEFAULT_TOKEN_ESTIMATE
+
+    def test_estimate_tracks_recorded_usage(self):
+        governor = RequestGovernor()
+        governor.record(governor.acquire(), 1000)
+        governor.record(governor.acquire(), 3000)
+        assert governor.token_estimate == 2000
+
+    def test_tokens_over_limit_wait(self):
+        clock = FakeClock()
+        governor = make_governor(clock, tpm=10000)
+        slot = governor.acquire(estimated_tokens=6000)
+        governor.record(slot, 6000)
+        clock.now = 5.0
+        governor.acquire(estimated_tokens=6000)
+        assert clock.now == pytest.approx(60.0)
+
+    def test_recorded_usage_replaces_estimate(self):
+        clock = FakeClock()
+        governor = make_governor(clock, tpm=10000)
+        slot = governor.acquire(estimated_tokens=9000)
+        governor.record(slot, 1000)
+        governor.acquire(estimated_tokens=5000)
+        assert clock.now == 0.0
+
+    def test_oversized_request_allowed_in_empty_window(self):
+        clock = FakeClock()
+        governor = make_governor(clock, tpm=1000)
+        governor.acquire(estimated_tokens=5000)
+        assert clock.now == 0.0
+
+
+class TestConcurrency:
+    """Tests for sharing one governor between threads."""
+
+    def test_threads_share_request_budget(self):
+        governor = RequestGovernor(rpm=5, window=0.2)
+        slots = []
+
+        def worker():
+            slots.append(governor.acquire())
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        starts = sorted(slot[0] for slot in slots)
+        assert len(starts) == 10
+        # No more than 5 starts inside any 0.2s window
+        for i in range(5, 10):
+            assert starts[i] - starts[i - 5] >= 0.2 - 1e-6
+
+
+class TestHeaderPacing:
+    """Tests for pacing from rate-limit response headers."""
+
+    def test_remaining_requests_spread_until_reset(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+        governor.acquire()
+        governor.observe({
+            "anthropic-ratelimit-requests-remaining": "4",
+            "anthropic-ratelimit-requests-reset": reset_at(8),
+        })
+        governor.acquire()
+        assert clock.now == pytest.approx(2.0)
+
+    def test_exhausted_requests_wait_for_reset(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+        governor.observe({
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-requests-reset": reset_at(12),
+        })
+        governor.acquire()
+        assert clock.now == pytest.approx(12.0)
+
+    def test_low_token_budget_waits_for_refill(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+        governor.record(governor.acquire(), 2000)
+        governor.observe({
+            "anthropic-ratelimit-tokens-limit": "60000",
+            "anthropic-ratelimit-tokens-remaining": "500",
+            "anthropic-ratelimit-tokens-reset": reset_at(60),
+        })
+        governor.acquire()
+        # 1500 tokens short at 1000 tokens/second
+        assert clock.now == pytest.approx(1.5)
+
+    def test_ample_budget_does_not_wait(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+        governor.observe({
+            "anthropic-ratelimit-requests-remaining": "1000",
+            "anthropic-ratelimit-requests-reset": reset_at(1),
+            "anthropic-ratelimit-tokens-remaining": "100000",
+        })
+        governor.acquire()
+        governor.acquire()
+        assert clock.now == pytest.approx(0.001)
+
+    def test_429_pauses_for_retry_after(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+        governor.observe_response(SimpleNamespace(status_code=429, headers={"retry-after": "9"}))
+        governor.acquire()
+        assert clock.now == pytest.approx(9.0)
+        assert governor.rate_limited == 1
+
+    def test_429_without_retry_after_uses_default(self):
+        clock = FakeClock()
+        governor = make_governor(clock)
+        governor.observe_response(SimpleNamespace(status_code=429, headers={}))
+        governor.acquire()
+        assert clock.now == pytest.approx(DEFAULT_RETRY_AFTER)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
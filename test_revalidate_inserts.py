@@ -0,0 +1,123 @@
+"""Tests for revalidate_inserts.py - bulk re-validation of sheet inserts."""
+
+import csv
+from unittest.mock import MagicMock, patch
+
+import pytest
+from gspread.utils import a1_to_rowcol
+from revalidate_inserts import ISSUES_COLUMN, main, read_columns
+
+VALID = (
+    "I've been thinking a lot about fintech and PayPal's push on "
+    "financial inclusion stands out. I'm curious what made you bet on that."
+)
+HEADERS = ["Campaign", "Name", "Email", "Company", "Title", "Personalized Insert"]
+
+
+def make_worksheet(rows, headers=HEADERS):
+    """Worksheet mock serving column ranges like 'F2:F' from an in-memory grid."""
+    grid = [list(headers)] + [list(row) for row in rows]
+    worksheet = MagicMock()
+    worksheet.row_values.return_value = list(headers)
+
+    def batch_get(ranges):
+        result = []
+        for a1 in ranges:
+            col = a1_to_rowcol(a1.split(":")[0])[1] - 1
+            values = [[row[col]] if col < len(row) and row[col] else [] for row in grid[1:]]
+            while values and not values[-1]:
+                values.pop()  # Sheets omits trailing empty rows
+            result.append(values)
+        return result
+
+    worksheet.batch_get.side_effect = batch_get
+    return worksheet
+
+
+def run(worksheet, *args):
+    with patch("revalidate_inserts.load_config", return_value={}), \
+            patch("revalidate_inserts.get_google_sheet", return_value=worksheet), \
+            patch("sys.argv", ["revalidate_inserts.py", *args]):
+        return main()
+
+
+ROWS = [
+    ["round-1", "Ada", "ada@x.com", "Acme", "CEO", VALID],
+    ["round-1", "Bob", "bob@x.com", "Beta", "CTO", "I noticed your work — great."],
+    ["round-2", "Cy", "cy@x.com", "Core", "VP", ""],
+    ["round-2", "Di", "di@x.com", "Dyn", "CEO", VALID.replace("bet on", "your journey with")],
+]
+
+
+class TestReadColumns:
+    """Tests for the single ranged read."""
+
+    def test_one_batch_get_for_all_columns(self):
+        worksheet = make_worksheet(ROWS)
+        rows = read_columns(worksheet, HEADERS, ["Name", "Personalized Insert", ISSUES_COLUMN])
+        assert worksheet.batch_get.call_count == 1
+        assert worksheet.batch_get.call_args[0][0] == ["B2:B", "F2:F"]
+        assert [r["Name"] for r in rows] == ["Ada", "Bob", "Cy", "Di"]
+        assert rows[2]["Personalized Insert"] == ""
+        assert rows[0][ISSUES_COLUMN] == ""
+
+
+class TestRevalidate:
+    """Tests for writing issues, reports and the regeneration queue."""
+
+    def test_issue_column_written_in_one_update(self):
+        worksheet = make_worksheet(ROWS)
+        assert run(worksheet, "--write-issues") == 0
+
+        worksheet.update_cell.assert_called_once_with(1, 7, ISSUES_COLUMN)
+        assert worksheet.batch_update.call_count == 1
+        update = worksheet.batch_update.call_args[0][0][0]
+        assert update["range"] == "G2:G5"
+        assert update["values"] == [
+            [""],
+            ["too_short,banned_phrase,em_dash"],
+            [""],
+            ["banned_phrase"],
+        ]
+
+    def test_campaign_filter_keeps_other_codes(self):
+        headers = HEADERS + [ISSUES_COLUMN]
+        rows = [row + ["old_code"] for row in ROWS]
+        worksheet = make_worksheet(rows, headers)
+        run(worksheet, "--write-issues", "--campaign", "round-2")
+
+        assert not worksheet.update_cell.called
+        values = worksheet.batch_update.call_args[0][0][0]["values"]
+        assert values == [["old_code"], ["old_code"], [""], ["banned_phrase"]]
+
+    def test_report_and_queue(self, tmp_path):
+        report = tmp_path / "issues.csv"
+        queue = tmp_path / "regenerate.csv"
+        run(make_worksheet(ROWS), "--report", str(report), "--queue", str(queue))
+
+        with open(report) as f:
+            report_rows = list(csv.DictReader(f))
+        assert [(r["Row"], r["Name"], r["Issues"]) for r in report_rows] == [
+            ("3", "Bob", "too_short,banned_phrase,em_dash"),
+            ("5", "Di", "banned_phrase"),
+        ]
+        with open(queue) as f:
+            queue_rows = list(csv.DictReader(f))
+        assert queue_rows[0] == {
+            "Name": "Bob", "Company": "Beta", "Email": "bob@x.com", "Title": "CTO", "Email Confidence": "",
+        }
+
+    def test_summary_only_writes_nothing(self, capsys):
+        worksheet = make_worksheet(ROWS)
+        run(worksheet)
+        assert not worksheet.batch_update.called
+        out = capsys.readouterr().out
+        assert "Checked:   3 inserts" in out
+        assert "Failing:   2" in out
+
+    def test_missing_insert_column(self):
+        assert run(make_worksheet([], ["Name"])) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,133 @@
+"""Tests for sheet_writer.py - batched Google Sheet appends."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from gspread.exceptions import APIError
+from sheet_writer import (
+    RETRY_BACKOFF,
+    BackgroundSheetWriter,
+    SheetAppender,
+    append_with_retry,
+    load_synced,
+    synced_path,
+)
+
+HEADERS = ["Campaign", "Name", "Email", "Personalized Insert"]
+
+
+def api_error(code):
+    response = MagicMock()
+    response.json.return_value = {"error": {"code": code, "message": "error", "status": "X"}}
+    return APIError(response)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSheetAppender:
+    """Tests for buffering and flushing rows."""
+
+    def test_rows_mapped_to_header_order(self):
+        worksheet = MagicMock()
+        appender = SheetAppender(worksheet, HEADERS, batch_rows=1)
+        appender.add({"Email": "a@x.com", "Name": "A", "Extra": "ignored"})
+        rows = worksheet.append_rows.call_args[0][0]
+        assert rows == [["", "A", "a@x.com", ""]]
+
+    def test_flushes_every_batch_rows(self):
+        worksheet = MagicMock()
+        appender = SheetAppender(worksheet, HEADERS, batch_rows=3, flush_seconds=999)
+        for i in range(7):
+            appender.add({"Name": f"P{i}"})
+        assert worksheet.append_rows.call_count == 2
+        appender.close()
+        assert worksheet.append_rows.call_count == 3
+        assert appender.rows_written == 7
+
+    def test_flushes_when_oldest_row_due(self):
+        worksheet = MagicMock()
+        clock = FakeClock()
+        appender = SheetAppender(worksheet, HEADERS, batch_rows=100, flush_seconds=10, clock=clock)
+        appender.add({"Name": "A"})
+        clock.now = 5
+        appender.add({"Name": "B"})
+        assert not worksheet.append_rows.called
+        clock.now = 11
+        appender.add({"Name": "C"})
+        assert len(worksheet.append_rows.call_args[0][0]) == 3
+
+    def test_close_without_rows_makes_no_call(self):
+        worksheet = MagicMock()
+        SheetAppender(worksheet, HEADERS).close()
+        assert not worksheet.append_rows.called
+
+
+class TestAppendRetry:
+    """Tests for quota error handling."""
+
+    def test_quota_error_retried(self):
+        worksheet = MagicMock()
+        worksheet.append_rows.side_effect = [api_error(429), api_error(503), None]
+        sleep = MagicMock()
+        append_with_retry(worksheet, [["A"]], sleep)
+        assert worksheet.append_rows.call_count == 3
+        assert [c.args[0] for c in sleep.call_args_list] == RETRY_BACKOFF[:2]
+
+    def test_non_retryable_error_raised(self):
+        worksheet = MagicMock()
+        worksheet.append_rows.side_effect = api_error(403)
+        with pytest.raises(APIError):
+            append_with_retry(worksheet, [["A"]], MagicMock())
+        assert worksheet.append_rows.call_count == 1
+
+    def test_gives_up_after_last_backoff(self):
+        worksheet = MagicMock()
+        worksheet.append_rows.side_effect = api_error(429)
+        with pytest.raises(APIError):
+            append_with_retry(worksheet, [["A"]], MagicMock())
+        assert worksheet.append_rows.call_count == len(RETRY_BACKOFF) + 1
+
+
+class TestBackgroundSheetWriter:
+    """Tests for uploads on the background thread and the sync journal."""
+
+    def test_close_drains_queue_and_records_synced(self, tmp_path):
+        worksheet = MagicMock()
+        journal = synced_path(str(tmp_path / "out.csv"))
+        appender = SheetAppender(worksheet, HEADERS, batch_rows=2, flush_seconds=999)
+        writer = BackgroundSheetWriter(appender, journal, synced=10)
+        for i in range(5):
+            writer.put({"Name": f"P{i}"})
+        writer.close()
+
+        names = [row[1] for call in worksheet.append_rows.call_args_list for row in call[0][0]]
+        assert names == [f"P{i}" for i in range(5)]
+        assert writer.synced == 15
+        assert load_synced(journal, default=0) == 15
+
+    def test_failed_upload_stops_and_keeps_journal(self, tmp_path):
+        worksheet = MagicMock()
+        worksheet.append_rows.side_effect = [None, api_error(403)]
+        journal = synced_path(str(tmp_path / "out.csv"))
+        appender = SheetAppender(worksheet, HEADERS, batch_rows=1)
+        writer = BackgroundSheetWriter(appender, journal)
+        for i in range(4):
+            writer.put({"Name": f"P{i}"})
+        writer.close()
+
+        assert isinstance(writer.error, APIError)
+        assert worksheet.append_rows.call_count == 2
+        assert load_synced(journal, default=0) == 1
+
+    def test_missing_journal_uses_default(self, tmp_path):
+        assert load_synced(str(tmp_path / "none.synced"), default=7) == 7
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
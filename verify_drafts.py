@@ -9,6 +9,7 @@ import re
 import time
 from datetime import datetime, timedelta
 from email_drafter import load_config, get_google_sheet
+from insert_validator import validate_insert
 
 # MCP Playwright will be called via Claude's tool system
 
@@ -19,12 +20,6 @@ ROUND2_SUBJECTS = [
 
 INSERT_PATTERN = r"curious about the world\.\s+(.*?)\s+I understand"
 
-BANNED_PATTERNS = [
-    "i came across", "i noticed", "your remarkable",
-    "your impressive", "i would be honored", "resonates with me",
-    "aligns with my interests"
-]
-
 
 def extract_insert_from_body(body_text: str) -> str:
     """Extract personalized insert using regex."""
@@ -35,27 +30,6 @@ def extract_insert_from_body(body_text: str) -> str:
     return None
 
 
-def validate_insert_quality(insert: str) -> tuple:
-    """Check quality rules: word count, banned phrases, punctuation."""
-    errors = []
-
-    word_count = len(insert.split())
-    if word_count < 15:
-        errors.append(f"Too short: {word_count} words (need 15-25)")
-    elif word_count > 25:
-        errors.append(f"Too long: {word_count} words (need 15-25)")
-
-    for banned in BANNED_PATTERNS:
-        if banned in insert.lower():
-            errors.append(f"Banned phrase: '{banned}'")
-
-    if not insert.strip().endswith(('.', '!', '?')):
-        errors.append("No punctuation")
-
-    is_valid = len(errors) == 0
-    return is_valid, errors
-
-
 def find_contact_in_sheet(worksheet, email: str):
     """Look up contact by email in Google Sheet."""
     records = worksheet.get_all_records()
@@ -74,8 +48,8 @@ def present_for_verification(draft, contact_row):
     print(f'  "{draft["insert"]}"')
     print(f"  Word count: {len(draft['insert'].split())}")
 
-    # Check quality
-    is_valid, errors = validate_insert_quality(draft["insert"])
+    # Check quality (same rules insert_generator.py enforces)
+    is_valid, errors = validate_insert(draft["insert"])
     if not is_valid:
         print(f"\n⚠️  Quality issues:")
         for error in errors: